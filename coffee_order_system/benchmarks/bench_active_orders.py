@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+
+LIVE_ORDERS = 12
+
+
+def build_service(historical: int) -> OrderService:
+    service = OrderService(observers=[])
+    for _ in range(historical):
+        order = service.create_order()
+        service.change_order_status(order.order_id, OrderStatus.PAID)
+    for _ in range(LIVE_ORDERS):
+        service.create_order()
+    return service
+
+
+def measure(service: OrderService, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        service.list_active_orders()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Задержка list_active_orders при росте истории заказов")
+    parser.add_argument("--max-power", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=10000)
+    args = parser.parse_args()
+    for power in range(3, args.max_power + 1):
+        historical = 10 ** power
+        service = build_service(historical)
+        latency = measure(service, args.repeat)
+        print(f"история={historical:>8}  активных={LIVE_ORDERS}  list_active_orders={latency * 1e6:.2f} мкс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+from core.models.order import OrderStatus
+from core.patterns.observer.observers import Logger
+from core.services.order_service import OrderService
+
+
+def paid_orders_footprint(count: int, archive_after: float | None) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    service = OrderService(observers=[Logger(lambda message: None)], archive_after=archive_after)
+    for index in range(count):
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, "Латте", ["Ванильный сироп"], quantity=1 + index % 3)
+        service.add_menu_item(order_id, "Круассан")
+        service.change_order_status(order_id, OrderStatus.PAID)
+    service.archive_paid_orders()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Память на оплаченный заказ: живой объект против архивной записи")
+    parser.add_argument("--orders", type=int, default=50000)
+    args = parser.parse_args()
+    live = paid_orders_footprint(args.orders, None)
+    archived = paid_orders_footprint(args.orders, 0)
+    print(f"заказов={args.orders}")
+    print(f"живой Order:      {live:8.1f} байт/заказ")
+    print(f"архивная запись:  {archived:8.1f} байт/заказ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from core.models.order import OrderStatus
+from core.patterns.observer import AsyncDispatcher, CustomerNotifier, KitchenDisplay, Logger
+from core.services.order_service import OrderService
+
+
+def slow_sink(message: str) -> None:
+    time.sleep(0.0002)
+
+
+def click_latency(service: OrderService, orders: int) -> float:
+    start = time.perf_counter()
+    for _ in range(orders):
+        order_id = service.create_order().order_id
+        service.change_order_status(order_id, OrderStatus.PREPARING)
+        service.change_order_status(order_id, OrderStatus.PAID)
+    return (time.perf_counter() - start) / (orders * 3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Задержка клика при медленном наблюдателе: синхронно и асинхронно")
+    parser.add_argument("--orders", type=int, default=300)
+    args = parser.parse_args()
+    observers = [KitchenDisplay(slow_sink), CustomerNotifier(slow_sink), Logger(slow_sink)]
+    sync = click_latency(OrderService(observers=observers), args.orders)
+    print(f"синхронно:   {sync * 1e6:8.1f} мкс/клик")
+    for mode in ("block", "drop_oldest", "coalesce"):
+        dispatcher = AsyncDispatcher(maxsize=4096, backpressure=mode)
+        service = OrderService(observers=observers, dispatcher=dispatcher)
+        latency = click_latency(service, args.orders)
+        start = time.perf_counter()
+        dispatcher.shutdown()
+        drain = time.perf_counter() - start
+        print(f"{mode:<12} {latency * 1e6:8.1f} мкс/клик  дослать очередь={drain * 1e3:7.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+
+OPS_PER_ORDER = 6
+
+
+def terminal(service: OrderService, orders: int, barrier: threading.Barrier) -> None:
+    barrier.wait()
+    for step in range(orders):
+        order = service.create_order()
+        service.add_menu_item(order.order_id, "Латте", ["Ванильный сироп"])
+        service.add_menu_item(order.order_id, "Латте", ["Ванильный сироп"])
+        service.add_menu_item(order.order_id, "Чизкейк")
+        service.set_discount(order.order_id, 10.0, "постоянный")
+        service.change_order_status(order.order_id, OrderStatus.PAID if step % 2 else OrderStatus.PREPARING)
+
+
+def measure(threads: int, orders: int) -> float:
+    service = OrderService(observers=[], archive_after=60.0)
+    barrier = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=terminal, args=(service, orders, barrier)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return threads * orders * OPS_PER_ORDER / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Пропускная способность OrderService при нескольких терминалах-потоках")
+    parser.add_argument("--orders", type=int, default=5000, help="заказов на терминал")
+    parser.add_argument("--max-threads", type=int, default=8)
+    args = parser.parse_args()
+    threads = 1
+    while threads <= args.max_threads:
+        throughput = measure(threads, args.orders)
+        print(f"терминалов={threads:>2}  операций/с={throughput:>10.0f}")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
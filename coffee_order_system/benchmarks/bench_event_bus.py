@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from core.models.order import EVENT_STATUS_CHANGED
+from core.patterns.observer.observers import CustomerNotifier, KitchenDisplay, Logger
+from core.services.order_service import OrderService
+
+
+def _discard(message: str) -> None:
+    pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Стоимость доставки события при разном числе заказов")
+    parser.add_argument("--repeat", type=int, default=100000)
+    args = parser.parse_args()
+    for orders in (10 ** 3, 10 ** 4, 10 ** 5):
+        service = OrderService(observers=[KitchenDisplay(_discard), CustomerNotifier(_discard), Logger(_discard)])
+        for _ in range(orders):
+            order = service.create_order()
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            order.notify(EVENT_STATUS_CHANGED)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        print(f"заказов={orders:>7}  доставка события={elapsed * 1e6:6.2f} мкс")
+
+
+if __name__ == "__main__":
+    main()
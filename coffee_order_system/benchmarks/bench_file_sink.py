@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from core.models.order import OrderStatus
+from core.patterns.observer import Logger, RotatingFileSink
+from core.services.order_service import OrderService
+
+
+def per_event(sink, events: int) -> float:
+    message = "[ЛОГ] Статус заказа №12345 изменен на готовится."
+    start = time.perf_counter()
+    for _ in range(events):
+        sink(message)
+    return (time.perf_counter() - start) / events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Стоимость записи события в буферизованный файловый приемник")
+    parser.add_argument("--events", type=int, default=200000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "direct.log"), "w", encoding="utf-8", buffering=1) as handle:
+            direct = per_event(lambda message: handle.write(message + "\n"), args.events)
+        sink = RotatingFileSink(os.path.join(directory, "orders.log"), max_bytes=4 * 1024 * 1024, compress=True)
+        buffered = per_event(sink, args.events)
+        service = OrderService(observers=[Logger(sink)])
+        start = time.perf_counter()
+        for _ in range(args.events // 4):
+            order_id = service.create_order().order_id
+            service.change_order_status(order_id, OrderStatus.PAID)
+        pipeline = (time.perf_counter() - start) / (args.events // 2)
+        sink.close()
+        segments = len(os.listdir(directory)) - 2
+    print(f"построчная запись в файл: {direct * 1e6:6.2f} мкс/событие")
+    print(f"RotatingFileSink:         {buffered * 1e6:6.2f} мкс/событие")
+    print(f"Logger + приемник:        {pipeline * 1e6:6.2f} мкс/событие  сегментов={segments}")
+
+
+if __name__ == "__main__":
+    main()
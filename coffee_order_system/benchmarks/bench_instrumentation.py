@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from core.metrics import Instrumentation, render
+from core.models.order import OrderStatus
+from core.patterns.observer.observers import CustomerNotifier, KitchenDisplay, Logger
+from core.services.order_service import OrderService
+
+
+def _discard(message: str) -> None:
+    pass
+
+
+def run(service: OrderService, orders: int) -> float:
+    start = time.perf_counter()
+    for _ in range(orders):
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, "Латте", ["Ванильный сироп"])
+        service.calculate_total(order_id)
+        service.change_order_status(order_id, OrderStatus.PREPARING)
+        service.change_order_status(order_id, OrderStatus.PAID)
+    return (time.perf_counter() - start) / orders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Накладные расходы инструментирования OrderService")
+    parser.add_argument("--orders", type=int, default=20000)
+    parser.add_argument("--show-metrics", action="store_true", help="вывести метрики в формате Prometheus")
+    args = parser.parse_args()
+    instrumentation = Instrumentation()
+    cases = (("выключено", False, False), ("включено", True, False), ("выключено после включения", True, True))
+    for label, enable, disable in cases:
+        service = OrderService(observers=[KitchenDisplay(_discard), CustomerNotifier(_discard), Logger(_discard)])
+        if enable:
+            service.set_instrumentation(instrumentation)
+        if disable:
+            service.set_instrumentation(None)
+        elapsed = run(service, args.orders)
+        print(f"{label:<26} заказ целиком={elapsed * 1e6:7.2f} мкс")
+    snapshot = instrumentation.snapshot()
+    for name, histogram in sorted(snapshot.methods.items()):
+        print(
+            f"  {name:<36} вызовов={histogram.count:>6}  p50={histogram.percentile(0.5) / 1000:6.2f} мкс"
+            f"  p99={histogram.percentile(0.99) / 1000:6.2f} мкс"
+        )
+    for name, histogram in sorted(snapshot.observers.items()):
+        print(f"  наблюдатель {name:<24} доставок={histogram.count:>6}  среднее={histogram.mean_ns / 1000:6.2f} мкс")
+    if args.show_metrics:
+        print(render(snapshot), end="")
+
+
+if __name__ == "__main__":
+    main()
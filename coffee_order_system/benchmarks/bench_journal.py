@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+from core.storage import JournalOrderRepository
+
+
+def write_history(directory: str, orders: int, snapshot_every: int, archive_after: float | None) -> tuple[float, float]:
+    repository = JournalOrderRepository(directory, snapshot_every=snapshot_every)
+    service = OrderService(observers=[], repository=repository, archive_after=archive_after)
+    slowest = 0.0
+    start = time.perf_counter()
+    for index in range(orders):
+        began = time.perf_counter()
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, "Латте", ["Карамельный сироп"])
+        if index % 3 == 0:
+            service.add_menu_item(order_id, "Круассан")
+        service.change_order_status(order_id, OrderStatus.READY)
+        service.change_order_status(order_id, OrderStatus.PAID)
+        slowest = max(slowest, time.perf_counter() - began)
+    elapsed = time.perf_counter() - start
+    repository.close()
+    return elapsed, slowest
+
+
+def restart(directory: str, snapshot_every: int, archive_after: float | None) -> tuple[float, int]:
+    start = time.perf_counter()
+    repository = JournalOrderRepository(directory, snapshot_every=snapshot_every)
+    OrderService(observers=[], repository=repository, archive_after=archive_after)
+    elapsed = time.perf_counter() - start
+    replayed = repository.replayed_records
+    repository.close()
+    return elapsed, replayed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Время перезапуска из журнала со снимками и без")
+    parser.add_argument("--orders", type=int, default=10000, help="примерно неделя заказов")
+    parser.add_argument("--archive-after", type=float, default=0.0, help="окно хранения оплаченных заказов, с")
+    args = parser.parse_args()
+    for snapshot_every, archive_after in ((10 ** 9, None), (20000, None), (2000, None), (2000, args.archive_after)):
+        with tempfile.TemporaryDirectory() as directory:
+            writing, slowest = write_history(directory, args.orders, snapshot_every, archive_after)
+            elapsed, replayed = restart(directory, snapshot_every, archive_after)
+        label = "без снимков" if snapshot_every >= 10 ** 9 else f"снимок каждые {snapshot_every}"
+        if archive_after is not None:
+            label += " + архив"
+        print(
+            f"{label:<30} запись={writing / args.orders * 1e6:6.1f} мкс/заказ  "
+            f"худший заказ={slowest * 1e3:6.1f} мс  "
+            f"перезапуск={elapsed * 1e3:7.1f} мс  воспроизведено записей={replayed}"
+        )
+
+
+if __name__ == "__main__":
+    main()
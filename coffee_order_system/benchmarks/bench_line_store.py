@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from core.analytics import BY_HOUR, BY_PRODUCT, GROSS_REVENUE, PAID_AT, QUANTITY, OrderLineStore
+from core.analytics.line_store import np
+from core.models.order import Order, OrderStatus
+from core.services.order_service import OrderService
+
+PRODUCTS = ("Латте", "Капучино", "Эспрессо", "Чизкейк", "Круассан")
+ADD_ONS = ((), ("Ванильный сироп",), ("Шот эспрессо", "Миндальное молоко"))
+
+
+def build(service: OrderService, lines: int) -> None:
+    for index in range(lines // 2):
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, PRODUCTS[index % 3], list(ADD_ONS[index % 3]), quantity=1 + index % 2)
+        service.add_menu_item(order_id, PRODUCTS[3 + index % 2])
+        if index % 4:
+            service.change_order_status(order_id, OrderStatus.PAID)
+
+
+def scan_orders(service: OrderService) -> Dict[str, int]:
+    revenue: Dict[str, int] = {}
+    orders: List[Order] = service.list_orders_by_status(OrderStatus.PAID)
+    for order in orders:
+        for item in order.items:
+            name = item.product.get_name()
+            revenue[name] = revenue.get(name, 0) + item.get_price()
+    return revenue
+
+
+def timed(function: Callable[[], object], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Аналитические запросы по столбцовому хранилищу строк заказов")
+    parser.add_argument("--lines", type=int, default=10 ** 6)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    started = time.perf_counter()
+    service = OrderService(observers=[])
+    store = OrderLineStore()
+    service.subscribe(store)
+    build(service, args.lines)
+    print(f"строк={len(store)}  построение={time.perf_counter() - started:.1f} с  numpy={'да' if np is not None else 'нет'}")
+    paid = [OrderStatus.PAID]
+    expected = scan_orders(service)
+    for use_numpy in ((False, True) if np is not None else (False,)):
+        store.use_numpy = use_numpy
+        if store.group_by(BY_PRODUCT, GROSS_REVENUE, paid) != expected:
+            raise SystemExit("Результаты хранилища расходятся с обходом заказов.")
+    print(f"обход заказов, валовая выручка по товарам: {timed(lambda: scan_orders(service), args.repeats):9.1f} мс")
+    for use_numpy in ((False, True) if np is not None else (False,)):
+        store.use_numpy = use_numpy
+        label = "numpy " if use_numpy else "python"
+        queries = (
+            ("валовая выручка по товарам", lambda: store.group_by(BY_PRODUCT, GROSS_REVENUE, paid)),
+            ("штуки по часам", lambda: store.group_by(BY_HOUR, QUANTITY, paid, timestamp=PAID_AT)),
+            ("добавки на латте", lambda: store.mean_add_ons("Латте", paid)),
+        )
+        for name, query in queries:
+            print(f"хранилище {label}, {name}: {timed(query, args.repeats):9.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
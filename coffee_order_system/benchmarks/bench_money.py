@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Callable, List, Tuple
+
+from core.models.money import apply_discount, percent_to_basis_points
+
+Line = Tuple[int, int]
+
+
+Orders = List[Tuple[List[Line], float, int]]
+
+
+def _orders(count: int) -> Orders:
+    rng = random.Random(1)
+    prices = [250, 350, 400, 450, 300, 50, 70, 100, 60]
+    orders = []
+    for _ in range(count):
+        percent = rng.choice([0, 10, 12.5, 20])
+        lines = [(rng.choice(prices), rng.randint(1, 3)) for _ in range(rng.randint(1, 4))]
+        orders.append((lines, percent, percent_to_basis_points(percent)))
+    return orders
+
+
+def cents_total(orders: Orders) -> int:
+    revenue = 0
+    for lines, _, basis_points in orders:
+        subtotal = sum(price * quantity for price, quantity in lines)
+        revenue += apply_discount(subtotal, basis_points)
+    return revenue
+
+
+def float_total(orders: Orders) -> float:
+    revenue = 0.0
+    for lines, percent, _ in orders:
+        subtotal = sum(price / 100 * quantity for price, quantity in lines)
+        revenue += subtotal * (1 - percent / 100)
+    return revenue
+
+
+def decimal_total(orders: Orders) -> Decimal:
+    cent = Decimal("0.01")
+    revenue = Decimal(0)
+    for lines, percent, _ in orders:
+        subtotal = sum((Decimal(price) / 100 * quantity for price, quantity in lines), Decimal(0))
+        discount = (subtotal * Decimal(str(percent)) / 100).quantize(cent, rounding=ROUND_HALF_UP)
+        revenue += subtotal - discount
+    return revenue
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Суммирование заказов: целые копейки против float и Decimal")
+    parser.add_argument("--orders", type=int, default=200000)
+    args = parser.parse_args()
+    orders = _orders(args.orders)
+    cases: List[Tuple[str, Callable[[Orders], object]]] = [
+        ("копейки (int)", cents_total),
+        ("float", float_total),
+        ("Decimal", decimal_total),
+    ]
+    for label, function in cases:
+        start = time.perf_counter()
+        result = function(orders)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<14} {elapsed / args.orders * 1e9:8.1f} нс/заказ  итог={result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from core.models.order import EVENT_STATUS_CHANGED, Order, OrderStatus
+from core.patterns.observer import WARNING, Logger
+
+
+class DiscardingSink:
+    accepts_messages = True
+
+    def __call__(self, message: object) -> None:
+        pass
+
+
+def per_event(observer: Logger, order: Order, events: int) -> float:
+    start = time.perf_counter()
+    for _ in range(events):
+        observer.update(order, EVENT_STATUS_CHANGED)
+    return (time.perf_counter() - start) / events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Стоимость события наблюдателя: форматирование, ленивые шаблоны, фильтр")
+    parser.add_argument("--events", type=int, default=300000)
+    args = parser.parse_args()
+    order = Order(12345)
+    order.set_status(OrderStatus.PREPARING)
+    cases = [
+        ("строка для каждого события", Logger(lambda message: None)),
+        ("ленивое сообщение", Logger(DiscardingSink())),
+        ("отфильтровано по уровню", Logger(lambda message: None, level=WARNING)),
+    ]
+    for name, observer in cases:
+        print(f"{name:<28} {per_event(observer, order, args.events) * 1e9:7.0f} нс/событие")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from core.services.order_service import OrderService
+
+
+def fill_order(units: int, distinct: int) -> tuple[float, int, float]:
+    service = OrderService(observers=[])
+    order_id = service.create_order().order_id
+    products = ["Эспрессо", "Капучино", "Латте"]
+    tracemalloc.start()
+    start = time.perf_counter()
+    for unit in range(units):
+        product = products[unit % distinct % len(products)]
+        add_ons = ["Шот эспрессо"] if unit % distinct >= len(products) else []
+        service.add_menu_item(order_id, product, add_ons)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    render_start = time.perf_counter()
+    service.list_order_items(order_id)
+    render = time.perf_counter() - render_start
+    return elapsed, peak, render
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Память и отрисовка заказа с повторяющимися позициями")
+    parser.add_argument("--distinct", type=int, default=6)
+    args = parser.parse_args()
+    for units in (10, 200, 2000, 20000):
+        elapsed, peak, render = fill_order(units, args.distinct)
+        print(
+            f"единиц={units:>6}  добавление={elapsed * 1e3:8.2f} мс  "
+            f"пик памяти={peak / 1024:8.1f} КиБ  list_order_items={render * 1e6:7.1f} мкс"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+
+
+def build(service: OrderService, count: int) -> None:
+    for index in range(count):
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, "Латте", ["Ванильный сироп", "Шот эспрессо"], quantity=1 + index % 3)
+        service.add_menu_item(order_id, "Чизкейк")
+        if index % 2:
+            service.change_order_status(order_id, OrderStatus.PREPARING)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Память на живой заказ при миллионе заказов")
+    parser.add_argument("--orders", type=int, default=10 ** 6)
+    args = parser.parse_args()
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    service = OrderService(observers=[])
+    build(service, args.orders)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    order = service.get_order(args.orders)
+    item = order.items[0]
+    print(f"заказов={args.orders}  построение={time.perf_counter() - started:.1f} с")
+    print(f"всего:      {(after - before) / args.orders:8.1f} байт/заказ")
+    print(f"Order:      {sys.getsizeof(order):8d} байт, __dict__: {'нет' if not hasattr(order, '__dict__') else 'есть'}")
+    print(f"OrderItem:  {sys.getsizeof(item):8d} байт, __dict__: {'нет' if not hasattr(item, '__dict__') else 'есть'}")
+
+
+if __name__ == "__main__":
+    main()
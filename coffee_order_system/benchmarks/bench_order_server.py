@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from core.models.order import OrderStatus
+from server.client import OrderClient
+
+
+async def terminal(path: str, deadline: float, depth: int, counter: list[int]) -> None:
+    client = await OrderClient.connect(path=path)
+    try:
+        while time.perf_counter() < deadline:
+            order = await client.create_order()
+            order_id = order["order_id"]
+            await asyncio.gather(*(client.add_menu_item(order_id, "Латте", ["Ванильный сироп"]) for _ in range(depth)))
+            await client.change_order_status(order_id, OrderStatus.PAID)
+            counter[0] += depth + 2
+    finally:
+        await client.close()
+
+
+async def run_load(path: str, connections: int, seconds: float, depth: int) -> float:
+    counter = [0]
+    start = time.perf_counter()
+    deadline = start + seconds
+    await asyncio.gather(*(terminal(path, deadline, depth, counter) for _ in range(connections)))
+    return counter[0] / (time.perf_counter() - start)
+
+
+def wait_for_socket(path: str, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if time.monotonic() > deadline:
+            raise TimeoutError("Сервер заказов не запустился.")
+        time.sleep(0.05)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Нагрузочный тест сервера заказов: операций в секунду")
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--depth", type=int, default=16, help="запросов в конвейере на соединение")
+    parser.add_argument("--unix", help="подключиться к уже запущенному серверу по Unix-сокету")
+    args = parser.parse_args()
+    server = None
+    path = args.unix
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "orders.sock")
+        server = subprocess.Popen([sys.executable, "-m", "server.order_server", "--unix", path], stdout=subprocess.DEVNULL)
+    try:
+        wait_for_socket(path)
+        throughput = asyncio.run(run_load(path, args.connections, args.seconds, args.depth))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    print(f"соединений={args.connections}  конвейер={args.depth}  операций/с={throughput:.0f}")
+
+
+if __name__ == "__main__":
+    main()
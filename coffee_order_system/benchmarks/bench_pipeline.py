@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from array import array
+from collections import deque
+from typing import Callable, Dict, List
+
+from core.models.order import OrderStatus
+from core.patterns.observer.observers import CustomerNotifier, KitchenDisplay, Logger
+from core.services.order_service import OrderService
+
+OPERATIONS = ("create_order", "add_menu_item", "calculate_total", "change_order_status", "list_active_orders")
+LIVE_ORDERS = 50
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "pipeline.json")
+
+
+def _discard(message: object) -> None:
+    pass
+
+
+def build_service(observers: bool) -> OrderService:
+    if not observers:
+        return OrderService(observers=[])
+    return OrderService(observers=[KitchenDisplay(_discard), CustomerNotifier(_discard), Logger(_discard)])
+
+
+def run_case(orders: int, observers: bool) -> Dict[str, object]:
+    repeats = max(1, min(5, 10 ** 5 // orders))
+    runs = [_run_once(orders, observers) for _ in range(repeats)]
+    return {
+        "orders": orders,
+        "observers": observers,
+        "ops_per_sec": max(run["ops_per_sec"] for run in runs),
+        "p50_us": {name: min(run["p50_us"][name] for run in runs) for name in OPERATIONS},
+        "p99_us": {name: min(run["p99_us"][name] for run in runs) for name in OPERATIONS},
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def _run_once(orders: int, observers: bool) -> Dict[str, object]:
+    service = build_service(observers)
+    samples: Dict[str, array] = {name: array("q") for name in OPERATIONS}
+    clock = time.perf_counter_ns
+
+    def timed(name: str, call: Callable[[], object]) -> object:
+        start = clock()
+        result = call()
+        samples[name].append(clock() - start)
+        return result
+
+    live: deque = deque()
+    started = time.perf_counter()
+    for _ in range(orders):
+        order = timed("create_order", service.create_order)
+        order_id = order.order_id
+        timed("add_menu_item", lambda: service.add_menu_item(order_id, "Латте", ["Ванильный сироп", "Шот эспрессо"]))
+        timed("add_menu_item", lambda: service.add_menu_item(order_id, "Чизкейк"))
+        timed("calculate_total", lambda: service.calculate_total(order_id))
+        timed("change_order_status", lambda: service.change_order_status(order_id, OrderStatus.PREPARING))
+        live.append(order_id)
+        if len(live) > LIVE_ORDERS:
+            paid_id = live.popleft()
+            timed("change_order_status", lambda: service.change_order_status(paid_id, OrderStatus.PAID))
+        timed("list_active_orders", service.list_active_orders)
+    elapsed = time.perf_counter() - started
+    total_ops = sum(len(values) for values in samples.values())
+    return {
+        "ops_per_sec": total_ops / elapsed,
+        "p50_us": {name: _percentile(values, 0.50) / 1000 for name, values in samples.items()},
+        "p99_us": {name: _percentile(values, 0.99) / 1000 for name, values in samples.items()},
+    }
+
+
+def _percentile(values: array, fraction: float) -> float:
+    ordered = sorted(values)
+    return float(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))])
+
+
+def case_key(orders: int, observers: bool) -> str:
+    return f"orders={orders},observers={'on' if observers else 'off'}"
+
+
+def run_isolated(orders: int, observers: bool) -> Dict[str, object]:
+    command = [sys.executable, "-m", "benchmarks.bench_pipeline", "--case", str(orders)]
+    if observers:
+        command.append("--observers")
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def compare(result: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[str]:
+    problems = []
+    if result["ops_per_sec"] < baseline["ops_per_sec"] * (1 - threshold):
+        problems.append(f"операций/с {result['ops_per_sec']:.0f} < {baseline['ops_per_sec']:.0f}")
+    for name, latency in result["p50_us"].items():
+        expected = baseline["p50_us"].get(name)
+        if expected is not None and latency > expected * (1 + threshold):
+            problems.append(f"p50 {name} {latency:.2f} мкс > {expected:.2f} мкс")
+    if result["peak_rss_kb"] > baseline["peak_rss_kb"] * (1 + threshold):
+        problems.append(f"пик памяти {result['peak_rss_kb']} КБ > {baseline['peak_rss_kb']} КБ")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Сквозной бенчмарк OrderService с сохраненной базовой линией")
+    parser.add_argument("--min-power", type=int, default=2)
+    parser.add_argument("--max-power", type=int, default=5, help="до 10^N заказов (6 для полного прогона)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.5, help="допустимая деградация, доля")
+    parser.add_argument("--case", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--observers", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.case is not None:
+        print(json.dumps(run_case(args.case, args.observers)))
+        return
+
+    baseline: Dict[str, Dict[str, object]] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    results: Dict[str, Dict[str, object]] = {}
+    regressions = 0
+    for power in range(args.min_power, args.max_power + 1):
+        for observers in (False, True):
+            key = case_key(10 ** power, observers)
+            if args.update_baseline:
+                runs = [run_isolated(10 ** power, observers) for _ in range(3)]
+                result = sorted(runs, key=lambda run: run["ops_per_sec"])[1]
+            else:
+                result = run_isolated(10 ** power, observers)
+            problems: List[str] = []
+            if key in baseline and not args.update_baseline:
+                problems = compare(result, baseline[key], args.threshold)
+                if problems:
+                    result = run_isolated(10 ** power, observers)
+                    problems = compare(result, baseline[key], args.threshold)
+            results[key] = result
+            p99 = max(result["p99_us"].values())
+            print(
+                f"{key:<28} операций/с={result['ops_per_sec']:>9.0f}  "
+                f"худший p99={p99:>8.1f} мкс  пик памяти={result['peak_rss_kb'] / 1024:>7.1f} МБ"
+            )
+            for problem in problems:
+                regressions += 1
+                print(f"  РЕГРЕССИЯ: {problem}")
+    if args.update_baseline:
+        baseline.update(results)
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, ensure_ascii=False, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Базовая линия обновлена: {args.baseline}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+
+
+def generate_load(
+    commands, service: OrderService, stop: threading.Event, orders: int, rate: float, seed: int
+) -> None:
+    rng = random.Random(seed)
+    products = [product.get_name() for product in service.list_beverages() + service.list_desserts()]
+    order_ids = [service.create_order().order_id for _ in range(orders)]
+    while not stop.is_set():
+        order_id = rng.choice(order_ids)
+        commands.add_menu_item(order_id, rng.choice(products))
+        if rng.random() < 0.05:
+            commands.set_discount(order_id, rng.choice((0.0, 10.0, 20.0)), "нагрузка")
+        if rng.random() < 0.01:
+            commands.change_order_status(order_id, OrderStatus.PREPARING)
+        time.sleep(1 / rate)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Отзывчивость PyQt6 интерфейса под фоновой нагрузкой на сервис")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--orders", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=2000.0, help="операций в секунду")
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+    try:
+        from PyQt6 import QtCore, QtWidgets
+
+        from gui_pyqt6.commands import ServiceCommands
+        from gui_pyqt6.main_window import MainWindow
+    except ImportError as exc:
+        print(f"Нужен PyQt6: {exc}")
+        sys.exit(1)
+
+    app = QtWidgets.QApplication(sys.argv)
+    service = OrderService(observers=[])
+    window = MainWindow(service)
+    window.show()
+    commands = ServiceCommands(service, max_threads=args.threads)
+    stop = threading.Event()
+    load = threading.Thread(target=generate_load, args=(commands, service, stop, args.orders, args.rate, 1), daemon=True)
+
+    intervals: list[float] = []
+    last = [time.perf_counter()]
+
+    def tick() -> None:
+        now = time.perf_counter()
+        intervals.append(now - last[0])
+        last[0] = now
+
+    timer = QtCore.QTimer()
+    timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+    timer.timeout.connect(tick)
+    timer.start(16)
+    QtCore.QTimer.singleShot(int(args.seconds * 1000), app.quit)
+    load.start()
+    app.exec()
+    stop.set()
+    load.join()
+    commands.wait()
+
+    intervals.sort()
+    frames = len(intervals)
+    p99 = intervals[int(frames * 0.99) - 1] if frames else 0.0
+    print(f"кадров={frames}  fps={frames / args.seconds:.1f}")
+    print(f"интервал кадра: медиана={intervals[frames // 2] * 1e3:.1f} мс  p99={p99 * 1e3:.1f} мс  макс={intervals[-1] * 1e3:.1f} мс")
+    print(f"активных заказов={len(service.list_active_orders())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+from core.storage import InMemoryOrderRepository, OrderRepository, SqliteOrderRepository
+
+
+def run_clicks(repository: OrderRepository | None, orders: int) -> list[float]:
+    service = OrderService(observers=[], repository=repository)
+    latencies = []
+    for _ in range(orders):
+        start = time.perf_counter()
+        order_id = service.create_order().order_id
+        latencies.append(time.perf_counter() - start)
+        for product in ("Латте", "Капучино", "Круассан"):
+            start = time.perf_counter()
+            service.add_menu_item(order_id, product)
+            latencies.append(time.perf_counter() - start)
+        for status in (OrderStatus.PREPARING, OrderStatus.PAID):
+            start = time.perf_counter()
+            service.change_order_status(order_id, status)
+            latencies.append(time.perf_counter() - start)
+    if repository is not None:
+        start = time.perf_counter()
+        repository.flush()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[int(len(ordered) * 0.99)]
+    print(
+        f"{name:<12} операций={len(latencies):>6}  среднее={statistics.fmean(latencies) * 1e6:7.1f} мкс  "
+        f"p50={p50 * 1e6:7.1f} мкс  p99={p99 * 1e6:7.1f} мкс  макс={ordered[-1] * 1e3:6.2f} мс"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Задержка клика: память против SQLite с групповой фиксацией")
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--commit-interval", type=float, default=0.005)
+    args = parser.parse_args()
+    report("без хранилища", run_clicks(None, args.orders))
+    report("в памяти", run_clicks(InMemoryOrderRepository(), args.orders))
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SqliteOrderRepository(os.path.join(directory, "orders.db"), args.commit_interval)
+        try:
+            report("sqlite", run_clicks(repository, args.orders))
+        finally:
+            repository.close()
+
+
+if __name__ == "__main__":
+    main()
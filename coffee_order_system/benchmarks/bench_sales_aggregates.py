@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+from typing import Dict
+
+from core.analytics import SalesAggregates
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+
+
+def build(service: OrderService, count: int) -> float:
+    elapsed = 0
+    for index in range(count):
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, "Латте", ["Ванильный сироп", "Шот эспрессо"], quantity=1 + index % 3)
+        service.add_menu_item(order_id, "Чизкейк")
+        if index % 5 == 0:
+            service.set_discount(order_id, 10, "студент")
+        started = time.perf_counter_ns()
+        service.change_order_status(order_id, OrderStatus.PAID)
+        elapsed += time.perf_counter_ns() - started
+    return elapsed / count
+
+
+def recompute(service: OrderService) -> Dict[str, int]:
+    revenue = 0
+    products: Dict[str, int] = {}
+    add_ons: Dict[str, int] = {}
+    discounts: Dict[str, int] = {}
+    hours: Dict[int, int] = {}
+    for order in service.list_orders_by_status(OrderStatus.PAID):
+        revenue += order.total
+        if order.total != order.subtotal:
+            discounts[order.discount_label] = discounts.get(order.discount_label, 0) + order.subtotal - order.total
+        hour = int(order.paid_at // 3600)
+        hours[hour] = hours.get(hour, 0) + 1
+        for item in order.items:
+            name = item.product.get_name()
+            products[name] = products.get(name, 0) + item.quantity
+            for add_on in item.configuration.add_on_names:
+                add_ons[add_on] = add_ons.get(add_on, 0) + item.quantity
+    return {"revenue": revenue, **products}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Отчет за смену: инкрементальные счетчики против пересчета")
+    parser.add_argument("--orders", type=int, default=100000)
+    parser.add_argument("--reports", type=int, default=1000)
+    args = parser.parse_args()
+    baseline_ns = build(OrderService(observers=[]), args.orders)
+    gc.collect()
+    service = OrderService(observers=[])
+    sales = SalesAggregates()
+    service.subscribe(sales)
+    payment_ns = build(service, args.orders)
+    expected = recompute(service)
+    if sales.revenue_cents != expected["revenue"] or sales.product_count("Латте") != expected["Латте"]:
+        raise SystemExit("Счетчики расходятся с пересчетом заказов.")
+    started = time.perf_counter()
+    recompute(service)
+    recompute_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter_ns()
+    for _ in range(args.reports):
+        sales.revenue_cents
+        sales.product_count("Латте")
+        sales.discount_total("студент")
+    lookup_ns = (time.perf_counter_ns() - started) / args.reports
+    started = time.perf_counter_ns()
+    for _ in range(args.reports):
+        sales.report()
+    report_ns = (time.perf_counter_ns() - started) / args.reports
+    print(f"заказов={args.orders}")
+    print(f"оплата без счетчиков: {baseline_ns / 1000:10.2f} мкс")
+    print(f"оплата со счетчиками: {payment_ns / 1000:10.2f} мкс")
+    print(f"пересчет отчета:      {recompute_ms:10.2f} мс")
+    print(f"три счетчика:         {lookup_ns / 1000:10.2f} мкс")
+    print(f"полный снимок:        {report_ns / 1000:10.2f} мкс")
+
+
+if __name__ == "__main__":
+    main()
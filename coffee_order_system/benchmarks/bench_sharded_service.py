@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from core.services.sharded_order_service import ShardedOrderService
+
+
+def measure(shards: int, orders: int, rounds: int, verify_totals: bool) -> float:
+    with ShardedOrderService(shards=shards, block_size=64, verify_totals=verify_totals) as service:
+        ids = [service.create_order().order_id for _ in range(orders)]
+        add_calls = [(order_id, "add_menu_item", ("Латте", ["Ванильный сироп"])) for order_id in ids]
+        total_calls = [(order_id, "calculate_total", ()) for order_id in ids]
+        start = time.perf_counter()
+        for _ in range(rounds):
+            service.call_many(add_calls)
+            service.call_many(total_calls)
+        elapsed = time.perf_counter() - start
+    return 2 * orders * rounds / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Масштабирование шардированного OrderService по процессам")
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--verify-totals", action="store_true", help="пересчитывать сумму при каждом чтении")
+    args = parser.parse_args()
+    print(f"ядер={os.cpu_count()}")
+    shards = 1
+    while shards <= args.max_shards:
+        throughput = measure(shards, args.orders, args.rounds, args.verify_totals)
+        print(f"шардов={shards:>2}  операций/с={throughput:>10.0f}")
+        shards *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import time
+import tkinter as tk
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+from gui.main_window import MainWindow
+from gui.refresh_scheduler import ACTIVE_ORDERS, DETAILS, ORDER, TOTAL
+
+
+def fill_order(service: OrderService, order_id: int, units: int) -> None:
+    add_ons = [add_on.get_name() for add_on in service.list_add_ons()]
+    combos = [
+        (beverage.get_name(), list(extras))
+        for beverage in service.list_beverages()
+        for size in range(len(add_ons) + 1)
+        for extras in itertools.combinations(add_ons, size)
+    ]
+    for unit in range(units):
+        product, extras = combos[unit % len(combos)]
+        service.add_menu_item(order_id, product, extras)
+
+
+def legacy_frame(window: MainWindow) -> None:
+    window._refresh_order()
+    window._refresh_details()
+    window._update_total()
+    window._refresh_order()
+    window._refresh_details()
+    window._update_total()
+    window._refresh_details()
+    window._refresh_active_orders()
+    window._refresh_order()
+    window._refresh_details()
+
+
+def coalesced_frame(window: MainWindow) -> None:
+    window._refresh.invalidate(ORDER, DETAILS, TOTAL)
+    window._refresh.invalidate(ORDER, DETAILS, TOTAL)
+    window._refresh.invalidate(ACTIVE_ORDERS, ORDER, DETAILS)
+    window.update_idletasks()
+
+
+def measure(window: MainWindow, frame, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        frame(window)
+        window.update_idletasks()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Время кадра Tk для большого заказа: прямые перерисовки и планировщик")
+    parser.add_argument("--units", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    service = OrderService(observers=[])
+    try:
+        window = MainWindow(service)
+    except tk.TclError as exc:
+        print(f"Нужен графический дисплей: {exc}")
+        sys.exit(1)
+    window.withdraw()
+    order = service.create_order()
+    service.change_order_status(order.order_id, OrderStatus.PREPARING)
+    fill_order(service, order.order_id, args.units)
+    window.current_order_id = order.order_id
+    window._open_details()
+    window.update_idletasks()
+    lines = len(service.get_order_lines(order.order_id))
+    print(f"единиц={args.units}  строк={lines}")
+    print(f"до (каждое действие перерисовывает): {measure(window, legacy_frame, args.repeat) * 1e3:7.2f} мс/кадр")
+    print(f"после (одна отрисовка на область):  {measure(window, coalesced_frame, args.repeat) * 1e3:7.2f} мс/кадр")
+    window.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from .line_store import (
+    ADD_ON_UNITS,
+    BY_ADD_ONS,
+    BY_HOUR,
+    BY_PRODUCT,
+    BY_STATUS,
+    CREATED_AT,
+    GROSS_REVENUE,
+    LINES,
+    PAID_AT,
+    QUANTITY,
+    OrderLineStore,
+)
+from .sales import SalesAggregates, SalesReport
+
+__all__ = [
+    "ADD_ON_UNITS",
+    "BY_ADD_ONS",
+    "BY_HOUR",
+    "BY_PRODUCT",
+    "BY_STATUS",
+    "CREATED_AT",
+    "GROSS_REVENUE",
+    "LINES",
+    "PAID_AT",
+    "QUANTITY",
+    "OrderLineStore",
+    "SalesAggregates",
+    "SalesReport",
+]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..models.order import EVENT_ITEMS_CHANGED, EVENT_STATUS_CHANGED, STATUS_CODES, STATUSES, Order, OrderStatus
+from ..patterns.observer.observers import OrderObserver
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BY_PRODUCT = "product"
+BY_STATUS = "status"
+BY_HOUR = "hour"
+BY_ADD_ONS = "add_ons"
+
+GROSS_REVENUE = "gross_revenue"
+QUANTITY = "quantity"
+LINES = "lines"
+ADD_ON_UNITS = "add_on_units"
+
+CREATED_AT = "created_at"
+PAID_AT = "paid_at"
+
+_KEYS = (BY_PRODUCT, BY_STATUS, BY_HOUR, BY_ADD_ONS)
+_MEASURES = (GROSS_REVENUE, QUANTITY, LINES, ADD_ON_UNITS)
+_TIMESTAMPS = (CREATED_AT, PAID_AT)
+
+
+class OrderLineStore(OrderObserver):
+    events = frozenset({EVENT_ITEMS_CHANGED, EVENT_STATUS_CHANGED})
+
+    def __init__(self, use_numpy: bool = True) -> None:
+        self.use_numpy = use_numpy and np is not None
+        self._lock = threading.Lock()
+        self._product_codes: Dict[str, int] = {}
+        self._product_names: List[str] = []
+        self._rows: Dict[int, Dict[int, int]] = {}
+        self._clear_columns()
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    @property
+    def products(self) -> Tuple[str, ...]:
+        return tuple(self._product_names)
+
+    def update(self, order: Order, event: str) -> None:
+        self.track(order)
+
+    def track(self, order: Order) -> None:
+        lines = order.lines
+        status = order.status_code
+        paid_at = math.nan if order.paid_at is None else order.paid_at
+        with self._lock:
+            rows = self._rows.setdefault(order.order_id, {})
+            present = set()
+            for line_id, item in lines:
+                present.add(line_id)
+                row = rows.get(line_id)
+                if row is None:
+                    rows[line_id] = len(self.order_ids)
+                    self.order_ids.append(order.order_id)
+                    self.product_codes.append(self._product_code(item.product.get_name()))
+                    self.add_on_masks.append(item.configuration.add_on_mask)
+                    self.add_on_units.append(len(item.configuration.add_ons))
+                    self.unit_prices.append(item.get_unit_price())
+                    self.quantities.append(item.quantity)
+                    self.statuses.append(status)
+                    self.created_at.append(order.created_at)
+                    self.paid_at.append(paid_at)
+                else:
+                    self.quantities[row] = item.quantity
+                    self.statuses[row] = status
+                    self.paid_at[row] = paid_at
+            for line_id in [line_id for line_id in rows if line_id not in present]:
+                self.quantities[rows.pop(line_id)] = 0
+
+    def track_all(self, orders: Iterable[Order]) -> None:
+        for order in orders:
+            self.track(order)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._clear_columns()
+
+    def group_by(
+        self,
+        key: str = BY_PRODUCT,
+        measure: str = GROSS_REVENUE,
+        statuses: Iterable[OrderStatus] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        timestamp: str = CREATED_AT,
+    ) -> Dict[Any, int]:
+        if key not in _KEYS or measure not in _MEASURES or timestamp not in _TIMESTAMPS:
+            raise ValueError(f"Неизвестный запрос: группировка {key!r}, мера {measure!r}, время {timestamp!r}.")
+        codes = None if statuses is None else sorted({STATUS_CODES[status] for status in statuses})
+        with self._lock:
+            query = self._group_numpy if self.use_numpy else self._group_python
+            grouped = query(key, measure, codes, since, until, timestamp)
+            names = list(self._product_names)
+        return {self._label(key, value, names): total for value, total in grouped}
+
+    def total(
+        self,
+        measure: str = GROSS_REVENUE,
+        statuses: Iterable[OrderStatus] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        timestamp: str = CREATED_AT,
+    ) -> int:
+        return sum(self.group_by(BY_STATUS, measure, statuses, since, until, timestamp).values())
+
+    def mean_add_ons(self, product_name: str, statuses: Iterable[OrderStatus] | None = None) -> float:
+        units = self.group_by(BY_PRODUCT, ADD_ON_UNITS, statuses).get(product_name, 0)
+        quantity = self.group_by(BY_PRODUCT, QUANTITY, statuses).get(product_name, 0)
+        return units / quantity if quantity else 0.0
+
+    def _clear_columns(self) -> None:
+        self.order_ids = array("q")
+        self.product_codes = array("i")
+        self.add_on_masks = array("q")
+        self.add_on_units = array("q")
+        self.unit_prices = array("q")
+        self.quantities = array("q")
+        self.statuses = array("b")
+        self.created_at = array("d")
+        self.paid_at = array("d")
+
+    def _product_code(self, name: str) -> int:
+        code = self._product_codes.get(name)
+        if code is None:
+            code = self._product_codes[name] = len(self._product_names)
+            self._product_names.append(name)
+        return code
+
+    def _label(self, key: str, value: int, names: Sequence[str]) -> Any:
+        if key == BY_PRODUCT:
+            return names[value]
+        if key == BY_STATUS:
+            return STATUSES[value]
+        return value
+
+    def _group_python(
+        self,
+        key: str,
+        measure: str,
+        codes: Optional[List[int]],
+        since: float | None,
+        until: float | None,
+        timestamp: str,
+    ) -> List[Tuple[int, int]]:
+        keys: Iterable[int] = {
+            BY_PRODUCT: self.product_codes,
+            BY_STATUS: self.statuses,
+            BY_ADD_ONS: self.add_on_masks,
+            BY_HOUR: (int(moment // 3600) if moment == moment else -1 for moment in getattr(self, timestamp)),
+        }[key]
+        value = _python_measure(measure)
+        wanted = None if codes is None else frozenset(codes)
+        bounded = since is not None or until is not None
+        low = -math.inf if since is None else since
+        high = math.inf if until is None else until
+        totals: Dict[int, int] = {}
+        for group, quantity, price, units, status, moment in zip(
+            keys, self.quantities, self.unit_prices, self.add_on_units, self.statuses, getattr(self, timestamp)
+        ):
+            if not quantity or (wanted is not None and status not in wanted):
+                continue
+            if bounded and not low <= moment < high:
+                continue
+            totals[group] = totals.get(group, 0) + value(quantity, price, units)
+        return sorted(totals.items())
+
+    def _group_numpy(
+        self,
+        key: str,
+        measure: str,
+        codes: Optional[List[int]],
+        since: float | None,
+        until: float | None,
+        timestamp: str,
+    ) -> List[Tuple[int, int]]:
+        if not len(self.order_ids):
+            return []
+        quantities = np.frombuffer(self.quantities, dtype=np.int64)
+        moments = np.frombuffer(getattr(self, timestamp), dtype=np.float64)
+        selected = quantities > 0
+        if codes is not None:
+            wanted = np.zeros(len(STATUSES), dtype=bool)
+            wanted[codes] = True
+            selected &= wanted[np.frombuffer(self.statuses, dtype=np.int8)]
+        if since is not None:
+            selected &= moments >= since
+        if until is not None:
+            selected &= moments < until
+        quantities = quantities[selected]
+        if key == BY_PRODUCT:
+            keys = np.frombuffer(self.product_codes, dtype=np.int32)[selected]
+        elif key == BY_STATUS:
+            keys = np.frombuffer(self.statuses, dtype=np.int8)[selected]
+        elif key == BY_ADD_ONS:
+            keys = np.frombuffer(self.add_on_masks, dtype=np.int64)[selected]
+        else:
+            moments = moments[selected]
+            keys = np.where(np.isnan(moments), -1, np.floor_divide(np.nan_to_num(moments), 3600)).astype(np.int64)
+        if measure == GROSS_REVENUE:
+            values = quantities * np.frombuffer(self.unit_prices, dtype=np.int64)[selected]
+        elif measure == QUANTITY:
+            values = quantities
+        elif measure == LINES:
+            values = np.ones_like(quantities)
+        else:
+            values = quantities * np.frombuffer(self.add_on_units, dtype=np.int64)[selected]
+        if key in (BY_PRODUCT, BY_STATUS):
+            present = np.bincount(keys, minlength=1) > 0
+            groups = np.flatnonzero(present)
+            totals = np.bincount(keys, weights=values, minlength=1)[present]
+        else:
+            groups, inverse = np.unique(keys, return_inverse=True)
+            totals = np.bincount(inverse.ravel(), weights=values, minlength=len(groups))
+        return [(int(group), int(round(total))) for group, total in zip(groups, totals)]
+
+
+def _python_measure(measure: str) -> Callable[[int, int, int], int]:
+    if measure == GROSS_REVENUE:
+        return lambda quantity, price, units: quantity * price
+    if measure == QUANTITY:
+        return lambda quantity, price, units: quantity
+    if measure == LINES:
+        return lambda quantity, price, units: 1
+    return lambda quantity, price, units: quantity * units
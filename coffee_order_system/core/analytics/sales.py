@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Hashable, NamedTuple, Sequence, Tuple
+
+from ..models.order import EVENT_STATUS_CHANGED, Order, OrderItem, OrderStatus
+from ..patterns.observer.observers import OrderEvent, OrderObserver
+
+SECONDS_PER_HOUR = 3600
+
+
+class SalesReport(NamedTuple):
+    shift_started_at: float
+    orders: int
+    revenue_cents: int
+    gross_cents: int
+    discount_cents: int
+    products: Dict[str, int]
+    add_ons: Dict[str, int]
+    discounts: Dict[str, int]
+    orders_per_hour: Dict[int, int]
+
+
+class _Contribution(NamedTuple):
+    total: int
+    subtotal: int
+    label: str
+    hour: int
+    items: Tuple[OrderItem, ...]
+
+
+class SalesAggregates(OrderObserver):
+    events = frozenset({EVENT_STATUS_CHANGED})
+    synchronous = True
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset_counters(time.time())
+
+    @property
+    def shift_started_at(self) -> float:
+        return self._shift_started_at
+
+    @property
+    def orders(self) -> int:
+        return self._orders
+
+    @property
+    def revenue_cents(self) -> int:
+        return self._revenue_cents
+
+    @property
+    def gross_cents(self) -> int:
+        return self._gross_cents
+
+    @property
+    def discount_cents(self) -> int:
+        return self._gross_cents - self._revenue_cents
+
+    def product_count(self, name: str) -> int:
+        return self._products.get(name, 0)
+
+    def add_on_count(self, name: str) -> int:
+        return self._add_ons.get(name, 0)
+
+    def discount_total(self, label: str) -> int:
+        return self._discounts.get(label, 0)
+
+    def orders_in_hour(self, hour: int) -> int:
+        return self._orders_per_hour.get(hour, 0)
+
+    def update(self, order: Order, event: str) -> None:
+        self._apply(order, order.status)
+
+    def update_batch(self, events: Sequence[OrderEvent]) -> None:
+        for entry in events:
+            if entry.event == EVENT_STATUS_CHANGED:
+                self._apply(entry.order, entry.status)
+
+    def report(self) -> SalesReport:
+        with self._lock:
+            return self._report()
+
+    def reset(self, now: float | None = None) -> SalesReport:
+        with self._lock:
+            closed = self._report()
+            self._reset_counters(time.time() if now is None else now)
+        return closed
+
+    def _apply(self, order: Order, status: OrderStatus) -> None:
+        with self._lock:
+            counted = self._counted.get(order.order_id)
+            if status == OrderStatus.PAID and counted is None:
+                contribution = self._contribution(order)
+                self._counted[order.order_id] = contribution
+                self._add(contribution)
+            elif status != OrderStatus.PAID and counted is not None:
+                del self._counted[order.order_id]
+                self._subtract(counted)
+
+    def _contribution(self, order: Order) -> _Contribution:
+        paid_at = time.time() if order.paid_at is None else order.paid_at
+        return _Contribution(
+            order.total,
+            order.subtotal,
+            order.discount_label,
+            int(paid_at // SECONDS_PER_HOUR),
+            tuple(order.items),
+        )
+
+    def _add(self, contribution: _Contribution) -> None:
+        total, subtotal, label, hour, items = contribution
+        self._orders += 1
+        self._revenue_cents += total
+        self._gross_cents += subtotal
+        if subtotal != total:
+            self._discounts[label] = self._discounts.get(label, 0) + subtotal - total
+        self._orders_per_hour[hour] = self._orders_per_hour.get(hour, 0) + 1
+        products, add_ons = self._products, self._add_ons
+        for item in items:
+            configuration, quantity = item.configuration, item.quantity
+            name = configuration.product.get_name()
+            products[name] = products.get(name, 0) + quantity
+            for add_on in configuration.add_on_names:
+                add_ons[add_on] = add_ons.get(add_on, 0) + quantity
+
+    def _subtract(self, contribution: _Contribution) -> None:
+        total, subtotal, label, hour, items = contribution
+        self._orders -= 1
+        self._revenue_cents -= total
+        self._gross_cents -= subtotal
+        if subtotal != total:
+            _bump(self._discounts, label, total - subtotal)
+        _bump(self._orders_per_hour, hour, -1)
+        for item in items:
+            _bump(self._products, item.configuration.product.get_name(), -item.quantity)
+            for add_on in item.configuration.add_on_names:
+                _bump(self._add_ons, add_on, -item.quantity)
+
+    def _report(self) -> SalesReport:
+        return SalesReport(
+            self._shift_started_at,
+            self._orders,
+            self._revenue_cents,
+            self._gross_cents,
+            self._gross_cents - self._revenue_cents,
+            dict(self._products),
+            dict(self._add_ons),
+            dict(self._discounts),
+            dict(self._orders_per_hour),
+        )
+
+    def _reset_counters(self, now: float) -> None:
+        self._shift_started_at = now
+        self._counted: Dict[int, _Contribution] = {}
+        self._orders = 0
+        self._revenue_cents = 0
+        self._gross_cents = 0
+        self._products: Dict[str, int] = {}
+        self._add_ons: Dict[str, int] = {}
+        self._discounts: Dict[str, int] = {}
+        self._orders_per_hour: Dict[int, int] = {}
+
+
+def _bump(counters: Dict, key: Hashable, delta: int) -> None:
+    value = counters.get(key, 0) + delta
+    if value:
+        counters[key] = value
+    else:
+        counters.pop(key, None)
@@ -0,0 +1,13 @@
+from .histogram import HistogramSnapshot, LatencyHistogram
+from .instrumentation import Instrumentation, InstrumentationSnapshot
+from .prometheus import TextfileExporter, render, write_textfile
+
+__all__ = [
+    "HistogramSnapshot",
+    "Instrumentation",
+    "InstrumentationSnapshot",
+    "LatencyHistogram",
+    "TextfileExporter",
+    "render",
+    "write_textfile",
+]
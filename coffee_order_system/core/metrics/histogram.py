@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, NamedTuple, Tuple
+
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(value: int) -> int:
+    if value < SUB_BUCKET_COUNT:
+        return max(value, 0)
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    if index < SUB_BUCKET_COUNT * 2:
+        return index, index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    lowest = (index - (shift << SUB_BUCKET_BITS)) << shift
+    return lowest, lowest + (1 << shift) - 1
+
+
+class HistogramSnapshot(NamedTuple):
+    count: int
+    total_ns: int
+    min_ns: int
+    max_ns: int
+    buckets: Tuple[Tuple[int, int], ...]
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, min(self.count, int(fraction * self.count + 0.5)))
+        seen = 0
+        for index, count in self.buckets:
+            seen += count
+            if seen >= rank:
+                return max(self.min_ns, min(self.max_ns, bucket_bounds(index)[1]))
+        return self.max_ns
+
+    def count_at_or_below(self, value_ns: int) -> int:
+        return sum(count for index, count in self.buckets if bucket_bounds(index)[1] <= value_ns)
+
+    def values(self) -> Iterator[Tuple[int, int]]:
+        for index, count in self.buckets:
+            yield bucket_bounds(index)[1], count
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int) -> None:
+        index = bucket_index(value_ns)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if not self.count or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if not other.count:
+            return
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.min_ns = other.min_ns if not self.count else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            self.count, self.total_ns, self.min_ns, self.max_ns, tuple(sorted(self._counts.items()))
+        )
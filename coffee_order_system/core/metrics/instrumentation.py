@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, TypeVar
+
+from .histogram import HistogramSnapshot, LatencyHistogram
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class InstrumentationSnapshot(NamedTuple):
+    taken_at: float
+    methods: Dict[str, HistogramSnapshot]
+    observers: Dict[str, HistogramSnapshot]
+
+
+class Instrumentation:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._methods: Dict[str, LatencyHistogram] = {}
+        self._observers: Dict[str, LatencyHistogram] = {}
+
+    def wrap(self, name: str, function: F) -> F:
+        histogram = self._histogram(self._methods, name)
+        lock = self._lock
+        clock = time.perf_counter_ns
+
+        @functools.wraps(function)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - started
+                with lock:
+                    histogram.record(elapsed)
+
+        return timed  # type: ignore[return-value]
+
+    def record_call(self, name: str, elapsed_ns: int) -> None:
+        histogram = self._methods.get(name) or self._histogram(self._methods, name)
+        with self._lock:
+            histogram.record(elapsed_ns)
+
+    def record_dispatch(self, observer: object, elapsed_ns: int) -> None:
+        name = type(observer).__name__
+        histogram = self._observers.get(name) or self._histogram(self._observers, name)
+        with self._lock:
+            histogram.record(elapsed_ns)
+
+    def snapshot(self) -> InstrumentationSnapshot:
+        with self._lock:
+            return InstrumentationSnapshot(
+                time.time(),
+                {name: histogram.snapshot() for name, histogram in self._methods.items() if histogram.count},
+                {name: histogram.snapshot() for name, histogram in self._observers.items() if histogram.count},
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            for histogram in (*self._methods.values(), *self._observers.values()):
+                histogram.clear()
+
+    def _histogram(self, family: Dict[str, LatencyHistogram], name: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = family.get(name)
+            if histogram is None:
+                histogram = family[name] = LatencyHistogram()
+            return histogram
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from typing import Dict, List, Sequence
+
+from .histogram import HistogramSnapshot
+from .instrumentation import Instrumentation, InstrumentationSnapshot
+
+DEFAULT_PREFIX = "coffee_order"
+DEFAULT_BUCKETS = (
+    0.000005,
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def render(
+    snapshot: InstrumentationSnapshot,
+    prefix: str = DEFAULT_PREFIX,
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> str:
+    lines: List[str] = []
+    _family(lines, f"{prefix}_call", "method", snapshot.methods, buckets, "Время выполнения методов")
+    _family(
+        lines,
+        f"{prefix}_observer_dispatch",
+        "observer",
+        snapshot.observers,
+        buckets,
+        "Время доставки событий наблюдателям",
+    )
+    lines.append(f"# HELP {prefix}_metrics_snapshot_timestamp_seconds Время снимка метрик")
+    lines.append(f"# TYPE {prefix}_metrics_snapshot_timestamp_seconds gauge")
+    lines.append(f"{prefix}_metrics_snapshot_timestamp_seconds {snapshot.taken_at:.3f}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(
+    instrumentation: Instrumentation,
+    path: str,
+    prefix: str = DEFAULT_PREFIX,
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> None:
+    text = render(instrumentation.snapshot(), prefix, buckets)
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(prefix=".metrics-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write(text)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+class TextfileExporter:
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        path: str,
+        interval: float = 15.0,
+        prefix: str = DEFAULT_PREFIX,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("Интервал экспорта метрик должен быть положительным.")
+        self._instrumentation = instrumentation
+        self.path = path
+        self.interval = interval
+        self.prefix = prefix
+        self.last_error: BaseException | None = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def export(self) -> None:
+        write_textfile(self._instrumentation, self.path, self.prefix)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-textfile-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.export()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.export()
+            except OSError as exc:
+                self.last_error = exc
+
+
+def _family(
+    lines: List[str],
+    name: str,
+    label: str,
+    histograms: Dict[str, HistogramSnapshot],
+    buckets: Sequence[float],
+    description: str,
+) -> None:
+    if not histograms:
+        return
+    seconds = f"{name}_duration_seconds"
+    lines.append(f"# HELP {seconds} {description}, секунды")
+    lines.append(f"# TYPE {seconds} histogram")
+    for key in sorted(histograms):
+        histogram = histograms[key]
+        labels = f'{label}="{_escape(key)}"'
+        for bound in buckets:
+            count = histogram.count_at_or_below(int(bound * 1e9))
+            lines.append(f'{seconds}_bucket{{{labels},le="{_number(bound)}"}} {count}')
+        lines.append(f'{seconds}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"{seconds}_sum{{{labels}}} {_number(histogram.total_ns / 1e9)}")
+        lines.append(f"{seconds}_count{{{labels}}} {histogram.count}")
+    quantiles = f"{name}_quantile_seconds"
+    lines.append(f"# HELP {quantiles} {description}, квантили HDR-гистограммы, секунды")
+    lines.append(f"# TYPE {quantiles} gauge")
+    for key in sorted(histograms):
+        histogram = histograms[key]
+        for quantile in QUANTILES:
+            value = histogram.percentile(quantile) / 1e9
+            lines.append(f'{quantiles}{{{label}="{_escape(key)}",quantile="{quantile}"}} {_number(value)}')
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value))
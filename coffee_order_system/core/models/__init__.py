@@ -1,13 +1,32 @@
-from .order import Order, OrderItem, OrderStatus
+from .money import apply_discount, discount_cents, format_cents, percent_to_basis_points
+from .order import (
+    EVENT_CREATED,
+    EVENT_DISCOUNT_CHANGED,
+    EVENT_ITEMS_CHANGED,
+    EVENT_STATUS_CHANGED,
+    ItemConfiguration,
+    Order,
+    OrderItem,
+    OrderStatus,
+)
 from .product import AddOn, Beverage, Dessert, Product, PricedItem
 
 __all__ = [
+    "EVENT_CREATED",
+    "EVENT_DISCOUNT_CHANGED",
+    "EVENT_ITEMS_CHANGED",
+    "EVENT_STATUS_CHANGED",
     "AddOn",
     "Beverage",
     "Dessert",
+    "ItemConfiguration",
     "Order",
     "OrderItem",
     "OrderStatus",
     "Product",
     "PricedItem",
+    "apply_discount",
+    "discount_cents",
+    "format_cents",
+    "percent_to_basis_points",
 ]
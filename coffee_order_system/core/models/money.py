@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+
+CENTS_PER_UNIT = 100
+BASIS_POINTS_PER_PERCENT = 100
+_FULL_DISCOUNT = 100 * BASIS_POINTS_PER_PERCENT
+
+
+def format_cents(cents: int) -> str:
+    sign = "-" if cents < 0 else ""
+    units, rest = divmod(abs(cents), CENTS_PER_UNIT)
+    return f"{sign}{units}.{rest:02d}"
+
+
+def percent_to_basis_points(percent: float) -> int:
+    return int(Decimal(str(percent)).scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def discount_cents(subtotal: int, basis_points: int) -> int:
+    return (subtotal * basis_points + _FULL_DISCOUNT // 2) // _FULL_DISCOUNT
+
+
+def apply_discount(subtotal: int, basis_points: int) -> int:
+    return subtotal - discount_cents(subtotal, basis_points)
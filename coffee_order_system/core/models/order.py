@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import List, TYPE_CHECKING
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
-from ..utils import OrderStateError
-from .product import AddOn, PricedItem, Product
+from ..utils import InvalidAddOnError, OrderStateError
+from .money import apply_discount, percent_to_basis_points
+from .product import ADD_ON_COUNT_LIMIT, AddOn, PricedItem, Product
+
+
+EVENT_CREATED = "создан"
+EVENT_STATUS_CHANGED = "статус_изменен"
+EVENT_ITEMS_CHANGED = "позиции_изменены"
+EVENT_DISCOUNT_CHANGED = "скидка_изменена"
 
 
 class OrderStatus(Enum):
@@ -15,71 +25,306 @@ class OrderStatus(Enum):
     PAID = "оплачен"
 
 
+STATUSES: Tuple[OrderStatus, ...] = tuple(OrderStatus)
+STATUS_CODES: Dict[OrderStatus, int] = {status: code for code, status in enumerate(STATUSES)}
+CONFIGURATION_CACHE_SIZE = 4096
+LINE_INDEX_THRESHOLD = 8
+
+
 @dataclass(frozen=True)
-class OrderItem(PricedItem):
+class ItemConfiguration:
     product: Product
-    add_ons: List[AddOn] = field(default_factory=list)
+    add_ons: Tuple[AddOn, ...] = ()
+    name: str = field(init=False, compare=False, repr=False)
+    add_on_names: Tuple[str, ...] = field(init=False, compare=False, repr=False)
+    extras: str = field(init=False, compare=False, repr=False)
+    unit_price: int = field(init=False, compare=False, repr=False)
+    add_on_mask: int = field(init=False, compare=False, repr=False)
+    _hash: int = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        add_on_names = tuple(add_on.get_name() for add_on in self.add_ons)
+        extras = ", ".join(add_on_names)
+        name = f"{self.product.get_name()} (+ {extras})" if extras else self.product.get_name()
+        object.__setattr__(self, "add_on_names", add_on_names)
+        object.__setattr__(self, "extras", extras)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(
+            self, "unit_price", self.product.get_price() + sum(add_on.get_price() for add_on in self.add_ons)
+        )
+        object.__setattr__(self, "add_on_mask", add_on_mask(self.add_ons))
+        object.__setattr__(self, "_hash", hash((self.product, self.add_ons)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> Tuple[object, Tuple[Product, Tuple[AddOn, ...]]]:
+        return ItemConfiguration.of, (self.product, self.add_ons)
+
+    @staticmethod
+    def of(product: Product, add_ons: Iterable[AddOn] = ()) -> "ItemConfiguration":
+        return _intern_configuration(product, tuple(sorted(add_ons, key=_add_on_name)))
+
+    @staticmethod
+    def cache_info() -> Tuple[int, int, Optional[int], int]:
+        return _intern_configuration.cache_info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        _intern_configuration.cache_clear()
+
+
+def add_on_mask(add_ons: Iterable[AddOn]) -> int:
+    mask = 0
+    for add_on in add_ons:
+        if (mask >> add_on.shift) & ADD_ON_COUNT_LIMIT == ADD_ON_COUNT_LIMIT:
+            raise InvalidAddOnError(
+                f"Добавку '{add_on.get_name()}' можно выбрать не более {ADD_ON_COUNT_LIMIT} раз."
+            )
+        mask += add_on.mask
+    return mask
+
+
+def _add_on_name(add_on: AddOn) -> str:
+    return add_on.get_name()
+
+
+@lru_cache(maxsize=CONFIGURATION_CACHE_SIZE)
+def _intern_configuration(product: Product, add_ons: Tuple[AddOn, ...]) -> ItemConfiguration:
+    return ItemConfiguration(product, add_ons)
+
+
+@dataclass(frozen=True, slots=True)
+class OrderItem(PricedItem):
+    configuration: ItemConfiguration
+    quantity: int = 1
+
+    @classmethod
+    def of(cls, product: Product, add_ons: Iterable[AddOn] = (), quantity: int = 1) -> "OrderItem":
+        return cls(ItemConfiguration.of(product, add_ons), quantity)
+
+    @property
+    def product(self) -> Product:
+        return self.configuration.product
+
+    @property
+    def add_ons(self) -> Tuple[AddOn, ...]:
+        return self.configuration.add_ons
+
+    @property
+    def key(self) -> ItemConfiguration:
+        return self.configuration
+
+    def with_quantity(self, quantity: int) -> "OrderItem":
+        return replace(self, quantity=quantity)
 
     def get_name(self) -> str:
-        if not self.add_ons:
-            return self.product.get_name()
-        extras = ", ".join(add_on.get_name() for add_on in self.add_ons)
-        return f"{self.product.get_name()} (+ {extras})"
+        return self.configuration.name
+
+    def get_display_name(self) -> str:
+        if self.quantity == 1:
+            return self.configuration.name
+        return f"{self.configuration.name} ×{self.quantity}"
 
     def get_category(self) -> str:
-        return self.product.get_category()
+        return self.configuration.product.get_category()
 
-    def get_price(self) -> float:
-        return self.product.get_price() + sum(add_on.get_price() for add_on in self.add_ons)
+    def get_unit_price(self) -> int:
+        return self.configuration.unit_price
+
+    def get_price(self) -> int:
+        return self.configuration.unit_price * self.quantity
 
 
 class Order:
-    def __init__(self, order_id: int) -> None:
+    __slots__ = (
+        "order_id",
+        "created_at",
+        "paid_at",
+        "_lines",
+        "_line_ids",
+        "_next_line_id",
+        "_status",
+        "_observers",
+        "_event_bus",
+        "_subtotal",
+        "total",
+        "discount_percent",
+        "discount_label",
+        "_discount_basis_points",
+    )
+
+    def __init__(self, order_id: int, created_at: Optional[float] = None) -> None:
         self.order_id = order_id
-        self._items: List[OrderItem] = []
-        self._status = OrderStatus.CREATED
-        self._observers: List["OrderObserver"] = []
-        self.total = 0.0
+        self.created_at = time.time() if created_at is None else created_at
+        self.paid_at: Optional[float] = None
+        self._lines: Dict[int, OrderItem] = {}
+        self._line_ids: Optional[Dict[ItemConfiguration, int]] = None
+        self._next_line_id = 1
+        self._status = 0
+        self._observers: Tuple["OrderObserver", ...] = ()
+        self._event_bus: Optional["EventBus"] = None
+        self._subtotal = 0
+        self.total = 0
         self.discount_percent = 0.0
         self.discount_label = "обычный"
+        self._discount_basis_points = 0
+
+    @classmethod
+    def restore(
+        cls,
+        order_id: int,
+        status: OrderStatus,
+        lines: Iterable[Tuple[int, OrderItem]],
+        discount_percent: float,
+        discount_label: str,
+        created_at: float,
+        paid_at: Optional[float] = None,
+    ) -> "Order":
+        order = cls(order_id, created_at)
+        for line_id, item in lines:
+            order._lines[line_id] = item
+            order._next_line_id = max(order._next_line_id, line_id + 1)
+        order._subtotal = order.recalculate_subtotal()
+        order.set_discount(discount_percent, discount_label)
+        order._status = STATUS_CODES[status]
+        order.paid_at = paid_at
+        return order
 
     @property
     def status(self) -> OrderStatus:
+        return STATUSES[self._status]
+
+    @property
+    def status_code(self) -> int:
         return self._status
 
     @property
     def items(self) -> List[OrderItem]:
-        return list(self._items)
+        return list(self._lines.values())
+
+    @property
+    def lines(self) -> List[Tuple[int, OrderItem]]:
+        return list(self._lines.items())
 
-    def add_item(self, item: OrderItem) -> None:
-        self._items.append(item)
+    @property
+    def subtotal(self) -> int:
+        return self._subtotal
 
-    def remove_item(self, index: int) -> None:
-        if index < 0 or index >= len(self._items):
+    def add_item(self, item: OrderItem) -> int:
+        if item.quantity < 1:
+            raise OrderStateError("Количество позиции должно быть положительным.")
+        key = item.key
+        line_id = self._find_line(key)
+        if line_id is None:
+            line_id = self._next_line_id
+            self._next_line_id += 1
+            self._lines[line_id] = item
+            if self._line_ids is not None:
+                self._line_ids[key] = line_id
+            self._lines_changed(item.get_price())
+        else:
+            self.increment_item(line_id, item.quantity)
+        return line_id
+
+    def _find_line(self, key: ItemConfiguration) -> Optional[int]:
+        if self._line_ids is not None:
+            return self._line_ids.get(key)
+        if len(self._lines) >= LINE_INDEX_THRESHOLD:
+            self._line_ids = {item.key: line_id for line_id, item in self._lines.items()}
+            return self._line_ids.get(key)
+        for line_id, item in self._lines.items():
+            if item.configuration is key or item.configuration == key:
+                return line_id
+        return None
+
+    def get_line(self, line_id: int) -> OrderItem:
+        try:
+            return self._lines[line_id]
+        except KeyError as exc:
+            raise OrderStateError(f"Позиция '{line_id}' не найдена в заказе.") from exc
+
+    def line_id_at(self, index: int) -> int:
+        if index < 0 or index >= len(self._lines):
             raise IndexError("Индекс позиции заказа вне диапазона.")
-        self._items.pop(index)
+        return next(islice(self._lines, index, None))
+
+    def increment_item(self, line_id: int, count: int = 1) -> OrderItem:
+        if count < 1:
+            raise OrderStateError("Количество позиции должно быть положительным.")
+        item = self.get_line(line_id)
+        updated = item.with_quantity(item.quantity + count)
+        self._lines[line_id] = updated
+        self._lines_changed(item.get_unit_price() * count)
+        return updated
+
+    def decrement_item(self, line_id: int, count: int = 1) -> Optional[OrderItem]:
+        if count < 1:
+            raise OrderStateError("Количество позиции должно быть положительным.")
+        item = self.get_line(line_id)
+        if count >= item.quantity:
+            self.remove_line(line_id)
+            return None
+        updated = item.with_quantity(item.quantity - count)
+        self._lines[line_id] = updated
+        self._lines_changed(-item.get_unit_price() * count)
+        return updated
+
+    def remove_line(self, line_id: int) -> OrderItem:
+        item = self.get_line(line_id)
+        del self._lines[line_id]
+        if self._line_ids is not None:
+            del self._line_ids[item.key]
+        self._lines_changed(-item.get_price())
+        return item
+
+    def remove_item(self, index: int) -> None:
+        self.decrement_item(self.line_id_at(index))
 
     def set_status(self, new_status: OrderStatus) -> None:
         if not isinstance(new_status, OrderStatus):
             raise OrderStateError("Неверный тип статуса заказа.")
-        if new_status == self._status:
+        code = STATUS_CODES[new_status]
+        if code == self._status:
             raise OrderStateError("Заказ уже находится в этом статусе.")
-        self._status = new_status
-        self.notify("статус_изменен")
+        self._status = code
+        self.paid_at = time.time() if new_status == OrderStatus.PAID else None
+        self.notify(EVENT_STATUS_CHANGED)
 
     def set_discount(self, percent: float, label: str) -> None:
         if percent < 0 or percent > 100:
             raise OrderStateError("Процент скидки вне диапазона 0-100.")
         self.discount_percent = percent
         self.discount_label = label
+        self._discount_basis_points = percent_to_basis_points(percent)
+        self._update_total()
+        self.notify(EVENT_DISCOUNT_CHANGED)
+
+    def recalculate_subtotal(self) -> int:
+        return sum(item.get_price() for item in self._lines.values())
+
+    def _lines_changed(self, delta: int) -> None:
+        self._subtotal += delta
+        self._update_total()
+        self.notify(EVENT_ITEMS_CHANGED)
+
+    def _update_total(self) -> None:
+        self.total = apply_discount(self._subtotal, self._discount_basis_points)
 
     def add_observer(self, observer: "OrderObserver") -> None:
-        self._observers.append(observer)
+        self._observers = (*self._observers, observer)
+
+    def set_event_bus(self, event_bus: Optional["EventBus"]) -> None:
+        self._event_bus = event_bus
 
     def notify(self, event: str) -> None:
-        for observer in list(self._observers):
-            observer.update(self, event)
+        if self._event_bus is not None:
+            self._event_bus.publish(self, event)
+        for observer in self._observers:
+            if observer.events is None or event in observer.events:
+                observer.update(self, event)
 
 
 if TYPE_CHECKING:
+    from ..patterns.observer.event_bus import EventBus
     from ..patterns.observer.observers import OrderObserver
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+ADD_ON_COUNT_BITS = 8
+ADD_ON_COUNT_LIMIT = (1 << ADD_ON_COUNT_BITS) - 1
+ADD_ON_SLOTS = 63 // ADD_ON_COUNT_BITS
 
 
 class PricedItem(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self) -> str:
         pass
@@ -14,7 +20,7 @@ class PricedItem(ABC):
         pass
 
     @abstractmethod
-    def get_price(self) -> float:
+    def get_price(self) -> int:
         pass
 
 
@@ -22,7 +28,7 @@ class PricedItem(ABC):
 class Product(PricedItem):
     name: str
     category: str
-    base_price: float
+    base_price: int
 
     def get_name(self) -> str:
         return self.name
@@ -30,7 +36,7 @@ class Product(PricedItem):
     def get_category(self) -> str:
         return self.category
 
-    def get_price(self) -> float:
+    def get_price(self) -> int:
         return self.base_price
 
 
@@ -42,5 +48,18 @@ class Dessert(Product):
     pass
 
 
+@dataclass(frozen=True)
 class AddOn(Product):
-    pass
+    slot: int = field(compare=False)
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.slot < ADD_ON_SLOTS:
+            raise ValueError(f"Номер добавки '{self.name}' должен быть от 0 до {ADD_ON_SLOTS - 1}.")
+
+    @property
+    def shift(self) -> int:
+        return self.slot * ADD_ON_COUNT_BITS
+
+    @property
+    def mask(self) -> int:
+        return 1 << self.shift
@@ -1,8 +1,34 @@
-from .observers import CustomerNotifier, KitchenDisplay, Logger, OrderObserver
+from .async_dispatcher import BLOCK, COALESCE, DROP_OLDEST, AsyncDispatcher
+from .event_bus import EventBus
+from .observers import (
+    DEBUG,
+    INFO,
+    WARNING,
+    CustomerNotifier,
+    KitchenDisplay,
+    Logger,
+    MessageObserver,
+    OrderEvent,
+    OrderMessage,
+    OrderObserver,
+)
+from .sinks import RotatingFileSink
 
 __all__ = [
+    "AsyncDispatcher",
+    "BLOCK",
+    "COALESCE",
     "CustomerNotifier",
+    "DEBUG",
+    "DROP_OLDEST",
+    "EventBus",
+    "INFO",
     "KitchenDisplay",
     "Logger",
+    "MessageObserver",
+    "OrderEvent",
+    "OrderMessage",
     "OrderObserver",
+    "RotatingFileSink",
+    "WARNING",
 ]
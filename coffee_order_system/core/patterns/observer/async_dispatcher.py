@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Sequence, Tuple
+
+from ...models.order import Order
+from .observers import OrderEvent, OrderObserver
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+
+_BACKPRESSURE_MODES = (BLOCK, DROP_OLDEST, COALESCE)
+
+
+class _Entry:
+    __slots__ = ("observers", "event")
+
+    def __init__(self, observers: Tuple[OrderObserver, ...], event: OrderEvent) -> None:
+        self.observers = observers
+        self.event = event
+
+
+class AsyncDispatcher:
+    def __init__(self, maxsize: int = 1024, backpressure: str = BLOCK, batch_size: int = 64) -> None:
+        if backpressure not in _BACKPRESSURE_MODES:
+            raise ValueError(f"Неизвестный режим backpressure: {backpressure!r}.")
+        if maxsize < 1 or batch_size < 1:
+            raise ValueError("Размер очереди и пакета должен быть положительным.")
+        self._maxsize = maxsize
+        self._backpressure = backpressure
+        self._batch_size = batch_size
+        self._queue: Deque[_Entry] = deque()
+        self._last_by_order: Dict[int, _Entry] = {}
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._running = True
+        self.dropped = 0
+        self.dropped_after_shutdown = 0
+        self.coalesced = 0
+        self.blocked_submits = 0
+        self.failed_deliveries = 0
+        self.last_error: Optional[BaseException] = None
+        self.instrumentation: Optional[Instrumentation] = None
+        self._worker = threading.Thread(target=self._run, name="order-event-dispatcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, observers: Tuple[OrderObserver, ...], order: Order, event: str) -> None:
+        if not observers:
+            return
+        payload = OrderEvent(order, event, order.status)
+        with self._condition:
+            if not self._running:
+                self.dropped_after_shutdown += 1
+                return
+            if len(self._queue) >= self._maxsize:
+                if self._backpressure == COALESCE and self._coalesce(observers, payload):
+                    return
+                if self._backpressure == DROP_OLDEST:
+                    self._forget(self._queue.popleft())
+                    self.dropped += 1
+                else:
+                    self.blocked_submits += 1
+                    while len(self._queue) >= self._maxsize and self._running:
+                        self._condition.wait()
+            entry = _Entry(observers, payload)
+            self._queue.append(entry)
+            self._last_by_order[order.order_id] = entry
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if wait:
+            self.flush()
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._worker.join()
+
+    def _coalesce(self, observers: Tuple[OrderObserver, ...], payload: OrderEvent) -> bool:
+        pending = self._last_by_order.get(payload.order.order_id)
+        if pending is None or pending.event.event != payload.event or pending.observers != observers:
+            return False
+        pending.event = payload
+        self.coalesced += 1
+        return True
+
+    def _forget(self, entry: _Entry) -> None:
+        order_id = entry.event.order.order_id
+        if self._last_by_order.get(order_id) is entry:
+            del self._last_by_order[order_id]
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or not self._running)
+                if not self._queue:
+                    return
+                batch: List[_Entry] = []
+                while self._queue and len(batch) < self._batch_size:
+                    entry = self._queue.popleft()
+                    self._forget(entry)
+                    batch.append(entry)
+                self._in_flight = len(batch)
+                self._condition.notify_all()
+            self._deliver(batch)
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def _deliver(self, batch: Sequence[_Entry]) -> None:
+        per_observer: Dict[int, Tuple[OrderObserver, List[OrderEvent]]] = {}
+        for entry in batch:
+            for observer in entry.observers:
+                slot = per_observer.get(id(observer))
+                if slot is None:
+                    slot = per_observer[id(observer)] = (observer, [])
+                slot[1].append(entry.event)
+        instrumentation = self.instrumentation
+        for observer, events in per_observer.values():
+            started = time.perf_counter_ns() if instrumentation is not None else 0
+            try:
+                observer.update_batch(events)
+            except Exception as exc:
+                self.failed_deliveries += 1
+                self.last_error = exc
+            if instrumentation is not None:
+                instrumentation.record_dispatch(observer, time.perf_counter_ns() - started)
+
+
+if TYPE_CHECKING:
+    from ...metrics import Instrumentation
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from ...models.order import Order
+from .async_dispatcher import AsyncDispatcher
+from .observers import OrderObserver
+
+_Route = Tuple[Tuple[OrderObserver, ...], Tuple[OrderObserver, ...]]
+
+
+class EventBus:
+    def __init__(self, dispatcher: AsyncDispatcher | None = None) -> None:
+        self._subscriptions: List[Tuple[OrderObserver, Optional[FrozenSet[str]], bool]] = []
+        self._routes: Dict[str, _Route] = {}
+        self._dispatcher = dispatcher
+        self._instrumentation: Optional[Instrumentation] = None
+
+    @property
+    def dispatcher(self) -> AsyncDispatcher | None:
+        return self._dispatcher
+
+    def set_dispatcher(self, dispatcher: AsyncDispatcher | None) -> None:
+        self._dispatcher = dispatcher
+        if dispatcher is not None and self._instrumentation is not None:
+            dispatcher.instrumentation = self._instrumentation
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        return self._instrumentation
+
+    def set_instrumentation(self, instrumentation: Instrumentation | None) -> None:
+        self._instrumentation = instrumentation
+        if self._dispatcher is not None:
+            self._dispatcher.instrumentation = instrumentation
+
+    def subscribe(
+        self,
+        observer: OrderObserver,
+        events: Iterable[str] | None = None,
+        synchronous: bool | None = None,
+    ) -> None:
+        if events is None:
+            events = observer.events
+        if synchronous is None:
+            synchronous = observer.synchronous
+        self._subscriptions.append((observer, frozenset(events) if events is not None else None, synchronous))
+        self._routes = {}
+
+    def unsubscribe(self, observer: OrderObserver) -> None:
+        self._subscriptions = [entry for entry in self._subscriptions if entry[0] is not observer]
+        self._routes = {}
+
+    def subscribers(self, event: str) -> Tuple[OrderObserver, ...]:
+        inline, deferred = self._route(event)
+        return inline + deferred
+
+    def publish(self, order: Order, event: str) -> None:
+        if self._instrumentation is not None:
+            self._publish_timed(self._instrumentation, order, event)
+            return
+        inline, deferred = self._route(event)
+        for observer in inline:
+            observer.update(order, event)
+        if not deferred:
+            return
+        if self._dispatcher is not None:
+            self._dispatcher.submit(deferred, order, event)
+            return
+        for observer in deferred:
+            observer.update(order, event)
+
+    def _publish_timed(self, instrumentation: Instrumentation, order: Order, event: str) -> None:
+        clock = time.perf_counter_ns
+        started = clock()
+        try:
+            inline, deferred = self._route(event)
+            self._deliver_timed(instrumentation, inline, order, event)
+            if deferred and self._dispatcher is not None:
+                self._dispatcher.submit(deferred, order, event)
+            else:
+                self._deliver_timed(instrumentation, deferred, order, event)
+        finally:
+            instrumentation.record_call("Order.notify", clock() - started)
+
+    def _deliver_timed(
+        self, instrumentation: Instrumentation, observers: Tuple[OrderObserver, ...], order: Order, event: str
+    ) -> None:
+        clock = time.perf_counter_ns
+        for observer in observers:
+            started = clock()
+            try:
+                observer.update(order, event)
+            finally:
+                instrumentation.record_dispatch(observer, clock() - started)
+
+    def _route(self, event: str) -> _Route:
+        route = self._routes.get(event)
+        if route is None:
+            matching = [
+                (observer, synchronous)
+                for observer, events, synchronous in self._subscriptions
+                if events is None or event in events
+            ]
+            route = (
+                tuple(observer for observer, synchronous in matching if synchronous),
+                tuple(observer for observer, synchronous in matching if not synchronous),
+            )
+            self._routes[event] = route
+        return route
+
+
+if TYPE_CHECKING:
+    from ...metrics import Instrumentation
@@ -1,64 +1,137 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, ClassVar, Dict, FrozenSet, Iterable, NamedTuple, Optional, Sequence, Union
 
-from ...models.order import Order
+from ...models.order import (
+    EVENT_CREATED,
+    EVENT_DISCOUNT_CHANGED,
+    EVENT_ITEMS_CHANGED,
+    EVENT_STATUS_CHANGED,
+    Order,
+    OrderStatus,
+)
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+
+EVENT_LEVELS: Dict[str, int] = {
+    EVENT_CREATED: INFO,
+    EVENT_STATUS_CHANGED: INFO,
+    EVENT_ITEMS_CHANGED: DEBUG,
+    EVENT_DISCOUNT_CHANGED: DEBUG,
+}
+
+_ORDER_LIFECYCLE_EVENTS = frozenset({EVENT_CREATED, EVENT_STATUS_CHANGED})
 
 
 def _default_sink(message: str) -> None:
     print(message)
 
 
-class OrderObserver(ABC):
-    @abstractmethod
-    def update(self, order: Order, event: str) -> None:
-        pass
+class OrderEvent(NamedTuple):
+    order: Order
+    event: str
+    status: OrderStatus
 
 
-class KitchenDisplay(OrderObserver):
-    def __init__(self, sink: Callable[[str], None] | None = None) -> None:
-        self._sink = sink or _default_sink
+class OrderMessage:
+    __slots__ = ("_render", "order_id", "status", "event")
 
-    def update(self, order: Order, event: str) -> None:
-        message = self._format_message(order, event)
-        self._sink(f"[КУХНЯ] {message}")
+    def __init__(self, render: Callable[..., str], order_id: int, status: OrderStatus, event: str) -> None:
+        self._render = render
+        self.order_id = order_id
+        self.status = status
+        self.event = event
 
-    def _format_message(self, order: Order, event: str) -> str:
-        if event == "создан":
-            return f"Новый заказ №{order.order_id} создан."
-        if event == "статус_изменен":
-            return f"Заказ №{order.order_id}: статус {order.status.value}."
-        return f"Заказ №{order.order_id}: событие {event}."
+    def render(self) -> str:
+        return self._render(order_id=self.order_id, status=self.status.value, event=self.event)
 
+    def __str__(self) -> str:
+        return self.render()
 
-class CustomerNotifier(OrderObserver):
-    def __init__(self, sink: Callable[[str], None] | None = None) -> None:
-        self._sink = sink or _default_sink
 
+Sink = Callable[[Union[str, OrderMessage]], None]
+
+
+class OrderObserver(ABC):
+    events: Optional[FrozenSet[str]] = None
+    synchronous: bool = False
+
+    @abstractmethod
     def update(self, order: Order, event: str) -> None:
-        message = self._format_message(order, event)
-        self._sink(f"[КЛИЕНТ] {message}")
+        pass
+
+    def update_batch(self, events: Sequence[OrderEvent]) -> None:
+        for entry in events:
+            self.update(entry.order, entry.event)
 
-    def _format_message(self, order: Order, event: str) -> str:
-        if event == "создан":
-            return f"Ваш заказ №{order.order_id} создан."
-        if event == "статус_изменен":
-            return f"Ваш заказ №{order.order_id}: {order.status.value}."
-        return f"Обновление заказа №{order.order_id}: {event}."
 
+class MessageObserver(OrderObserver):
+    prefix: ClassVar[str] = ""
+    templates: ClassVar[Dict[str, str]] = {}
+    fallback_template: ClassVar[str] = "Заказ №{order_id}: событие {event}."
+    events = _ORDER_LIFECYCLE_EVENTS
 
-class Logger(OrderObserver):
-    def __init__(self, sink: Callable[[str], None] | None = None) -> None:
+    def __init__(
+        self,
+        sink: Sink | None = None,
+        events: Iterable[str] | None = None,
+        level: int = INFO,
+    ) -> None:
         self._sink = sink or _default_sink
+        self._structured_sink = getattr(self._sink, "accepts_messages", False)
+        if events is not None:
+            self.events = frozenset(events)
+        self.level = level
+        self._renderers = {event: self._compile(template) for event, template in self.templates.items()}
+        self._fallback = self._compile(self.fallback_template)
 
     def update(self, order: Order, event: str) -> None:
-        message = self._format_message(order, event)
-        self._sink(f"[ЛОГ] {message}")
-
-    def _format_message(self, order: Order, event: str) -> str:
-        if event == "создан":
-            return f"Заказ №{order.order_id} создан."
-        if event == "статус_изменен":
-            return f"Статус заказа №{order.order_id} изменен на {order.status.value}."
-        return f"Заказ №{order.order_id}: событие {event}."
+        if self.enabled_for(event):
+            self._emit(order.order_id, order.status, event)
+
+    def update_batch(self, events: Sequence[OrderEvent]) -> None:
+        for entry in events:
+            if self.enabled_for(entry.event):
+                self._emit(entry.order.order_id, entry.status, entry.event)
+
+    def enabled_for(self, event: str) -> bool:
+        if self.events is not None and event not in self.events:
+            return False
+        return EVENT_LEVELS.get(event, INFO) >= self.level
+
+    def _emit(self, order_id: int, status: OrderStatus, event: str) -> None:
+        message = OrderMessage(self._renderers.get(event, self._fallback), order_id, status, event)
+        self._sink(message if self._structured_sink else message.render())
+
+    def _compile(self, template: str) -> Callable[..., str]:
+        return f"[{self.prefix}] {template}".format
+
+
+class KitchenDisplay(MessageObserver):
+    prefix = "КУХНЯ"
+    templates = {
+        EVENT_CREATED: "Новый заказ №{order_id} создан.",
+        EVENT_STATUS_CHANGED: "Заказ №{order_id}: статус {status}.",
+    }
+
+
+class CustomerNotifier(MessageObserver):
+    prefix = "КЛИЕНТ"
+    templates = {
+        EVENT_CREATED: "Ваш заказ №{order_id} создан.",
+        EVENT_STATUS_CHANGED: "Ваш заказ №{order_id}: {status}.",
+    }
+    fallback_template = "Обновление заказа №{order_id}: {event}."
+
+
+class Logger(MessageObserver):
+    prefix = "ЛОГ"
+    templates = {
+        EVENT_CREATED: "Заказ №{order_id} создан.",
+        EVENT_STATUS_CHANGED: "Статус заказа №{order_id} изменен на {status}.",
+        EVENT_ITEMS_CHANGED: "Заказ №{order_id}: позиции изменены.",
+        EVENT_DISCOUNT_CHANGED: "Заказ №{order_id}: скидка изменена.",
+    }
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import gzip
+import os
+import queue
+import shutil
+import threading
+import time
+from typing import Callable, List, Optional, Union
+
+from .observers import OrderMessage
+
+_ESTIMATED_MESSAGE_BYTES = 64
+
+
+class RotatingFileSink:
+    accepts_messages = True
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        buffer_bytes: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        rotate_daily: bool = True,
+        compress: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = path
+        self._max_bytes = max_bytes
+        self._buffer_bytes = buffer_bytes
+        self._rotate_daily = rotate_daily
+        self._compress = compress
+        self._clock = clock
+        self._buffer: List[Union[str, OrderMessage]] = []
+        self._buffered = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+        self._day = self._day_of(os.path.getmtime(path) if self._size else clock())
+        self._compressor: Optional["queue.SimpleQueue[Optional[str]]"] = None
+        self._compressor_thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, args=(flush_interval,), name="log-sink-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def __call__(self, message: Union[str, OrderMessage]) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._buffer.append(message)
+            self._buffered += len(message) + 1 if isinstance(message, str) else _ESTIMATED_MESSAGE_BYTES
+            if self._buffered >= self._buffer_bytes:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            self._file.close()
+        self._wakeup.set()
+        self._flusher.join()
+        if self._compressor is not None and self._compressor_thread is not None:
+            self._compressor.put(None)
+            self._compressor_thread.join()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        data = ("\n".join(map(str, self._buffer)) + "\n").encode("utf-8")
+        self._buffer.clear()
+        self._buffered = 0
+        day = self._day_of(self._clock())
+        if self._size and (self._size + len(data) > self._max_bytes or (self._rotate_daily and day != self._day)):
+            self._rotate_locked()
+        self._day = day
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _rotate_locked(self) -> None:
+        self._file.close()
+        rotated = self._rotated_name()
+        os.replace(self._path, rotated)
+        self._file = open(self._path, "ab")
+        self._size = 0
+        if self._compress:
+            self._compress_later(rotated)
+
+    def _rotated_name(self) -> str:
+        index = 1
+        while True:
+            candidate = f"{self._path}.{self._day}.{index}"
+            if not os.path.exists(candidate) and not os.path.exists(candidate + ".gz"):
+                return candidate
+            index += 1
+
+    def _compress_later(self, path: str) -> None:
+        if self._compressor is None:
+            self._compressor = queue.SimpleQueue()
+            self._compressor_thread = threading.Thread(
+                target=self._compress_segments, name="log-sink-compressor", daemon=True
+            )
+            self._compressor_thread.start()
+        self._compressor.put(path)
+
+    def _compress_segments(self) -> None:
+        assert self._compressor is not None
+        while True:
+            path = self._compressor.get()
+            if path is None:
+                return
+            with open(path, "rb") as source, gzip.open(path + ".gz", "wb") as target:
+                shutil.copyfileobj(source, target)
+            os.remove(path)
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._wakeup.wait(interval):
+            self.flush()
+
+    @staticmethod
+    def _day_of(timestamp: float) -> str:
+        return time.strftime("%Y%m%d", time.localtime(timestamp))
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 
-from ..models.product import AddOn, Beverage, Dessert, Product
+from ..models.order import add_on_mask
+from ..models.product import ADD_ON_COUNT_LIMIT, AddOn, Beverage, Dessert, Product
 from ..utils import ProductNotFoundError
 
 
@@ -10,21 +11,21 @@ class MenuFactory:
 
     def __init__(self) -> None:
         self._beverages: Dict[str, Beverage] = {
-            "Эспрессо": Beverage("Эспрессо", "напиток", 2.5),
-            "Капучино": Beverage("Капучино", "напиток", 3.5),
-            "Латте": Beverage("Латте", "напиток", 4.0),
+            "Эспрессо": Beverage("Эспрессо", "напиток", 250),
+            "Капучино": Beverage("Капучино", "напиток", 350),
+            "Латте": Beverage("Латте", "напиток", 400),
         }
         self._desserts: Dict[str, Dessert] = {
-            "Чизкейк": Dessert("Чизкейк", "десерт", 4.5),
-            "Круассан": Dessert("Круассан", "десерт", 3.0),
+            "Чизкейк": Dessert("Чизкейк", "десерт", 450),
+            "Круассан": Dessert("Круассан", "десерт", 300),
         }
         self._add_ons: Dict[str, AddOn] = {
-            "Ванильный сироп": AddOn("Ванильный сироп", "добавка", 0.5),
-            "Карамельный сироп": AddOn("Карамельный сироп", "добавка", 0.5),
-            "Кокосовое молоко": AddOn("Кокосовое молоко", "добавка", 0.7),
-            "Миндальное молоко": AddOn("Миндальное молоко", "добавка", 0.7),
-            "Шот эспрессо": AddOn("Шот эспрессо", "добавка", 1.0),
-            "Взбитые сливки": AddOn("Взбитые сливки", "добавка", 0.6),
+            "Ванильный сироп": AddOn("Ванильный сироп", "добавка", 50, slot=0),
+            "Карамельный сироп": AddOn("Карамельный сироп", "добавка", 50, slot=1),
+            "Кокосовое молоко": AddOn("Кокосовое молоко", "добавка", 70, slot=2),
+            "Миндальное молоко": AddOn("Миндальное молоко", "добавка", 70, slot=3),
+            "Шот эспрессо": AddOn("Шот эспрессо", "добавка", 100, slot=4),
+            "Взбитые сливки": AddOn("Взбитые сливки", "добавка", 60, slot=5),
         }
 
     def list_beverages(self) -> List[Beverage]:
@@ -54,6 +55,19 @@ class MenuFactory:
         except KeyError as exc:
             raise ProductNotFoundError(f"Добавка '{name}' не найдена.") from exc
 
+    def add_on_mask(self, names: Iterable[str]) -> int:
+        return add_on_mask([self.get_add_on(name) for name in names])
+
+    def add_ons_from_mask(self, mask: int) -> Tuple[AddOn, ...]:
+        add_ons = tuple(
+            add_on
+            for add_on in self._add_ons.values()
+            for _ in range((mask >> add_on.shift) & ADD_ON_COUNT_LIMIT)
+        )
+        if add_on_mask(add_ons) != mask:
+            raise ProductNotFoundError(f"Маска добавок {mask:#x} не соответствует меню.")
+        return tuple(sorted(add_ons, key=lambda add_on: add_on.get_name()))
+
     def get_product(self, name: str) -> Product:
         if name in self._beverages:
             return self._beverages[name]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from ..models.order import Order
+
+ArchivedItem = Tuple[str, Tuple[str, ...], int]
+
+
+class ArchivedOrder(NamedTuple):
+    order_id: int
+    created_at: float
+    paid_at: float
+    items: Tuple[ArchivedItem, ...]
+    total_cents: int
+    discount_percent: float
+    discount_label: str
+
+
+class OrderArchive:
+    def __init__(self) -> None:
+        self._records: Dict[int, ArchivedOrder] = {}
+        self._add_on_names: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self._labels: Dict[str, str] = {}
+        self._revenue_cents = 0
+
+    @property
+    def revenue_cents(self) -> int:
+        return self._revenue_cents
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, order_id: int) -> bool:
+        return order_id in self._records
+
+    def __iter__(self) -> Iterator[ArchivedOrder]:
+        return iter(self._records.values())
+
+    def get(self, order_id: int) -> Optional[ArchivedOrder]:
+        return self._records.get(order_id)
+
+    def add(self, order: Order) -> ArchivedOrder:
+        return self.add_values(
+            order.order_id,
+            order.created_at,
+            order.paid_at if order.paid_at is not None else order.created_at,
+            ((item.product.get_name(), item.configuration.add_on_names, item.quantity) for item in order.items),
+            order.total,
+            order.discount_percent,
+            order.discount_label,
+        )
+
+    def add_values(
+        self,
+        order_id: int,
+        created_at: float,
+        paid_at: float,
+        items: Iterable[ArchivedItem],
+        total_cents: int,
+        discount_percent: float,
+        discount_label: str,
+    ) -> ArchivedOrder:
+        record = ArchivedOrder(
+            order_id,
+            created_at,
+            paid_at,
+            tuple((product, self._intern(add_ons), quantity) for product, add_ons, quantity in items),
+            total_cents,
+            discount_percent,
+            self._labels.setdefault(discount_label, discount_label),
+        )
+        previous = self._records.get(order_id)
+        if previous is not None:
+            self._revenue_cents -= previous.total_cents
+        self._records[order_id] = record
+        self._revenue_cents += total_cents
+        return record
+
+    def _intern(self, add_on_names: Tuple[str, ...]) -> Tuple[str, ...]:
+        return self._add_on_names.setdefault(add_on_names, add_on_names)
@@ -1,12 +1,44 @@
 from __future__ import annotations
 
-from typing import Dict, List, Sequence
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from ..models.order import Order, OrderItem, OrderStatus
+from ..metrics import Instrumentation
+from ..models.money import apply_discount, percent_to_basis_points
+from ..models.order import EVENT_CREATED, EVENT_STATUS_CHANGED, Order, OrderItem, OrderStatus
 from ..models.product import AddOn, Beverage, Dessert
+from ..patterns.observer.async_dispatcher import AsyncDispatcher
+from ..patterns.observer.event_bus import EventBus
 from ..patterns.observer.observers import CustomerNotifier, KitchenDisplay, Logger, OrderObserver
-from ..utils import InvalidAddOnError, OrderNotFoundError
+from ..storage import OrderRepository, StoredOrder
+from ..utils import InvalidAddOnError, OrderNotFoundError, OrderStateError
 from .menu_factory import MenuFactory
+from .order_archive import ArchivedOrder, OrderArchive
+from .status_index import StatusIndex
+
+ACTIVE_STATUSES = (OrderStatus.CREATED, OrderStatus.PREPARING, OrderStatus.READY)
+INSTRUMENTED_METHODS = (
+    "create_order",
+    "get_order",
+    "list_active_orders",
+    "list_orders_by_status",
+    "archive_paid_orders",
+    "add_menu_item",
+    "add_menu_line",
+    "increment_item",
+    "decrement_item",
+    "remove_item",
+    "remove_line",
+    "set_discount",
+    "calculate_total",
+    "change_order_status",
+    "list_order_items",
+    "list_order_line_names",
+    "get_order_items",
+    "get_order_lines",
+)
 
 
 class OrderService:
@@ -14,16 +46,66 @@ class OrderService:
         self,
         menu_factory: MenuFactory | None = None,
         observers: Sequence[OrderObserver] | None = None,
+        verify_totals: bool = False,
+        archive_after: float | None = None,
+        repository: OrderRepository | None = None,
+        dispatcher: AsyncDispatcher | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         self._menu_factory = menu_factory or MenuFactory()
         self._orders: Dict[int, Order] = {}
+        self._order_locks: Dict[int, threading.RLock] = {}
         self._next_id = 1
+        self._id_lock = threading.Lock()
+        self._archive_lock = threading.Lock()
+        self._status_index = StatusIndex()
+        self._event_bus = EventBus(dispatcher)
+        self._event_bus.subscribe(self._status_index, [EVENT_STATUS_CHANGED], synchronous=True)
+        self._verify_totals = verify_totals
+        self._archive = OrderArchive()
+        self._archive_after = archive_after
         if observers is None:
             observers = [KitchenDisplay(), CustomerNotifier(), Logger()]
-        self._observers = list(observers)
+        self._observers: List[OrderObserver] = []
+        self.set_observers(observers)
+        self._repository = repository
+        if repository is not None:
+            self._load_from_repository(repository)
+        self._instrumentation: Instrumentation | None = None
+        if instrumentation is not None:
+            self.set_instrumentation(instrumentation)
+
+    @property
+    def event_bus(self) -> EventBus:
+        return self._event_bus
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        return self._instrumentation
+
+    def set_instrumentation(self, instrumentation: Instrumentation | None) -> None:
+        for name in INSTRUMENTED_METHODS:
+            self.__dict__.pop(name, None)
+        self._instrumentation = instrumentation
+        self._event_bus.set_instrumentation(instrumentation)
+        if instrumentation is None:
+            return
+        prefix = type(self).__name__
+        for name in INSTRUMENTED_METHODS:
+            setattr(self, name, instrumentation.wrap(f"{prefix}.{name}", getattr(self, name)))
 
     def set_observers(self, observers: Sequence[OrderObserver]) -> None:
+        for observer in self._observers:
+            self._event_bus.unsubscribe(observer)
         self._observers = list(observers)
+        for observer in self._observers:
+            self._event_bus.subscribe(observer)
+
+    def subscribe(self, observer: OrderObserver, events: Sequence[str] | None = None) -> None:
+        self._event_bus.subscribe(observer, events)
+
+    def unsubscribe(self, observer: OrderObserver) -> None:
+        self._event_bus.unsubscribe(observer)
 
     def list_beverages(self) -> List[Beverage]:
         return self._menu_factory.list_beverages()
@@ -35,29 +117,229 @@ class OrderService:
         return self._menu_factory.list_add_ons()
 
     def list_active_orders(self) -> List[Order]:
-        return [order for order in self._orders.values() if order.status != OrderStatus.PAID]
+        return self._status_index.orders(ACTIVE_STATUSES)
+
+    def list_orders_by_status(self, status: OrderStatus) -> List[Order]:
+        return self._status_index.orders((status,))
+
+    @property
+    def archived_count(self) -> int:
+        return len(self._archive)
+
+    @property
+    def archived_revenue(self) -> int:
+        return self._archive.revenue_cents
 
     def create_order(self) -> Order:
-        order = Order(self._next_id)
-        self._next_id += 1
-        for observer in self._observers:
-            order.add_observer(observer)
-        self._orders[order.order_id] = order
-        order.notify("создан")
+        self._archive_paid()
+        order = Order(self._allocate_id())
+        lock = threading.RLock()
+        with lock:
+            self._register(order, lock)
+            if self._repository is not None:
+                self._repository.save_order(order)
+            order.notify(EVENT_CREATED)
         return order
 
+    def _allocate_id(self) -> int:
+        with self._id_lock:
+            order_id = self._next_id
+            self._next_id += 1
+        return order_id
+
+    def _register(self, order: Order, lock: threading.RLock | None = None) -> None:
+        order.set_event_bus(self._event_bus)
+        self._order_locks[order.order_id] = lock or threading.RLock()
+        self._orders[order.order_id] = order
+        self._status_index.add(order)
+
+    @contextmanager
+    def _locked_order(self, order_id: int) -> Iterator[Order]:
+        lock = self._order_locks.get(order_id)
+        if lock is None:
+            self._get_live_order(order_id)
+            raise OrderNotFoundError(f"Заказ '{order_id}' не найден.")
+        with lock:
+            yield self._get_live_order(order_id)
+
+    def _load_from_repository(self, repository: OrderRepository) -> None:
+        prototypes: Dict[Tuple[str, Tuple[str, ...]], OrderItem] = {}
+        cutoff = self._archive_cutoff()
+        for stored in repository.load_archived():
+            self._next_id = max(self._next_id, stored.order_id + 1)
+            self._archive_stored(stored, prototypes)
+        restored: List[Order] = []
+        archived: List[int] = []
+        for stored in repository.load_orders():
+            self._next_id = max(self._next_id, stored.order_id + 1)
+            if (
+                cutoff is not None
+                and stored.status == OrderStatus.PAID.value
+                and stored.paid_at is not None
+                and stored.paid_at <= cutoff
+            ):
+                self._archive_stored(stored, prototypes)
+                archived.append(stored.order_id)
+                continue
+            order = Order.restore(
+                stored.order_id,
+                OrderStatus(stored.status),
+                self._build_lines(stored.lines, prototypes),
+                stored.discount_percent,
+                stored.discount_label,
+                stored.created_at,
+                stored.paid_at,
+            )
+            restored.append(order)
+        restored.sort(key=_paid_first_order)
+        for order in restored:
+            self._register(order)
+        if archived:
+            repository.archive(archived)
+        self._next_id = max(self._next_id, repository.next_order_id())
+
+    def _archive_stored(
+        self, stored: StoredOrder, prototypes: Dict[Tuple[str, Tuple[str, ...]], OrderItem]
+    ) -> None:
+        items = [
+            (product_name, tuple(add_on_names), quantity)
+            for _, product_name, add_on_names, quantity in stored.lines
+        ]
+        subtotal = sum(
+            self._prototype(product_name, add_on_names, prototypes).get_unit_price() * quantity
+            for product_name, add_on_names, quantity in items
+        )
+        self._archive.add_values(
+            stored.order_id,
+            stored.created_at,
+            stored.paid_at if stored.paid_at is not None else stored.created_at,
+            items,
+            apply_discount(subtotal, percent_to_basis_points(stored.discount_percent)),
+            stored.discount_percent,
+            stored.discount_label,
+        )
+
     def get_order(self, order_id: int) -> Order:
+        return self._find_order(order_id)
+
+    def _find_order(self, order_id: int) -> Order:
+        order = self._orders.get(order_id)
+        if order is not None:
+            return order
+        record = self._archive.get(order_id)
+        if record is not None:
+            return self._restore_archived(record)
+        raise OrderNotFoundError(f"Заказ '{order_id}' не найден.")
+
+    def archive_paid_orders(self, now: float | None = None) -> int:
+        return self._archive_paid(now)
+
+    def _archive_paid(self, now: float | None = None) -> int:
+        cutoff = self._archive_cutoff(now)
+        if cutoff is None or not self._archive_lock.acquire(blocking=False):
+            return 0
+        archived: List[int] = []
         try:
-            return self._orders[order_id]
-        except KeyError as exc:
-            raise OrderNotFoundError(f"Заказ '{order_id}' не найден.") from exc
+            while True:
+                order = self._status_index.oldest(OrderStatus.PAID)
+                if order is None or (order.paid_at is not None and order.paid_at > cutoff):
+                    break
+                with self._order_locks[order.order_id]:
+                    if order.status != OrderStatus.PAID:
+                        continue
+                    self._archive.add(order)
+                    self._status_index.remove(order)
+                    del self._orders[order.order_id]
+                    del self._order_locks[order.order_id]
+                    order.set_event_bus(None)
+                archived.append(order.order_id)
+            if archived and self._repository is not None:
+                self._repository.archive(archived)
+        finally:
+            self._archive_lock.release()
+        return len(archived)
+
+    def _archive_cutoff(self, now: float | None = None) -> float | None:
+        if self._archive_after is None:
+            return None
+        return (time.time() if now is None else now) - self._archive_after
+
+    def _get_live_order(self, order_id: int) -> Order:
+        order = self._orders.get(order_id)
+        if order is not None:
+            return order
+        if order_id in self._archive:
+            raise OrderStateError(f"Заказ №{order_id} перенесен в архив и не может быть изменен.")
+        raise OrderNotFoundError(f"Заказ '{order_id}' не найден.")
+
+    def _restore_archived(self, record: ArchivedOrder) -> Order:
+        lines = self._build_lines(
+            (line_id, product_name, add_on_names, quantity)
+            for line_id, (product_name, add_on_names, quantity) in enumerate(record.items, start=1)
+        )
+        return Order.restore(
+            record.order_id,
+            OrderStatus.PAID,
+            lines,
+            record.discount_percent,
+            record.discount_label,
+            record.created_at,
+            record.paid_at,
+        )
+
+    def _build_lines(
+        self,
+        rows: Iterable[Tuple[int, str, Sequence[str], int]],
+        prototypes: Dict[Tuple[str, Tuple[str, ...]], OrderItem] | None = None,
+    ) -> List[Tuple[int, OrderItem]]:
+        prototypes = {} if prototypes is None else prototypes
+        lines = []
+        for line_id, product_name, add_on_names, quantity in rows:
+            prototype = self._prototype(product_name, add_on_names, prototypes)
+            lines.append((line_id, prototype if quantity == 1 else prototype.with_quantity(quantity)))
+        return lines
+
+    def _prototype(
+        self,
+        product_name: str,
+        add_on_names: Sequence[str],
+        prototypes: Dict[Tuple[str, Tuple[str, ...]], OrderItem],
+    ) -> OrderItem:
+        key = (product_name, tuple(add_on_names))
+        prototype = prototypes.get(key)
+        if prototype is None:
+            prototype = OrderItem.of(
+                self._menu_factory.get_product(product_name),
+                [self._menu_factory.get_add_on(name) for name in add_on_names],
+            )
+            prototypes[key] = prototype
+        return prototype
 
     def add_menu_item(
         self,
         order_id: int,
         product_name: str,
         add_on_names: Sequence[str] | None = None,
+        quantity: int = 1,
     ) -> OrderItem:
+        return self._add_menu_line(order_id, product_name, add_on_names, quantity)[1]
+
+    def add_menu_line(
+        self,
+        order_id: int,
+        product_name: str,
+        add_on_names: Sequence[str] | None = None,
+        quantity: int = 1,
+    ) -> Tuple[int, OrderItem]:
+        return self._add_menu_line(order_id, product_name, add_on_names, quantity)
+
+    def _add_menu_line(
+        self,
+        order_id: int,
+        product_name: str,
+        add_on_names: Sequence[str] | None,
+        quantity: int,
+    ) -> Tuple[int, OrderItem]:
         add_on_names = add_on_names or []
         product = self._menu_factory.get_product(product_name)
         if isinstance(product, AddOn):
@@ -65,34 +347,84 @@ class OrderService:
         add_ons = [self._menu_factory.get_add_on(name) for name in add_on_names]
         if isinstance(product, Dessert) and add_ons:
             raise InvalidAddOnError("Добавки можно применять только к напиткам.")
-        item = OrderItem(product=product, add_ons=add_ons)
-        order = self.get_order(order_id)
-        order.add_item(item)
-        return item
+        item = OrderItem.of(product, add_ons, quantity)
+        with self._locked_order(order_id) as order:
+            line_id = order.add_item(item)
+            line = order.get_line(line_id)
+            self._save_line(order_id, line_id, line)
+        return line_id, line
+
+    def increment_item(self, order_id: int, line_id: int, count: int = 1) -> OrderItem:
+        with self._locked_order(order_id) as order:
+            line = order.increment_item(line_id, count)
+            self._save_line(order_id, line_id, line)
+        return line
+
+    def decrement_item(self, order_id: int, line_id: int, count: int = 1) -> Optional[OrderItem]:
+        with self._locked_order(order_id) as order:
+            return self._decrement(order, line_id, count)
+
+    def _decrement(self, order: Order, line_id: int, count: int) -> Optional[OrderItem]:
+        line = order.decrement_item(line_id, count)
+        self._save_line(order.order_id, line_id, line)
+        return line
 
     def remove_item(self, order_id: int, index: int) -> None:
-        order = self.get_order(order_id)
-        order.remove_item(index)
+        with self._locked_order(order_id) as order:
+            self._decrement(order, order.line_id_at(index), 1)
+
+    def remove_line(self, order_id: int, line_id: int) -> None:
+        with self._locked_order(order_id) as order:
+            order.remove_line(line_id)
+            self._save_line(order_id, line_id, None)
 
     def set_discount(self, order_id: int, percent: float, label: str) -> None:
-        order = self.get_order(order_id)
-        order.set_discount(percent, label)
+        with self._locked_order(order_id) as order:
+            order.set_discount(percent, label)
+            if self._repository is not None:
+                self._repository.save_order(order)
 
-    def calculate_total(self, order_id: int) -> float:
-        order = self.get_order(order_id)
-        subtotal = sum(item.get_price() for item in order.items)
-        total = subtotal * (1 - order.discount_percent / 100)
-        order.total = total
-        return total
+    def calculate_total(self, order_id: int) -> int:
+        if not self._verify_totals:
+            return self._find_order(order_id).total
+        lock = self._order_locks.get(order_id)
+        with lock if lock is not None else nullcontext():
+            order = self._find_order(order_id)
+            expected = apply_discount(order.recalculate_subtotal(), percent_to_basis_points(order.discount_percent))
+            if order.total != expected:
+                raise OrderStateError(
+                    f"Сумма заказа №{order_id} расходится с пересчетом: {order.total} != {expected}."
+                )
+            return order.total
 
     def change_order_status(self, order_id: int, new_status: OrderStatus) -> None:
-        order = self.get_order(order_id)
-        order.set_status(new_status)
+        with self._locked_order(order_id) as order:
+            order.set_status(new_status)
+            if self._repository is not None:
+                self._repository.save_order(order)
+        self._archive_paid()
+
+    def _save_line(self, order_id: int, line_id: int, line: OrderItem | None) -> None:
+        if self._repository is not None:
+            self._repository.save_line(order_id, line_id, line)
 
     def list_order_items(self, order_id: int) -> List[str]:
-        order = self.get_order(order_id)
-        return [item.get_name() for item in order.items]
+        order = self._find_order(order_id)
+        return [item.get_display_name() for item in order.items]
+
+    def list_order_line_names(self, order_id: int) -> List[Tuple[int, str]]:
+        order = self._find_order(order_id)
+        return [(line_id, item.get_display_name()) for line_id, item in order.lines]
 
     def get_order_items(self, order_id: int) -> List[OrderItem]:
-        order = self.get_order(order_id)
+        order = self._find_order(order_id)
         return list(order.items)
+
+    def get_order_lines(self, order_id: int) -> List[Tuple[int, OrderItem]]:
+        order = self._find_order(order_id)
+        return order.lines
+
+
+def _paid_first_order(order: Order) -> Tuple[float, int]:
+    return (order.paid_at if order.paid_at is not None else 0.0, order.order_id)
+
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import multiprocessing
+import pickle
+import threading
+from multiprocessing.connection import Connection
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..models.order import Order, OrderItem, OrderStatus
+from ..models.product import AddOn, Beverage, Dessert
+from ..utils import CoffeeOrderError, OrderNotFoundError
+from .menu_factory import MenuFactory
+from .order_service import OrderService
+
+DEFAULT_BLOCK_SIZE = 1024
+
+Call = Tuple[str, Tuple[Any, ...]]
+
+_SHARD_METHODS = frozenset(
+    {
+        "create_order",
+        "get_order",
+        "list_active_orders",
+        "list_orders_by_status",
+        "archived_count",
+        "add_menu_item",
+        "add_menu_line",
+        "increment_item",
+        "decrement_item",
+        "remove_item",
+        "remove_line",
+        "set_discount",
+        "calculate_total",
+        "change_order_status",
+        "archive_paid_orders",
+        "list_order_items",
+        "list_order_line_names",
+        "get_order_items",
+        "get_order_lines",
+    }
+)
+
+
+def shard_of(order_id: int, shards: int, block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+    return ((order_id - 1) // block_size) % shards
+
+
+class ShardOrderService(OrderService):
+    def __init__(self, shard: int, shards: int, block_size: int = DEFAULT_BLOCK_SIZE, **kwargs: Any) -> None:
+        self._shard = shard
+        self._shards = shards
+        self._block_size = block_size
+        super().__init__(**kwargs)
+
+    def _allocate_id(self) -> int:
+        with self._id_lock:
+            order_id = self._next_id
+            block = (order_id - 1) // self._block_size
+            owned = block + (self._shard - block) % self._shards
+            if owned != block:
+                order_id = owned * self._block_size + 1
+            self._next_id = order_id + 1
+        return order_id
+
+
+def _detach(value: Any) -> Any:
+    if isinstance(value, Order):
+        return Order.restore(
+            value.order_id,
+            value.status,
+            value.lines,
+            value.discount_percent,
+            value.discount_label,
+            value.created_at,
+            value.paid_at,
+        )
+    if isinstance(value, list) and value and isinstance(value[0], Order):
+        return [_detach(order) for order in value]
+    return value
+
+
+def _serve_shard(
+    connection: Connection, shard: int, shards: int, block_size: int, options: Dict[str, Any]
+) -> None:
+    service = ShardOrderService(shard, shards, block_size, observers=[], **options)
+    while True:
+        batch = connection.recv()
+        if batch is None:
+            break
+        results = []
+        for method, args in batch:
+            try:
+                if method not in _SHARD_METHODS:
+                    raise CoffeeOrderError(f"Метод '{method}' недоступен в шарде.")
+                attribute = getattr(service, method)
+                results.append((True, _detach(attribute(*args) if callable(attribute) else attribute)))
+            except Exception as exc:
+                results.append((False, _portable(exc)))
+        connection.send(results)
+    connection.close()
+
+
+def _portable(exc: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return CoffeeOrderError(f"Ошибка в шарде: {type(exc).__name__}: {exc}")
+    return exc
+
+
+class _Shard:
+    def __init__(self, connection: Connection, process: multiprocessing.process.BaseProcess) -> None:
+        self.connection = connection
+        self.process = process
+        self.lock = threading.Lock()
+
+
+class ShardedOrderService:
+    def __init__(
+        self,
+        shards: int = 2,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        menu_factory: MenuFactory | None = None,
+        verify_totals: bool = False,
+        archive_after: float | None = None,
+    ) -> None:
+        if shards < 1 or block_size < 1:
+            raise ValueError("Число шардов и размер блока идентификаторов должны быть положительными.")
+        self._menu_factory = menu_factory or MenuFactory()
+        self._block_size = block_size
+        self._round_robin = itertools.cycle(range(shards))
+        self._round_robin_lock = threading.Lock()
+        options = {"verify_totals": verify_totals, "archive_after": archive_after}
+        self._shards: List[_Shard] = []
+        for shard in range(shards):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve_shard,
+                args=(child, shard, shards, block_size, options),
+                name=f"order-shard-{shard}",
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._shards.append(_Shard(parent, process))
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    def shard_of(self, order_id: int) -> int:
+        return shard_of(order_id, len(self._shards), self._block_size)
+
+    def close(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.connection.send(None)
+                shard.connection.close()
+        for shard in self._shards:
+            shard.process.join()
+        self._shards = []
+
+    def __enter__(self) -> ShardedOrderService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def call_many(self, calls: Sequence[Tuple[int, str, Tuple[Any, ...]]]) -> List[Any]:
+        batches: Dict[int, List[Tuple[int, Call]]] = {}
+        for position, (order_id, method, args) in enumerate(calls):
+            batches.setdefault(self.shard_of(order_id), []).append((position, (method, (order_id, *args))))
+        outcomes = self._scatter({shard: [call for _, call in batch] for shard, batch in batches.items()})
+        results: List[Any] = [None] * len(calls)
+        for shard, batch in batches.items():
+            for (position, _), (_, value) in zip(batch, outcomes[shard]):
+                results[position] = value
+        return results
+
+    def list_beverages(self) -> List[Beverage]:
+        return self._menu_factory.list_beverages()
+
+    def list_desserts(self) -> List[Dessert]:
+        return self._menu_factory.list_desserts()
+
+    def list_add_ons(self) -> List[AddOn]:
+        return self._menu_factory.list_add_ons()
+
+    def create_order(self) -> Order:
+        with self._round_robin_lock:
+            shard = next(self._round_robin)
+        return self._call(shard, "create_order")
+
+    def get_order(self, order_id: int) -> Order:
+        return self._call_order(order_id, "get_order")
+
+    def list_active_orders(self) -> List[Order]:
+        return self._gather("list_active_orders")
+
+    def list_orders_by_status(self, status: OrderStatus) -> List[Order]:
+        return self._gather("list_orders_by_status", status)
+
+    @property
+    def archived_count(self) -> int:
+        outcomes = self._scatter({shard: [("archived_count", ())] for shard in range(len(self._shards))})
+        return sum(_unwrap(results[0]) for results in outcomes.values())
+
+    def add_menu_item(
+        self,
+        order_id: int,
+        product_name: str,
+        add_on_names: Sequence[str] | None = None,
+        quantity: int = 1,
+    ) -> OrderItem:
+        return self._call_order(order_id, "add_menu_item", product_name, add_on_names, quantity)
+
+    def add_menu_line(
+        self,
+        order_id: int,
+        product_name: str,
+        add_on_names: Sequence[str] | None = None,
+        quantity: int = 1,
+    ) -> Tuple[int, OrderItem]:
+        return self._call_order(order_id, "add_menu_line", product_name, add_on_names, quantity)
+
+    def increment_item(self, order_id: int, line_id: int, count: int = 1) -> OrderItem:
+        return self._call_order(order_id, "increment_item", line_id, count)
+
+    def decrement_item(self, order_id: int, line_id: int, count: int = 1) -> Optional[OrderItem]:
+        return self._call_order(order_id, "decrement_item", line_id, count)
+
+    def remove_item(self, order_id: int, index: int) -> None:
+        self._call_order(order_id, "remove_item", index)
+
+    def remove_line(self, order_id: int, line_id: int) -> None:
+        self._call_order(order_id, "remove_line", line_id)
+
+    def set_discount(self, order_id: int, percent: float, label: str) -> None:
+        self._call_order(order_id, "set_discount", percent, label)
+
+    def calculate_total(self, order_id: int) -> int:
+        return self._call_order(order_id, "calculate_total")
+
+    def change_order_status(self, order_id: int, new_status: OrderStatus) -> None:
+        self._call_order(order_id, "change_order_status", new_status)
+
+    def archive_paid_orders(self, now: float | None = None) -> int:
+        outcomes = self._scatter({shard: [("archive_paid_orders", (now,))] for shard in range(len(self._shards))})
+        return sum(_unwrap(results[0]) for results in outcomes.values())
+
+    def list_order_items(self, order_id: int) -> List[str]:
+        return self._call_order(order_id, "list_order_items")
+
+    def list_order_line_names(self, order_id: int) -> List[Tuple[int, str]]:
+        return self._call_order(order_id, "list_order_line_names")
+
+    def get_order_items(self, order_id: int) -> List[OrderItem]:
+        return self._call_order(order_id, "get_order_items")
+
+    def get_order_lines(self, order_id: int) -> List[Tuple[int, OrderItem]]:
+        return self._call_order(order_id, "get_order_lines")
+
+    def _call_order(self, order_id: int, method: str, *args: Any) -> Any:
+        if not isinstance(order_id, int) or order_id < 1:
+            raise OrderNotFoundError(f"Заказ '{order_id}' не найден.")
+        return self._call(self.shard_of(order_id), method, order_id, *args)
+
+    def _call(self, shard: int, method: str, *args: Any) -> Any:
+        return _unwrap(self._scatter({shard: [(method, args)]})[shard][0])
+
+    def _gather(self, method: str, *args: Any) -> List[Order]:
+        outcomes = self._scatter({shard: [(method, args)] for shard in range(len(self._shards))})
+        return list(
+            heapq.merge(*(_unwrap(results[0]) for results in outcomes.values()), key=attrgetter("order_id"))
+        )
+
+    def _scatter(self, batches: Dict[int, List[Call]]) -> Dict[int, List[Tuple[bool, Any]]]:
+        shards = sorted(batches)
+        for shard in shards:
+            self._shards[shard].lock.acquire()
+        try:
+            for shard in shards:
+                self._shards[shard].connection.send(batches[shard])
+            return {shard: self._shards[shard].connection.recv() for shard in shards}
+        finally:
+            for shard in shards:
+                self._shards[shard].lock.release()
+
+
+def _unwrap(outcome: Tuple[bool, Any]) -> Any:
+    ok, value = outcome
+    if not ok:
+        raise value
+    return value
+
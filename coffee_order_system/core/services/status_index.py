@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import threading
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional
+
+from ..models.order import EVENT_STATUS_CHANGED, Order, OrderStatus
+from ..patterns.observer.observers import OrderObserver
+
+
+class StatusIndex(OrderObserver):
+    def __init__(self) -> None:
+        self._buckets: Dict[OrderStatus, Dict[int, Order]] = {status: {} for status in OrderStatus}
+        self._statuses: Dict[int, OrderStatus] = {}
+        self._lock = threading.Lock()
+
+    def add(self, order: Order) -> None:
+        with self._lock:
+            self._buckets[order.status][order.order_id] = order
+            self._statuses[order.order_id] = order.status
+
+    def remove(self, order: Order) -> None:
+        with self._lock:
+            status = self._statuses.pop(order.order_id, None)
+            if status is not None:
+                del self._buckets[status][order.order_id]
+
+    def update(self, order: Order, event: str) -> None:
+        if event != EVENT_STATUS_CHANGED:
+            return
+        with self._lock:
+            previous = self._statuses.get(order.order_id)
+            if previous is None or previous == order.status:
+                return
+            del self._buckets[previous][order.order_id]
+            self._buckets[order.status][order.order_id] = order
+            self._statuses[order.order_id] = order.status
+
+    def count(self, status: OrderStatus) -> int:
+        return len(self._buckets[status])
+
+    def oldest(self, status: OrderStatus) -> Optional[Order]:
+        with self._lock:
+            return next(iter(self._buckets[status].values()), None)
+
+    def orders(self, statuses: Iterable[OrderStatus]) -> List[Order]:
+        result: List[Order] = []
+        with self._lock:
+            for status in statuses:
+                result.extend(self._buckets[status].values())
+        result.sort(key=attrgetter("order_id"))
+        return result
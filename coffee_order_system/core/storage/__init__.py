@@ -0,0 +1,11 @@
+from .base import InMemoryOrderRepository, OrderRepository, StoredOrder
+from .journal import JournalOrderRepository
+from .sqlite_repository import SqliteOrderRepository
+
+__all__ = [
+    "InMemoryOrderRepository",
+    "JournalOrderRepository",
+    "OrderRepository",
+    "SqliteOrderRepository",
+    "StoredOrder",
+]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..models.order import Order, OrderItem
+
+StoredLine = Tuple[int, str, Tuple[str, ...], int]
+
+
+class StoredOrder(NamedTuple):
+    order_id: int
+    status: str
+    discount_percent: float
+    discount_label: str
+    created_at: float
+    paid_at: Optional[float]
+    lines: Tuple[StoredLine, ...]
+
+
+def order_row(order: Order) -> Tuple[int, str, float, str, float, Optional[float]]:
+    return (
+        order.order_id,
+        order.status.value,
+        order.discount_percent,
+        order.discount_label,
+        order.created_at,
+        order.paid_at,
+    )
+
+
+def line_row(item: OrderItem) -> Tuple[str, Tuple[str, ...], int]:
+    return item.product.get_name(), item.configuration.add_on_names, item.quantity
+
+
+class OrderRepository(ABC):
+    @abstractmethod
+    def save_order(self, order: Order) -> None:
+        pass
+
+    @abstractmethod
+    def save_line(self, order_id: int, line_id: int, item: OrderItem | None) -> None:
+        pass
+
+    @abstractmethod
+    def load_orders(self) -> List[StoredOrder]:
+        pass
+
+    def archive(self, order_ids: Sequence[int]) -> None:
+        pass
+
+    def load_archived(self) -> List[StoredOrder]:
+        return []
+
+    def next_order_id(self) -> int:
+        return 1
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class InMemoryOrderRepository(OrderRepository):
+    def __init__(self) -> None:
+        self._orders: Dict[int, Tuple[int, str, float, str, float, Optional[float]]] = {}
+        self._lines: Dict[int, Dict[int, Tuple[str, Tuple[str, ...], int]]] = {}
+
+    def save_order(self, order: Order) -> None:
+        self._orders[order.order_id] = order_row(order)
+        self._lines.setdefault(order.order_id, {})
+
+    def save_line(self, order_id: int, line_id: int, item: OrderItem | None) -> None:
+        lines = self._lines.setdefault(order_id, {})
+        if item is None:
+            lines.pop(line_id, None)
+        else:
+            lines[line_id] = line_row(item)
+
+    def load_orders(self) -> List[StoredOrder]:
+        return [
+            StoredOrder(
+                *row,
+                tuple((line_id, *line) for line_id, line in self._lines.get(order_id, {}).items()),
+            )
+            for order_id, row in sorted(self._orders.items())
+        ]
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import glob
+import json
+import os
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..models.order import Order, OrderItem, OrderStatus
+from ..utils import StorageError
+from .base import OrderRepository, StoredOrder, line_row
+
+JOURNAL_FILE = "journal.log"
+SNAPSHOT_FILE = "snapshot.json"
+ARCHIVE_FILE = "archive.log"
+SEALED_JOURNAL_PATTERN = "journal.*.log"
+
+_DEFAULT_ORDER = (OrderStatus.CREATED.value, 0.0, "обычный", None)
+
+
+def _encode(record: List[Any]) -> bytes:
+    payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def _decode(line: bytes) -> Optional[List[Any]]:
+    if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload):
+            return None
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+
+def _checksum_ok(data: bytes, start: int, end: int) -> bool:
+    if end - start < 10 or data[start + 8 : start + 9] != b" ":
+        return False
+    try:
+        return int(data[start : start + 8], 16) == zlib.crc32(data[start + 9 : end])
+    except ValueError:
+        return False
+
+
+class JournalOrderRepository(OrderRepository):
+    def __init__(
+        self,
+        directory: str,
+        fsync_interval: float = 0.05,
+        batch_size: int = 256,
+        snapshot_every: int = 10000,
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._journal_path = os.path.join(directory, JOURNAL_FILE)
+        self._snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self._archive_path = os.path.join(directory, ARCHIVE_FILE)
+        self._fsync_interval = fsync_interval
+        self._batch_size = batch_size
+        self._snapshot_every = snapshot_every
+        self._orders: Dict[int, List[Any]] = {}
+        self._lines: Dict[int, Dict[int, Tuple[str, Tuple[str, ...], int]]] = {}
+        self._archiving: List[List[Any]] = []
+        self._archived_ids: Set[int] = set()
+        self._next_order_id = 1
+        self._buffer: List[bytes] = []
+        self._records_since_snapshot = 0
+        self._snapshot_due = False
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._closed = False
+        self._last_sync = time.monotonic()
+        self.replayed_records = 0
+        self.discarded_bytes = 0
+        self.archived_orders = 0
+        self.last_error: BaseException | None = None
+        covered = self._load_snapshot()
+        self._generation = self._replay_sealed(covered) + 1
+        self._replay_journal(self._journal_path)
+        self._records_since_snapshot = self.replayed_records
+        self._file = open(self._journal_path, "ab")
+        self._wakeup = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="order-journal-flusher", daemon=True)
+        self._flusher.start()
+
+    def save_order(self, order: Order) -> None:
+        order_id = order.order_id
+        with self._lock:
+            current = self._orders.get(order_id)
+            records: List[List[Any]] = []
+            if current is None:
+                self._reject_archived(order_id)
+                records.append(["c", order_id, order.created_at])
+                current = [*_DEFAULT_ORDER]
+            if current[1] != order.discount_percent or current[2] != order.discount_label:
+                records.append(["d", order_id, order.discount_percent, order.discount_label])
+            if current[0] != order.status.value or current[3] != order.paid_at:
+                records.append(["s", order_id, order.status.value, order.paid_at])
+            self._append_locked(records)
+
+    def save_line(self, order_id: int, line_id: int, item: OrderItem | None) -> None:
+        if item is None:
+            record = ["x", order_id, line_id]
+        else:
+            product, add_ons, quantity = line_row(item)
+            record = ["l", order_id, line_id, product, add_ons, quantity]
+        with self._lock:
+            self._reject_archived(order_id)
+            self._append_locked([record])
+
+    def archive(self, order_ids: Sequence[int]) -> None:
+        with self._lock:
+            for order_id in order_ids:
+                if order_id not in self._orders:
+                    raise StorageError(f"Нельзя перенести в архив неизвестный заказ №{order_id}.")
+            self._append_locked([["a", order_id] for order_id in order_ids])
+
+    def load_orders(self) -> List[StoredOrder]:
+        with self._lock:
+            return [
+                StoredOrder(
+                    order_id,
+                    status,
+                    discount_percent,
+                    discount_label,
+                    created_at,
+                    paid_at,
+                    tuple((line_id, *line) for line_id, line in self._lines.get(order_id, {}).items()),
+                )
+                for order_id, (status, discount_percent, discount_label, paid_at, created_at) in sorted(
+                    self._orders.items()
+                )
+            ]
+
+    def load_archived(self) -> List[StoredOrder]:
+        records: List[List[Any]] = []
+        if os.path.exists(self._archive_path):
+            with open(self._archive_path, "rb") as handle:
+                records.extend(record for record in map(_decode, handle) if record is not None)
+        with self._lock:
+            records.extend(self._archiving)
+        archived: Dict[int, StoredOrder] = {}
+        for order_id, status, discount_percent, discount_label, paid_at, created_at, lines in records:
+            archived[order_id] = StoredOrder(
+                order_id,
+                status,
+                discount_percent,
+                discount_label,
+                created_at,
+                paid_at,
+                tuple((line_id, product, tuple(add_ons), quantity) for line_id, product, add_ons, quantity in lines),
+            )
+        with self._lock:
+            self._archived_ids.update(archived)
+        return [archived[order_id] for order_id in sorted(archived)]
+
+    def next_order_id(self) -> int:
+        with self._lock:
+            return self._next_order_id
+
+    def flush(self) -> None:
+        with self._lock:
+            self._sync_locked()
+
+    def snapshot(self) -> None:
+        with self._snapshot_lock:
+            with self._lock:
+                sealed = self._seal_locked()
+            self._write_snapshot(*sealed)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._flusher.join()
+        if self._snapshot_due:
+            self.snapshot()
+        with self._lock:
+            self._sync_locked()
+            self._file.close()
+
+    def _append_locked(self, records: List[List[Any]]) -> None:
+        if self._closed:
+            raise StorageError("Журнал заказов закрыт.")
+        for record in records:
+            self._apply(record)
+            self._buffer.append(_encode(record))
+        self._records_since_snapshot += len(records)
+        if len(self._buffer) >= self._batch_size:
+            self._sync_locked()
+        if self._records_since_snapshot >= self._snapshot_every and not self._snapshot_due:
+            self._snapshot_due = True
+            self._wakeup.set()
+
+    def _reject_archived(self, order_id: int) -> None:
+        if order_id in self._archived_ids:
+            raise StorageError(f"Заказ №{order_id} перенесен в архив и не может быть изменен.")
+
+    def _apply(self, record: List[Any]) -> None:
+        kind, order_id = record[0], record[1]
+        if kind == "c":
+            self._orders.setdefault(order_id, [*_DEFAULT_ORDER, record[2]])
+            self._lines.setdefault(order_id, {})
+            self._next_order_id = max(self._next_order_id, order_id + 1)
+            return
+        state = self._orders.get(order_id)
+        if state is None:
+            raise StorageError(f"Запись журнала для неизвестного заказа №{order_id}.")
+        if kind == "d":
+            state[1], state[2] = record[2], record[3]
+        elif kind == "s":
+            state[0], state[3] = record[2], record[3]
+        elif kind == "l":
+            self._lines[order_id][record[2]] = (record[3], tuple(record[4]), record[5])
+        elif kind == "x":
+            self._lines[order_id].pop(record[2], None)
+        elif kind == "a":
+            del self._orders[order_id]
+            lines = self._lines.pop(order_id)
+            self._archiving.append([order_id, *state, [[line_id, *line] for line_id, line in lines.items()]])
+            self._archived_ids.add(order_id)
+        else:
+            raise StorageError(f"Неизвестный тип записи журнала: {kind!r}.")
+
+    def _sync_locked(self) -> None:
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer.clear()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def _seal_locked(self) -> Tuple[Dict[str, Any], List[List[Any]], int]:
+        self._sync_locked()
+        archived = list(self._archiving)
+        state = {
+            "covers": self._generation,
+            "next_order_id": self._next_order_id,
+            "orders": [
+                [order_id, *fields, [[line_id, *line] for line_id, line in self._lines[order_id].items()]]
+                for order_id, fields in self._orders.items()
+            ],
+        }
+        self._file.close()
+        os.replace(self._journal_path, self._sealed_path(self._generation))
+        self._file = open(self._journal_path, "ab")
+        self._generation += 1
+        self._records_since_snapshot = 0
+        self._snapshot_due = False
+        return state, archived, state["covers"]
+
+    def _write_snapshot(self, state: Dict[str, Any], archived: List[List[Any]], covered: int) -> None:
+        if archived:
+            with open(self._archive_path, "ab") as handle:
+                handle.write(b"".join(_encode(record) for record in archived))
+                handle.flush()
+                os.fsync(handle.fileno())
+            with self._lock:
+                del self._archiving[: len(archived)]
+            self.archived_orders += len(archived)
+        temporary = self._snapshot_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(state, handle, ensure_ascii=False, separators=(",", ":"))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self._snapshot_path)
+        for generation, path in self._sealed_journals():
+            if generation <= covered:
+                os.remove(path)
+
+    def _sealed_path(self, generation: int) -> str:
+        return os.path.join(self._directory, f"journal.{generation}.log")
+
+    def _sealed_journals(self) -> List[Tuple[int, str]]:
+        sealed = []
+        for path in glob.glob(os.path.join(self._directory, SEALED_JOURNAL_PATTERN)):
+            generation = os.path.basename(path)[len("journal.") : -len(".log")]
+            if generation.isdigit():
+                sealed.append((int(generation), path))
+        return sorted(sealed)
+
+    def _load_snapshot(self) -> int:
+        if not os.path.exists(self._snapshot_path):
+            return 0
+        try:
+            with open(self._snapshot_path, "r", encoding="utf-8") as handle:
+                state = json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise StorageError(f"Не удалось прочитать снимок заказов: {exc}") from exc
+        for order_id, status, discount_percent, discount_label, paid_at, created_at, lines in state["orders"]:
+            self._orders[order_id] = [status, discount_percent, discount_label, paid_at, created_at]
+            self._lines[order_id] = {
+                line_id: (product, tuple(add_ons), quantity) for line_id, product, add_ons, quantity in lines
+            }
+            self._next_order_id = max(self._next_order_id, order_id + 1)
+        self._next_order_id = max(self._next_order_id, state.get("next_order_id", 1))
+        return state.get("covers", 0)
+
+    def _replay_sealed(self, covered: int) -> int:
+        latest = covered
+        for generation, path in self._sealed_journals():
+            if generation <= covered:
+                os.remove(path)
+                continue
+            self._replay_journal(path)
+            latest = generation
+        return latest
+
+    def _replay_journal(self, path: str) -> None:
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as handle:
+            data = handle.read()
+        payloads: List[bytes] = []
+        offsets: List[int] = []
+        position = 0
+        while position < len(data):
+            end = data.find(b"\n", position)
+            if end < 0 or not _checksum_ok(data, position, end):
+                break
+            payloads.append(data[position + 9 : end])
+            position = end + 1
+            offsets.append(position)
+        try:
+            records = json.loads(b"[" + b",".join(payloads) + b"]")
+        except ValueError:
+            records = [_decode(data[start:stop]) for start, stop in zip([0, *offsets], offsets)]
+        valid_end = 0
+        for record, offset in zip(records, offsets):
+            if record is None:
+                break
+            try:
+                self._apply(record)
+            except (StorageError, IndexError, KeyError, TypeError):
+                break
+            valid_end = offset
+            self.replayed_records += 1
+        if valid_end < len(data):
+            self.discarded_bytes += len(data) - valid_end
+            with open(path, "r+b") as handle:
+                handle.truncate(valid_end)
+
+    def _flush_periodically(self) -> None:
+        while True:
+            self._wakeup.wait(self._fsync_interval)
+            self._wakeup.clear()
+            if self._closed:
+                return
+            if self._snapshot_due:
+                try:
+                    self.snapshot()
+                except OSError as exc:
+                    self.last_error = exc
+            with self._lock:
+                if self._buffer and time.monotonic() - self._last_sync >= self._fsync_interval:
+                    self._sync_locked()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+from ..models.order import Order, OrderItem
+from ..utils import StorageError
+from .base import OrderRepository, StoredLine, StoredOrder, line_row, order_row
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS orders (
+        order_id INTEGER PRIMARY KEY,
+        status TEXT NOT NULL,
+        discount_percent REAL NOT NULL,
+        discount_label TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        paid_at REAL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS order_lines (
+        order_id INTEGER NOT NULL,
+        line_id INTEGER NOT NULL,
+        product TEXT NOT NULL,
+        add_ons TEXT NOT NULL,
+        quantity INTEGER NOT NULL,
+        PRIMARY KEY (order_id, line_id)
+    )
+    """,
+)
+
+_UPSERT_ORDER = (
+    "INSERT OR REPLACE INTO orders "
+    "(order_id, status, discount_percent, discount_label, created_at, paid_at) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_UPSERT_LINE = (
+    "INSERT OR REPLACE INTO order_lines (order_id, line_id, product, add_ons, quantity) VALUES (?, ?, ?, ?, ?)"
+)
+_DELETE_LINE = "DELETE FROM order_lines WHERE order_id = ? AND line_id = ?"
+_SELECT_ORDERS = (
+    "SELECT order_id, status, discount_percent, discount_label, created_at, paid_at FROM orders ORDER BY order_id"
+)
+_SELECT_LINES = "SELECT order_id, line_id, product, add_ons, quantity FROM order_lines ORDER BY order_id, line_id"
+
+_STOP = object()
+
+
+class SqliteOrderRepository(OrderRepository):
+    def __init__(self, path: str, commit_interval: float = 0.005) -> None:
+        self._path = path
+        self._commit_interval = commit_interval
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._error: BaseException | None = None
+        self._closed = False
+        connection = self._connect()
+        try:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+        finally:
+            connection.close()
+        self._writer = threading.Thread(target=self._run, name="sqlite-order-writer", daemon=True)
+        self._writer.start()
+
+    def save_order(self, order: Order) -> None:
+        self._submit((_UPSERT_ORDER, order_row(order)))
+
+    def save_line(self, order_id: int, line_id: int, item: OrderItem | None) -> None:
+        if item is None:
+            self._submit((_DELETE_LINE, (order_id, line_id)))
+            return
+        product, add_ons, quantity = line_row(item)
+        self._submit((_UPSERT_LINE, (order_id, line_id, product, json.dumps(add_ons), quantity)))
+
+    def load_orders(self) -> List[StoredOrder]:
+        self.flush()
+        connection = self._connect()
+        try:
+            lines: Dict[int, List[StoredLine]] = {}
+            for order_id, line_id, product, add_ons, quantity in connection.execute(_SELECT_LINES):
+                lines.setdefault(order_id, []).append((line_id, product, tuple(json.loads(add_ons)), quantity))
+            return [
+                StoredOrder(*row, tuple(lines.get(row[0], ())))
+                for row in connection.execute(_SELECT_ORDERS)
+            ]
+        finally:
+            connection.close()
+
+    def flush(self) -> None:
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._closed = True
+
+    def _submit(self, operation: Tuple[str, tuple]) -> None:
+        if self._closed:
+            raise StorageError("Хранилище заказов закрыто.")
+        self._raise_if_failed()
+        self._queue.put(operation)
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise StorageError(f"Ошибка записи в базу заказов: {self._error}") from self._error
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, cached_statements=64)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _run(self) -> None:
+        connection = self._connect()
+        try:
+            while True:
+                batch = self._collect_batch()
+                stop = self._write_batch(connection, batch)
+                if stop:
+                    return
+        finally:
+            connection.close()
+
+    def _collect_batch(self) -> List[Any]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._commit_interval
+        while batch[-1] is not _STOP and not isinstance(batch[-1], threading.Event):
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, connection: sqlite3.Connection, batch: List[Any]) -> bool:
+        operations = [entry for entry in batch if isinstance(entry, tuple)]
+        if operations and self._error is None:
+            try:
+                with connection:
+                    for sql, params in operations:
+                        connection.execute(sql, params)
+            except sqlite3.Error as exc:
+                self._error = exc
+        for entry in batch:
+            if isinstance(entry, threading.Event):
+                entry.set()
+        return batch[-1] is _STOP
@@ -1,9 +1,25 @@
-from .exceptions import CoffeeOrderError, InvalidAddOnError, OrderNotFoundError, OrderStateError, ProductNotFoundError
+from .exceptions import (
+    CoffeeOrderError,
+    InvalidAddOnError,
+    OrderNotFoundError,
+    OrderStateError,
+    ProductNotFoundError,
+    StorageError,
+)
+from .keyed_serializer import KeyedSerializer
+from .log_buffer import LogBuffer
+from .row_sync import KeyedRows, RowChanges, RowView
 
 __all__ = [
     "CoffeeOrderError",
     "InvalidAddOnError",
+    "KeyedRows",
+    "KeyedSerializer",
+    "LogBuffer",
     "OrderNotFoundError",
     "OrderStateError",
     "ProductNotFoundError",
+    "RowChanges",
+    "RowView",
+    "StorageError",
 ]
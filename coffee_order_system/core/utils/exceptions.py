@@ -17,3 +17,7 @@ class OrderStateError(CoffeeOrderError):
 
 class InvalidAddOnError(CoffeeOrderError):
     pass
+
+
+class StorageError(CoffeeOrderError):
+    pass
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, Optional
+
+Task = Callable[[], None]
+
+
+class KeyedSerializer:
+    def __init__(self, start: Callable[[Task], object]) -> None:
+        self._start = start
+        self._lock = threading.Lock()
+        self._queues: Dict[Hashable, Deque[Task]] = {}
+
+    def submit(self, key: Hashable, task: Task) -> None:
+        with self._lock:
+            pending = self._queues.get(key)
+            if pending is not None:
+                pending.append(task)
+                return
+            self._queues[key] = deque()
+        self._start(lambda: self._run(key, task))
+
+    def _run(self, key: Hashable, task: Task) -> None:
+        try:
+            task()
+        finally:
+            with self._lock:
+                pending = self._queues[key]
+                following: Optional[Task] = pending.popleft() if pending else None
+                if following is None:
+                    del self._queues[key]
+            if following is not None:
+                self._start(lambda: self._run(key, following))
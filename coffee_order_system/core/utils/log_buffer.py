@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Deque, List, Tuple
+
+
+class LogBuffer:
+    def __init__(self, capacity: int = 5000) -> None:
+        if capacity < 1:
+            raise ValueError("Емкость журнала должна быть положительной.")
+        self.capacity = capacity
+        self._pending: Deque[object] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._shown = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._shown
+
+    def __call__(self, message: object) -> None:
+        self.append(message)
+
+    def append(self, message: object) -> None:
+        with self._lock:
+            if len(self._pending) == self.capacity:
+                self.dropped += 1
+            self._pending.append(message)
+
+    def drain(self) -> Tuple[List[str], int]:
+        with self._lock:
+            if not self._pending:
+                return [], 0
+            batch = list(self._pending)
+            self._pending.clear()
+        lines = [str(message) for message in batch]
+        shown = self._shown + len(lines)
+        trimmed = max(0, shown - self.capacity)
+        self._shown = shown - trimmed
+        return lines, trimmed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+        self._shown = 0
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Protocol, Tuple
+
+Row = Tuple[object, ...]
+
+
+class RowView(Protocol):
+    def insert_row(self, index: int, key: Hashable, values: Row) -> None:
+        ...
+
+    def delete_row(self, index: int, key: Hashable) -> None:
+        ...
+
+    def update_row(self, index: int, key: Hashable, values: Row, previous: Row) -> None:
+        ...
+
+    def move_row(self, old_index: int, index: int, key: Hashable, values: Row) -> None:
+        ...
+
+
+class RowChanges(NamedTuple):
+    inserted: int
+    removed: int
+    updated: int
+    moved: int
+
+
+class KeyedRows:
+    def __init__(self) -> None:
+        self._keys: List[Hashable] = []
+        self._values: Dict[Hashable, Row] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def keys(self) -> Tuple[Hashable, ...]:
+        return tuple(self._keys)
+
+    def key_at(self, index: int) -> Hashable:
+        return self._keys[index]
+
+    def index_of(self, key: Hashable) -> int:
+        return self._keys.index(key)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._values.clear()
+
+    def sync(self, rows: Iterable[Tuple[Hashable, Row]], view: RowView) -> RowChanges:
+        target = list(rows)
+        wanted = dict(target)
+        if len(wanted) != len(target):
+            raise ValueError("Ключи строк должны быть уникальными.")
+        removed = 0
+        for index in range(len(self._keys) - 1, -1, -1):
+            key = self._keys[index]
+            if key not in wanted:
+                view.delete_row(index, key)
+                del self._keys[index]
+                del self._values[key]
+                removed += 1
+        inserted = updated = moved = 0
+        keys = self._keys
+        for index, (key, values) in enumerate(target):
+            previous = self._values.get(key)
+            if previous is None:
+                view.insert_row(index, key, values)
+                keys.insert(index, key)
+                inserted += 1
+            else:
+                if keys[index] != key:
+                    old_index = keys.index(key, index)
+                    view.move_row(old_index, index, key, previous)
+                    del keys[old_index]
+                    keys.insert(index, key)
+                    moved += 1
+                if previous != values:
+                    view.update_row(index, key, values, previous)
+                    updated += 1
+            self._values[key] = values
+        return RowChanges(inserted, removed, updated, moved)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+
+from core.utils import LogBuffer
+
+FRAME_MS = 16
+
+
+class LogView(ttk.Frame):
+    def __init__(self, master: tk.Misc, capacity: int = 5000, **kwargs: object) -> None:
+        super().__init__(master, **kwargs)
+        self.buffer = LogBuffer(capacity)
+        self.paused = tk.BooleanVar(value=False)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.text = tk.Text(self, height=6, state="disabled")
+        self.text.grid(row=0, column=0, sticky="nsew")
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.text.configure(yscrollcommand=scrollbar.set)
+        ttk.Checkbutton(self, text="Пауза прокрутки", variable=self.paused).grid(row=1, column=0, sticky="w")
+        self._poll = self.after(FRAME_MS, self._flush)
+
+    def append(self, message: object) -> None:
+        self.buffer.append(message)
+
+    def destroy(self) -> None:
+        self.after_cancel(self._poll)
+        super().destroy()
+
+    def _flush(self) -> None:
+        lines, trimmed = self.buffer.drain()
+        if lines:
+            self.text.configure(state="normal")
+            if trimmed:
+                self.text.delete("1.0", f"{trimmed + 1}.0")
+            self.text.insert(tk.END, "\n".join(lines) + "\n")
+            self.text.configure(state="disabled")
+            if not self.paused.get():
+                self.text.see(tk.END)
+        self._poll = self.after(FRAME_MS, self._flush)
@@ -2,11 +2,58 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Callable, Dict, Optional, Sequence
+from typing import Callable, Dict, Hashable, Optional, Sequence, Tuple
 
+from core.models.money import format_cents
 from core.models.order import OrderItem, OrderStatus
 from core.services.order_service import OrderService
-from core.utils import CoffeeOrderError, InvalidAddOnError
+from core.utils import CoffeeOrderError, InvalidAddOnError, KeyedRows
+from core.utils.row_sync import Row
+from gui.log_view import LogView
+from gui.refresh_scheduler import ACTIVE_ORDERS, DETAILS, ORDER, TOTAL, RefreshScheduler
+
+
+class TreeviewRows:
+    def __init__(self, tree: ttk.Treeview) -> None:
+        self.tree = tree
+
+    def insert_row(self, index: int, key: Hashable, values: Row) -> None:
+        self.tree.insert("", index, iid=_row_id(key), values=values)
+
+    def delete_row(self, index: int, key: Hashable) -> None:
+        self.tree.delete(_row_id(key))
+
+    def update_row(self, index: int, key: Hashable, values: Row, previous: Row) -> None:
+        self.tree.item(_row_id(key), values=values)
+
+    def move_row(self, old_index: int, index: int, key: Hashable, values: Row) -> None:
+        self.tree.move(_row_id(key), "", index)
+
+
+class ListboxRows:
+    def __init__(self, listbox: tk.Listbox) -> None:
+        self.listbox = listbox
+
+    def insert_row(self, index: int, key: Hashable, values: Row) -> None:
+        self.listbox.insert(index, values[0])
+
+    def delete_row(self, index: int, key: Hashable) -> None:
+        self.listbox.delete(index)
+
+    def update_row(self, index: int, key: Hashable, values: Row, previous: Row) -> None:
+        selected = self.listbox.selection_includes(index)
+        self.listbox.delete(index)
+        self.listbox.insert(index, values[0])
+        if selected:
+            self.listbox.selection_set(index)
+
+    def move_row(self, old_index: int, index: int, key: Hashable, values: Row) -> None:
+        self.listbox.delete(old_index)
+        self.listbox.insert(index, values[0])
+
+
+def _row_id(key: Hashable) -> str:
+    return "-".join(map(str, key)) if isinstance(key, tuple) else str(key)
 
 
 class DetailsWindow(tk.Toplevel):
@@ -20,25 +67,39 @@ class DetailsWindow(tk.Toplevel):
         frame.grid(row=0, column=0, sticky="nsew")
         frame.columnconfigure(0, weight=1)
         frame.rowconfigure(0, weight=1)
-        self.tree = ttk.Treeview(frame, columns=("product", "addons", "status"), show="headings")
+        self.tree = ttk.Treeview(frame, columns=("product", "addons", "quantity", "status"), show="headings")
         self.tree.heading("product", text="Товар")
         self.tree.heading("addons", text="Добавки")
+        self.tree.heading("quantity", text="Кол-во")
         self.tree.heading("status", text="Статус")
         self.tree.column("product", width=220, anchor="w")
-        self.tree.column("addons", width=320, anchor="w")
+        self.tree.column("addons", width=260, anchor="w")
+        self.tree.column("quantity", width=60, anchor="e")
         self.tree.column("status", width=120, anchor="w")
         self.tree.grid(row=0, column=0, sticky="nsew")
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
         scrollbar.grid(row=0, column=1, sticky="ns")
         self.tree.configure(yscrollcommand=scrollbar.set)
+        self._rows = KeyedRows()
+        self._view = TreeviewRows(self.tree)
 
-    def update_rows(self, items: Sequence[OrderItem], status: OrderStatus) -> None:
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+    def update_rows(self, lines: Sequence[Tuple[Hashable, OrderItem]], status: OrderStatus) -> None:
         status_text = status.value
-        for item in items:
-            add_ons = ", ".join(add_on.get_name() for add_on in item.add_ons) or "-"
-            self.tree.insert("", tk.END, values=(item.product.get_name(), add_ons, status_text))
+        self._rows.sync(
+            (
+                (
+                    key,
+                    (
+                        item.product.get_name(),
+                        item.configuration.extras or "-",
+                        item.quantity,
+                        status_text,
+                    ),
+                )
+                for key, item in lines
+            ),
+            self._view,
+        )
 
 
 class DiscountWindow(tk.Toplevel):
@@ -136,9 +197,19 @@ class MainWindow(tk.Tk):
         self.details_window: Optional[DetailsWindow] = None
         self._active_order_ids: list[int] = []
         self._menu_map: Dict[str, str] = {}
+        self._order_rows = KeyedRows()
+        self._refresh = RefreshScheduler(
+            self,
+            {
+                ACTIVE_ORDERS: self._refresh_active_orders,
+                ORDER: self._refresh_order,
+                DETAILS: self._refresh_details,
+                TOTAL: self._update_total,
+            },
+        )
         self._build_ui()
         self._load_menu()
-        self._refresh_active_orders()
+        self._refresh.invalidate(ACTIVE_ORDERS)
 
     def _build_ui(self) -> None:
         self.columnconfigure(0, weight=1)
@@ -172,6 +243,7 @@ class MainWindow(tk.Tk):
         order_frame.rowconfigure(0, weight=1)
         self.order_listbox = tk.Listbox(order_frame, exportselection=False)
         self.order_listbox.grid(row=0, column=0, sticky="nsew")
+        self._order_view = ListboxRows(self.order_listbox)
 
         control_frame = ttk.LabelFrame(top_frame, text="Управление")
         control_frame.grid(row=0, column=2, sticky="nsew")
@@ -216,8 +288,8 @@ class MainWindow(tk.Tk):
         log_frame.grid(row=1, column=0, sticky="nsew")
         log_frame.rowconfigure(0, weight=1)
         log_frame.columnconfigure(0, weight=1)
-        self.log_text = tk.Text(log_frame, height=6, state="disabled")
-        self.log_text.grid(row=0, column=0, sticky="nsew")
+        self.log_view = LogView(log_frame)
+        self.log_view.grid(row=0, column=0, sticky="nsew")
 
     def _load_menu(self) -> None:
         self.menu_listbox.delete(0, tk.END)
@@ -237,9 +309,7 @@ class MainWindow(tk.Tk):
         self.status_combo.current(0)
         self.menu_listbox.selection_clear(0, tk.END)
         self.add_on_listbox.selection_clear(0, tk.END)
-        self._refresh_active_orders(order.order_id)
-        self._refresh_order()
-        self._update_total()
+        self._refresh.invalidate(ACTIVE_ORDERS, ORDER, DETAILS, TOTAL)
 
     def _add_item(self) -> None:
         if not self._ensure_order():
@@ -259,8 +329,7 @@ class MainWindow(tk.Tk):
         except CoffeeOrderError as exc:
             messagebox.showerror("Ошибка заказа", str(exc))
             return
-        self._refresh_order()
-        self._update_total()
+        self._refresh.invalidate(ORDER, DETAILS, TOTAL)
 
     def _remove_item(self) -> None:
         if not self._ensure_order():
@@ -274,8 +343,7 @@ class MainWindow(tk.Tk):
         except CoffeeOrderError as exc:
             messagebox.showerror("Ошибка заказа", str(exc))
             return
-        self._refresh_order()
-        self._update_total()
+        self._refresh.invalidate(ORDER, DETAILS, TOTAL)
 
     def _open_details(self) -> None:
         if not self._ensure_order():
@@ -285,7 +353,7 @@ class MainWindow(tk.Tk):
         else:
             self.details_window = DetailsWindow(self)
             self.details_window.protocol("WM_DELETE_WINDOW", self._close_details)
-        self._refresh_details()
+        self._refresh.invalidate(DETAILS)
 
     def _close_details(self) -> None:
         if self.details_window:
@@ -306,9 +374,7 @@ class MainWindow(tk.Tk):
         except CoffeeOrderError as exc:
             messagebox.showerror("Ошибка заказа", str(exc))
             return
-        self._refresh_order()
-        self._update_total()
-        self._refresh_details()
+        self._refresh.invalidate(ORDER, DETAILS, TOTAL)
 
     def _change_status(self) -> None:
         if not self._ensure_order():
@@ -320,21 +386,24 @@ class MainWindow(tk.Tk):
         except CoffeeOrderError as exc:
             messagebox.showerror("Ошибка заказа", str(exc))
             return
-        self._refresh_active_orders()
-        self._refresh_order()
+        self._refresh.invalidate(ACTIVE_ORDERS, ORDER, DETAILS)
 
     def _refresh_order(self) -> None:
         if not self._ensure_order(show_message=False):
-            self.order_listbox.delete(0, tk.END)
-            self._refresh_details()
+            self._order_rows.sync((), self._order_view)
             return
         order = self.service.get_order(self.current_order_id)
-        self.order_listbox.delete(0, tk.END)
-        for item_name in self.service.list_order_items(self.current_order_id):
-            self.order_listbox.insert(tk.END, f"{item_name} | статус: {order.status.value}")
-        self._refresh_details()
+        status_text = order.status.value
+        self._order_rows.sync(
+            (
+                ((order.order_id, line_id), (f"{item_name} | статус: {status_text}",))
+                for line_id, item_name in self.service.list_order_line_names(order.order_id)
+            ),
+            self._order_view,
+        )
 
-    def _refresh_active_orders(self, select_order_id: Optional[int] = None) -> None:
+    def _refresh_active_orders(self) -> None:
+        previous_order_id = self.current_order_id
         self.active_orders_listbox.delete(0, tk.END)
         self._active_order_ids.clear()
         active_orders = self.service.list_active_orders()
@@ -343,11 +412,7 @@ class MainWindow(tk.Tk):
             label = f"Заказ №{order.order_id} | {order.status.value}"
             self.active_orders_listbox.insert(tk.END, label)
 
-        if select_order_id in self._active_order_ids:
-            index = self._active_order_ids.index(select_order_id)
-            self.active_orders_listbox.selection_set(index)
-            self.current_order_id = select_order_id
-        elif self.current_order_id in self._active_order_ids:
+        if self.current_order_id in self._active_order_ids:
             index = self._active_order_ids.index(self.current_order_id)
             self.active_orders_listbox.selection_set(index)
         elif self._active_order_ids:
@@ -355,6 +420,8 @@ class MainWindow(tk.Tk):
             self.active_orders_listbox.selection_set(0)
         else:
             self.current_order_id = None
+        if self.current_order_id != previous_order_id:
+            self._refresh.invalidate(ORDER, DETAILS, TOTAL)
 
     def _select_order(self, _event: tk.Event) -> None:
         selection = self.active_orders_listbox.curselection()
@@ -364,8 +431,7 @@ class MainWindow(tk.Tk):
         self.current_order_id = order_id
         order = self.service.get_order(order_id)
         self.status_combo.set(order.status.value)
-        self._refresh_order()
-        self._update_total()
+        self._refresh.invalidate(ORDER, DETAILS, TOTAL)
 
     def _refresh_details(self) -> None:
         if not self.details_window or not self.details_window.winfo_exists():
@@ -374,8 +440,8 @@ class MainWindow(tk.Tk):
             self.details_window.update_rows([], OrderStatus.CREATED)
             return
         order = self.service.get_order(self.current_order_id)
-        items = self.service.get_order_items(self.current_order_id)
-        self.details_window.update_rows(items, order.status)
+        lines = self.service.get_order_lines(order.order_id)
+        self.details_window.update_rows([((order.order_id, line_id), item) for line_id, item in lines], order.status)
 
     def _update_total(self) -> None:
         if not self._ensure_order(show_message=False):
@@ -384,9 +450,9 @@ class MainWindow(tk.Tk):
         order = self.service.get_order(self.current_order_id)
         total = self.service.calculate_total(self.current_order_id)
         if order.discount_percent > 0:
-            self.total_label.configure(text=f"Итого: {total:.2f} (скидка {order.discount_percent:.0f}%)")
+            self.total_label.configure(text=f"Итого: {format_cents(total)} (скидка {order.discount_percent:.0f}%)")
         else:
-            self.total_label.configure(text=f"Итого: {total:.2f}")
+            self.total_label.configure(text=f"Итого: {format_cents(total)}")
 
     def _ensure_order(self, show_message: bool = True) -> bool:
         if self.current_order_id is None:
@@ -396,7 +462,4 @@ class MainWindow(tk.Tk):
         return True
 
     def append_log(self, message: str) -> None:
-        self.log_text.configure(state="normal")
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.configure(state="disabled")
+        self.log_view.append(message)
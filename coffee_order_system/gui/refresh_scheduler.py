@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional, Protocol, Sequence, Set
+
+ACTIVE_ORDERS = "active_orders"
+ORDER = "order"
+DETAILS = "details"
+TOTAL = "total"
+
+RENDER_ORDER = (ACTIVE_ORDERS, ORDER, DETAILS, TOTAL)
+
+
+class IdleScheduler(Protocol):
+    def after_idle(self, func: Callable[[], None]) -> str:
+        ...
+
+    def after_cancel(self, id: str) -> None:
+        ...
+
+
+class RefreshScheduler:
+    def __init__(
+        self,
+        widget: IdleScheduler,
+        renderers: Dict[str, Callable[[], None]],
+        render_order: Sequence[str] = RENDER_ORDER,
+    ) -> None:
+        self._widget = widget
+        self._renderers = renderers
+        self._render_order = tuple(render_order)
+        self._dirty: Set[str] = set()
+        self._pending: Optional[str] = None
+        self._rendering = False
+        self.render_counts: Dict[str, int] = {region: 0 for region in self._render_order}
+
+    def invalidate(self, *regions: str) -> None:
+        for region in regions:
+            if region not in self._renderers:
+                raise KeyError(f"Неизвестная область обновления: {region!r}.")
+        self._dirty.update(regions)
+        if self._pending is None and not self._rendering and self._dirty:
+            self._pending = self._widget.after_idle(self._render)
+
+    def flush(self) -> None:
+        if self._pending is not None:
+            self._widget.after_cancel(self._pending)
+        self._render()
+
+    def _render(self) -> None:
+        self._pending = None
+        self._rendering = True
+        try:
+            for region in self._render_order:
+                if region in self._dirty:
+                    self._dirty.discard(region)
+                    self.render_counts[region] += 1
+                    self._renderers[region]()
+        finally:
+            self._rendering = False
+        if self._dirty:
+            self._pending = self._widget.after_idle(self._render)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from PyQt6 import QtCore
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+from core.utils import KeyedSerializer
+
+ResultCallback = Callable[[Any], None]
+ErrorCallback = Callable[[Exception], None]
+
+_NEW_ORDER = "new-order"
+
+
+class ServiceCommands(QtCore.QObject):
+    succeeded = QtCore.pyqtSignal(int, object)
+    failed = QtCore.pyqtSignal(int, object)
+
+    def __init__(
+        self,
+        service: OrderService,
+        pool: QtCore.QThreadPool | None = None,
+        max_threads: int = 4,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._service = service
+        if pool is None:
+            pool = QtCore.QThreadPool(self)
+            pool.setMaxThreadCount(max_threads)
+        self._pool = pool
+        self._serializer = KeyedSerializer(self._pool.start)
+        self._request_ids = itertools.count(1)
+        self._callbacks: Dict[int, Tuple[Optional[ResultCallback], Optional[ErrorCallback]]] = {}
+        self.succeeded.connect(self._deliver_result)
+        self.failed.connect(self._deliver_error)
+
+    @property
+    def pool(self) -> QtCore.QThreadPool:
+        return self._pool
+
+    def submit(
+        self,
+        order_id: Optional[int],
+        operation: Callable[..., Any],
+        *args: Any,
+        on_result: ResultCallback | None = None,
+        on_error: ErrorCallback | None = None,
+    ) -> int:
+        request_id = next(self._request_ids)
+        if on_result is not None or on_error is not None:
+            self._callbacks[request_id] = (on_result, on_error)
+
+        def run() -> None:
+            try:
+                result = operation(*args)
+            except Exception as exc:
+                self.failed.emit(request_id, exc)
+            else:
+                self.succeeded.emit(request_id, result)
+
+        self._serializer.submit(_NEW_ORDER if order_id is None else order_id, run)
+        return request_id
+
+    def create_order(self, **callbacks: Any) -> int:
+        return self.submit(None, self._service.create_order, **callbacks)
+
+    def add_menu_item(
+        self,
+        order_id: int,
+        product_name: str,
+        add_on_names: Sequence[str] | None = None,
+        **callbacks: Any,
+    ) -> int:
+        return self.submit(order_id, self._service.add_menu_item, order_id, product_name, add_on_names, **callbacks)
+
+    def decrement_item(self, order_id: int, line_id: int, **callbacks: Any) -> int:
+        return self.submit(order_id, self._service.decrement_item, order_id, line_id, **callbacks)
+
+    def remove_line(self, order_id: int, line_id: int, **callbacks: Any) -> int:
+        return self.submit(order_id, self._service.remove_line, order_id, line_id, **callbacks)
+
+    def set_discount(self, order_id: int, percent: float, label: str, **callbacks: Any) -> int:
+        return self.submit(order_id, self._service.set_discount, order_id, percent, label, **callbacks)
+
+    def change_order_status(self, order_id: int, status: OrderStatus, **callbacks: Any) -> int:
+        return self.submit(order_id, self._service.change_order_status, order_id, status, **callbacks)
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def _deliver_result(self, request_id: int, result: Any) -> None:
+        on_result, _ = self._callbacks.pop(request_id, (None, None))
+        if on_result is not None:
+            on_result(result)
+
+    def _deliver_error(self, request_id: int, error: Exception) -> None:
+        _, on_error = self._callbacks.pop(request_id, (None, None))
+        if on_error is not None:
+            on_error(error)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from PyQt6 import QtCore, QtWidgets
+
+from core.utils import LogBuffer
+
+FRAME_MS = 16
+
+
+class LogView(QtWidgets.QWidget):
+    def __init__(self, capacity: int = 5000, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.buffer = LogBuffer(capacity)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(capacity)
+        self.text.setUndoRedoEnabled(False)
+        layout.addWidget(self.text)
+        self.pause_box = QtWidgets.QCheckBox("Пауза прокрутки")
+        layout.addWidget(self.pause_box)
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self._flush)
+        self._timer.start(FRAME_MS)
+
+    def append(self, message: object) -> None:
+        self.buffer.append(message)
+
+    def _flush(self) -> None:
+        lines, _ = self.buffer.drain()
+        if not lines:
+            return
+        scrollbar = self.text.verticalScrollBar()
+        position = scrollbar.value()
+        self.text.appendPlainText("\n".join(lines))
+        if self.pause_box.isChecked():
+            scrollbar.setValue(position)
+        else:
+            scrollbar.setValue(scrollbar.maximum())
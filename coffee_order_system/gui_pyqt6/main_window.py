@@ -1,42 +1,49 @@
 from __future__ import annotations
 
-from typing import Callable, Optional, Sequence
+from typing import Callable, Optional
 
-from PyQt6 import QtCore, QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
 
-from core.models.order import OrderItem, OrderStatus
+from core.models.money import format_cents
+from core.models.order import EVENT_CREATED, Order, OrderStatus
 from core.services.order_service import OrderService
-from core.utils import CoffeeOrderError, InvalidAddOnError
+from core.utils import InvalidAddOnError
+from gui_pyqt6.commands import ServiceCommands
+from gui_pyqt6.log_view import LogView
+from gui_pyqt6.models import (
+    ADD_ONS_COLUMN,
+    PRODUCT_COLUMN,
+    PRODUCT_NAME_ROLE,
+    QUANTITY_COLUMN,
+    STATUS_COLUMN,
+    SUMMARY_COLUMN,
+    ActiveOrdersModel,
+    MenuModel,
+    OrderLinesModel,
+    ServiceEvents,
+)
 
 
 class DetailsWindow(QtWidgets.QDialog):
-    def __init__(self, parent: QtWidgets.QWidget) -> None:
+    def __init__(self, parent: QtWidgets.QWidget, model: OrderLinesModel) -> None:
         super().__init__(parent)
         self.setWindowTitle("Детали заказа")
         self.resize(700, 360)
         self.setStyleSheet(parent.styleSheet())
         layout = QtWidgets.QVBoxLayout(self)
-        self.table = QtWidgets.QTableWidget(0, 3, self)
-        self.table.setHorizontalHeaderLabels(["Товар", "Добавки", "Статус"])
+        self.table = QtWidgets.QTableView(self)
+        self.table.setModel(model)
+        self.table.setColumnHidden(SUMMARY_COLUMN, True)
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(PRODUCT_COLUMN, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(ADD_ONS_COLUMN, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(QUANTITY_COLUMN, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(STATUS_COLUMN, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         layout.addWidget(self.table)
 
-    def update_rows(self, items: Sequence[OrderItem], status: OrderStatus) -> None:
-        self.table.setRowCount(0)
-        status_text = status.value
-        for item in items:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            add_ons = ", ".join(add_on.get_name() for add_on in item.add_ons) or "-"
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(item.product.get_name()))
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(add_ons))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(status_text))
-
 
 class DiscountDialog(QtWidgets.QDialog):
     def __init__(
@@ -132,7 +139,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.service = service
         self.current_order_id: Optional[int] = None
         self.details_window: Optional[DetailsWindow] = None
-        self._menu_map: dict[str, str] = {}
+        self._events = ServiceEvents(service, self)
+        self._commands = ServiceCommands(service, parent=self)
+        self._active_model = ActiveOrdersModel(service, self._events, self)
+        self._lines_model = OrderLinesModel(service, self._events, self)
+        self._menu_model = MenuModel(service.list_beverages() + service.list_desserts(), self)
+        self._add_on_model = QtCore.QStringListModel([add_on.get_name() for add_on in service.list_add_ons()], self)
+        self._events.order_event.connect(self._on_order_event)
 
         central = QtWidgets.QWidget()
         central.setObjectName("AppRoot")
@@ -168,11 +181,14 @@ class MainWindow(QtWidgets.QMainWindow):
         menu_group.setMinimumWidth(230)
         menu_layout = QtWidgets.QVBoxLayout(menu_group)
         menu_layout.addWidget(QtWidgets.QLabel("Продукты"))
-        self.menu_list = QtWidgets.QListWidget()
+        self.menu_list = QtWidgets.QListView()
+        self.menu_list.setModel(self._menu_model)
         self.menu_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
         menu_layout.addWidget(self.menu_list, 1)
         menu_layout.addWidget(QtWidgets.QLabel("Добавки (для напитков)"))
-        self.add_on_list = QtWidgets.QListWidget()
+        self.add_on_list = QtWidgets.QListView()
+        self.add_on_list.setModel(self._add_on_model)
+        self.add_on_list.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.add_on_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.MultiSelection)
         menu_layout.addWidget(self.add_on_list, 1)
 
@@ -180,7 +196,10 @@ class MainWindow(QtWidgets.QMainWindow):
         top_layout.addWidget(order_group, 2)
         order_group.setMinimumWidth(360)
         order_layout = QtWidgets.QVBoxLayout(order_group)
-        self.order_list = QtWidgets.QListWidget()
+        self.order_list = QtWidgets.QListView()
+        self.order_list.setModel(self._lines_model)
+        self.order_list.setModelColumn(SUMMARY_COLUMN)
+        self.order_list.setUniformItemSizes(True)
         order_layout.addWidget(self.order_list)
 
         control_group = QtWidgets.QGroupBox("Управление")
@@ -197,8 +216,10 @@ class MainWindow(QtWidgets.QMainWindow):
         control_layout.addWidget(self.total_label)
 
         control_layout.addWidget(QtWidgets.QLabel("Активные заказы"))
-        self.active_orders = QtWidgets.QListWidget()
-        self.active_orders.itemSelectionChanged.connect(self._select_order)
+        self.active_orders = QtWidgets.QListView()
+        self.active_orders.setModel(self._active_model)
+        self.active_orders.setUniformItemSizes(True)
+        self.active_orders.selectionModel().currentChanged.connect(self._select_order)
         control_layout.addWidget(self.active_orders)
 
         self.create_order_button = QtWidgets.QPushButton("Создать заказ")
@@ -233,81 +254,55 @@ class MainWindow(QtWidgets.QMainWindow):
         log_group = QtWidgets.QGroupBox("Журнал событий")
         main_layout.addWidget(log_group, 1)
         log_layout = QtWidgets.QVBoxLayout(log_group)
-        self.log_text = QtWidgets.QTextEdit()
-        self.log_text.setReadOnly(True)
-        log_layout.addWidget(self.log_text)
+        self.log_view = LogView()
+        log_layout.addWidget(self.log_view)
 
         self._apply_style()
-        self._load_menu()
-        self._refresh_active_orders()
-
-    def _load_menu(self) -> None:
-        self.menu_list.clear()
-        self._menu_map.clear()
-        for product in self.service.list_beverages() + self.service.list_desserts():
-            display = f"{product.get_category().title()}: {product.get_name()}"
-            self._menu_map[display] = product.get_name()
-            self.menu_list.addItem(display)
-
-        self.add_on_list.clear()
-        for add_on in self.service.list_add_ons():
-            self.add_on_list.addItem(add_on.get_name())
+        self._select_row(0)
 
     def _create_order(self) -> None:
-        order = self.service.create_order()
-        self.current_order_id = order.order_id
+        self._commands.create_order(on_result=self._order_created, on_error=self._show_error("Ошибка заказа"))
+
+    def _order_created(self, order: Order) -> None:
         self.status_combo.setCurrentIndex(0)
         self.menu_list.clearSelection()
         self.add_on_list.clearSelection()
-        self._refresh_active_orders(select_order_id=order.order_id)
-        self._refresh_order()
-        self._update_total()
+        self._show_order(order.order_id)
+        self._highlight(order.order_id)
 
     def _add_item(self) -> None:
         if not self._ensure_order():
             return
-        item = self.menu_list.currentItem()
-        if not item:
+        index = self.menu_list.currentIndex()
+        if not index.isValid():
             QtWidgets.QMessageBox.warning(self, "Нет выбора", "Выберите продукт для добавления.")
             return
-        display_name = item.text()
-        product_name = self._menu_map.get(display_name)
-        add_on_names = [x.text() for x in self.add_on_list.selectedItems()]
-        try:
-            self.service.add_menu_item(self.current_order_id, product_name, add_on_names)
-        except InvalidAddOnError as exc:
-            QtWidgets.QMessageBox.warning(self, "Ошибка добавок", str(exc))
-            return
-        except CoffeeOrderError as exc:
-            QtWidgets.QMessageBox.warning(self, "Ошибка заказа", str(exc))
-            return
-        self._refresh_order()
-        self._update_total()
+        product_name = index.data(PRODUCT_NAME_ROLE)
+        add_on_names = [
+            selected.data()
+            for selected in sorted(self.add_on_list.selectionModel().selectedIndexes(), key=lambda i: i.row())
+        ]
+        self._commands.add_menu_item(
+            self.current_order_id, product_name, add_on_names, on_error=self._show_add_item_error
+        )
 
     def _remove_item(self) -> None:
         if not self._ensure_order():
             return
-        row = self.order_list.currentRow()
-        if row < 0:
+        line_id = self._lines_model.line_id_at(self.order_list.currentIndex().row())
+        if line_id is None:
             QtWidgets.QMessageBox.warning(self, "Нет выбора", "Выберите позицию для удаления.")
             return
-        try:
-            self.service.remove_item(self.current_order_id, row)
-        except CoffeeOrderError as exc:
-            QtWidgets.QMessageBox.warning(self, "Ошибка заказа", str(exc))
-            return
-        self._refresh_order()
-        self._update_total()
+        self._commands.decrement_item(self.current_order_id, line_id, on_error=self._show_error("Ошибка заказа"))
 
     def _open_details(self) -> None:
         if not self._ensure_order():
             return
         if not self.details_window:
-            self.details_window = DetailsWindow(self)
+            self.details_window = DetailsWindow(self, self._lines_model)
             self.details_window.finished.connect(self._details_closed)
         self.details_window.show()
         self.details_window.raise_()
-        self._refresh_details()
 
     def _details_closed(self) -> None:
         self.details_window = None
@@ -320,97 +315,69 @@ class MainWindow(QtWidgets.QMainWindow):
         dialog.exec()
 
     def _apply_discount(self, percent: float, label: str) -> None:
-        try:
-            self.service.set_discount(self.current_order_id, percent, label)
-        except CoffeeOrderError as exc:
-            QtWidgets.QMessageBox.warning(self, "Ошибка заказа", str(exc))
-            return
-        self._refresh_order()
-        self._update_total()
-        self._refresh_details()
+        self._commands.set_discount(self.current_order_id, percent, label, on_error=self._show_error("Ошибка заказа"))
 
     def _change_status(self) -> None:
         if not self._ensure_order():
             return
         status_value = self.status_combo.currentText()
         new_status = OrderStatus(status_value)
-        try:
-            self.service.change_order_status(self.current_order_id, new_status)
-        except CoffeeOrderError as exc:
-            QtWidgets.QMessageBox.warning(self, "Ошибка заказа", str(exc))
-            return
-        self._refresh_active_orders()
-        self._refresh_order()
+        self._commands.change_order_status(
+            self.current_order_id, new_status, on_error=self._show_error("Ошибка заказа")
+        )
 
-    def _refresh_order(self) -> None:
-        if not self._ensure_order(show_message=False):
-            self.order_list.clear()
-            self._refresh_details()
-            return
-        order = self.service.get_order(self.current_order_id)
-        self.order_list.clear()
-        for item_name in self.service.list_order_items(self.current_order_id):
-            self.order_list.addItem(f"{item_name} | статус: {order.status.value}")
-        self.order_info_label.setText(f"Заказ №{order.order_id} · статус {order.status.value}")
-        self._refresh_details()
+    def _show_add_item_error(self, error: Exception) -> None:
+        title = "Ошибка добавок" if isinstance(error, InvalidAddOnError) else "Ошибка заказа"
+        QtWidgets.QMessageBox.warning(self, title, str(error))
 
-    def _refresh_details(self) -> None:
-        if not self.details_window:
+    def _show_error(self, title: str) -> Callable[[Exception], None]:
+        return lambda error: QtWidgets.QMessageBox.warning(self, title, str(error))
+
+    def _on_order_event(self, order_id: int, event: str) -> None:
+        if order_id != self.current_order_id:
             return
-        if not self._ensure_order(show_message=False):
-            self.details_window.update_rows([], OrderStatus.CREATED)
+        if event == EVENT_CREATED:
+            self._highlight(order_id)
+        elif self._active_model.row_of(order_id) < 0:
+            self._select_row(0)
+        else:
+            self._update_order_info()
+
+    def _select_row(self, row: int) -> None:
+        order_id = self._active_model.order_id_at(row)
+        self._show_order(order_id)
+        if order_id is not None:
+            self.active_orders.setCurrentIndex(self._active_model.index(row))
+
+    def _highlight(self, order_id: int) -> None:
+        row = self._active_model.row_of(order_id)
+        if row >= 0:
+            self.active_orders.setCurrentIndex(self._active_model.index(row))
+
+    def _select_order(self, current: QtCore.QModelIndex, _previous: QtCore.QModelIndex) -> None:
+        order_id = self._active_model.order_id_at(current.row())
+        if order_id is None:
             return
-        order = self.service.get_order(self.current_order_id)
-        items = self.service.get_order_items(self.current_order_id)
-        self.details_window.update_rows(items, order.status)
+        self._show_order(order_id)
+        self.status_combo.setCurrentText(self.service.get_order(order_id).status.value)
+
+    def _show_order(self, order_id: Optional[int]) -> None:
+        self.current_order_id = order_id
+        self._lines_model.set_order(order_id)
+        self._update_order_info()
 
-    def _update_total(self) -> None:
+    def _update_order_info(self) -> None:
         if not self._ensure_order(show_message=False):
+            self.order_info_label.setText("Нет активного заказа")
             self.total_label.setText("Итого: 0.00")
             return
         order = self.service.get_order(self.current_order_id)
+        self.order_info_label.setText(f"Заказ №{order.order_id} · статус {order.status.value}")
         total = self.service.calculate_total(self.current_order_id)
         if order.discount_percent > 0:
-            self.total_label.setText(f"Итого: {total:.2f} (скидка {order.discount_percent:.0f}%)")
+            self.total_label.setText(f"Итого: {format_cents(total)} (скидка {order.discount_percent:.0f}%)")
         else:
-            self.total_label.setText(f"Итого: {total:.2f}")
-
-    def _refresh_active_orders(self, select_order_id: Optional[int] = None) -> None:
-        self.active_orders.clear()
-        active = self.service.list_active_orders()
-        current_index = None
-        for index, order in enumerate(active):
-            label = f"Заказ №{order.order_id} | {order.status.value}"
-            item = QtWidgets.QListWidgetItem(label)
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, order.order_id)
-            self.active_orders.addItem(item)
-            if select_order_id == order.order_id:
-                current_index = index
-            if select_order_id is None and self.current_order_id == order.order_id:
-                current_index = index
-
-        if current_index is not None:
-            self.active_orders.setCurrentRow(current_index)
-            self.current_order_id = self.active_orders.currentItem().data(QtCore.Qt.ItemDataRole.UserRole)
-        elif self.active_orders.count() > 0:
-            self.active_orders.setCurrentRow(0)
-            self.current_order_id = self.active_orders.currentItem().data(QtCore.Qt.ItemDataRole.UserRole)
-        else:
-            self.current_order_id = None
-            self.order_info_label.setText("Нет активного заказа")
-        self._refresh_order()
-        self._update_total()
-
-    def _select_order(self) -> None:
-        item = self.active_orders.currentItem()
-        if not item:
-            return
-        self.current_order_id = item.data(QtCore.Qt.ItemDataRole.UserRole)
-        order = self.service.get_order(self.current_order_id)
-        self.status_combo.setCurrentText(order.status.value)
-        self.order_info_label.setText(f"Заказ №{order.order_id} · статус {order.status.value}")
-        self._refresh_order()
-        self._update_total()
+            self.total_label.setText(f"Итого: {format_cents(total)}")
 
     def _ensure_order(self, show_message: bool = True) -> bool:
         if self.current_order_id is None:
@@ -420,7 +387,12 @@ class MainWindow(QtWidgets.QMainWindow):
         return True
 
     def append_log(self, message: str) -> None:
-        self.log_text.append(message)
+        self.log_view.append(message)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._commands.wait()
+        self._events.close()
+        super().closeEvent(event)
 
     def _apply_style(self) -> None:
         app_font = self.font()
@@ -463,7 +435,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 color: #5b3a2e;
                 font-weight: 600;
             }
-            QListWidget, QTextEdit, QComboBox, QTableWidget, QLineEdit {
+            QListView, QPlainTextEdit, QComboBox, QTableView, QLineEdit {
                 background: #fffaf4;
                 border: 1px solid #d8c9b8;
                 border-radius: 8px;
@@ -471,7 +443,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 selection-background-color: #d4a373;
                 selection-color: #2b1f1a;
             }
-            QTableWidget {
+            QTableView {
                 gridline-color: #e2d2c1;
             }
             QPushButton {
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Hashable, List, Optional
+
+from PyQt6 import QtCore
+
+from core.models.order import EVENT_CREATED, EVENT_ITEMS_CHANGED, EVENT_STATUS_CHANGED, Order
+from core.models.product import Product
+from core.patterns.observer.observers import OrderObserver
+from core.services.order_service import ACTIVE_STATUSES, OrderService
+from core.utils import KeyedRows
+from core.utils.row_sync import Row
+
+ORDER_ID_ROLE = QtCore.Qt.ItemDataRole.UserRole
+PRODUCT_NAME_ROLE = QtCore.Qt.ItemDataRole.UserRole + 1
+
+PRODUCT_COLUMN = 0
+ADD_ONS_COLUMN = 1
+QUANTITY_COLUMN = 2
+STATUS_COLUMN = 3
+SUMMARY_COLUMN = 4
+
+_LINE_HEADERS = ("Товар", "Добавки", "Кол-во", "Статус", "Позиция")
+_NO_PARENT = QtCore.QModelIndex()
+
+
+class _SignalRelay(OrderObserver):
+    def __init__(self, signal: QtCore.pyqtBoundSignal) -> None:
+        self._signal = signal
+
+    def update(self, order: Order, event: str) -> None:
+        self._signal.emit(order.order_id, event)
+
+
+class ServiceEvents(QtCore.QObject):
+    order_event = QtCore.pyqtSignal(int, str)
+
+    def __init__(self, service: OrderService, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._service = service
+        self._relay = _SignalRelay(self.order_event)
+        service.subscribe(self._relay)
+
+    def close(self) -> None:
+        self._service.unsubscribe(self._relay)
+
+
+class MenuModel(QtCore.QAbstractListModel):
+    def __init__(self, products: List[Product], parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._products = list(products)
+        self._labels = [f"{product.get_category().title()}: {product.get_name()}" for product in self._products]
+
+    def rowCount(self, parent: QtCore.QModelIndex = _NO_PARENT) -> int:
+        return 0 if parent.isValid() else len(self._products)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._labels[index.row()]
+        if role == PRODUCT_NAME_ROLE:
+            return self._products[index.row()].get_name()
+        return None
+
+
+class ActiveOrdersModel(QtCore.QAbstractListModel):
+    def __init__(self, service: OrderService, events: ServiceEvents, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._service = service
+        self._order_ids: List[int] = []
+        self._labels: List[str] = []
+        self.reload()
+        events.order_event.connect(self._on_order_event)
+
+    def reload(self) -> None:
+        self.beginResetModel()
+        orders = self._service.list_active_orders()
+        self._order_ids = [order.order_id for order in orders]
+        self._labels = [_order_label(order) for order in orders]
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = _NO_PARENT) -> int:
+        return 0 if parent.isValid() else len(self._order_ids)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._labels[index.row()]
+        if role == ORDER_ID_ROLE:
+            return self._order_ids[index.row()]
+        return None
+
+    def order_id_at(self, row: int) -> Optional[int]:
+        if 0 <= row < len(self._order_ids):
+            return self._order_ids[row]
+        return None
+
+    def row_of(self, order_id: int) -> int:
+        row = bisect_left(self._order_ids, order_id)
+        if row < len(self._order_ids) and self._order_ids[row] == order_id:
+            return row
+        return -1
+
+    def _on_order_event(self, order_id: int, event: str) -> None:
+        if event not in (EVENT_CREATED, EVENT_STATUS_CHANGED):
+            return
+        order = self._service.get_order(order_id)
+        row = bisect_left(self._order_ids, order_id)
+        present = row < len(self._order_ids) and self._order_ids[row] == order_id
+        if order.status in ACTIVE_STATUSES:
+            if present:
+                self._labels[row] = _order_label(order)
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [QtCore.Qt.ItemDataRole.DisplayRole])
+            else:
+                self.beginInsertRows(_NO_PARENT, row, row)
+                self._order_ids.insert(row, order_id)
+                self._labels.insert(row, _order_label(order))
+                self.endInsertRows()
+        elif present:
+            self.beginRemoveRows(_NO_PARENT, row, row)
+            del self._order_ids[row]
+            del self._labels[row]
+            self.endRemoveRows()
+
+
+class OrderLinesModel(QtCore.QAbstractTableModel):
+    def __init__(self, service: OrderService, events: ServiceEvents, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._service = service
+        self._order_id: Optional[int] = None
+        self._keys = KeyedRows()
+        self._rows: List[Row] = []
+        events.order_event.connect(self._on_order_event)
+
+    @property
+    def order_id(self) -> Optional[int]:
+        return self._order_id
+
+    def set_order(self, order_id: Optional[int]) -> None:
+        if order_id == self._order_id:
+            return
+        self.beginResetModel()
+        self._order_id = order_id
+        self._keys.clear()
+        self._rows = []
+        self.endResetModel()
+        self.refresh()
+
+    def refresh(self) -> None:
+        if self._order_id is None:
+            self._keys.sync((), self)
+            return
+        order = self._service.get_order(self._order_id)
+        status_text = order.status.value
+        self._keys.sync(
+            (
+                (
+                    line_id,
+                    (
+                        item.product.get_name(),
+                        item.configuration.extras or "-",
+                        item.quantity,
+                        status_text,
+                        f"{item.get_display_name()} | статус: {status_text}",
+                    ),
+                )
+                for line_id, item in order.lines
+            ),
+            self,
+        )
+
+    def line_id_at(self, row: int) -> Optional[int]:
+        if 0 <= row < len(self._keys):
+            return self._keys.key_at(row)
+        return None
+
+    def rowCount(self, parent: QtCore.QModelIndex = _NO_PARENT) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = _NO_PARENT) -> int:
+        return 0 if parent.isValid() else len(_LINE_HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        value = self._rows[index.row()][index.column()]
+        return str(value) if index.column() == QUANTITY_COLUMN else value
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+            return _LINE_HEADERS[section]
+        return None
+
+    def insert_row(self, index: int, key: Hashable, values: Row) -> None:
+        self.beginInsertRows(_NO_PARENT, index, index)
+        self._rows.insert(index, values)
+        self.endInsertRows()
+
+    def delete_row(self, index: int, key: Hashable) -> None:
+        self.beginRemoveRows(_NO_PARENT, index, index)
+        del self._rows[index]
+        self.endRemoveRows()
+
+    def update_row(self, index: int, key: Hashable, values: Row, previous: Row) -> None:
+        self._rows[index] = values
+        changed = [column for column, (value, old) in enumerate(zip(values, previous)) if value != old]
+        self.dataChanged.emit(
+            self.index(index, changed[0]),
+            self.index(index, changed[-1]),
+            [QtCore.Qt.ItemDataRole.DisplayRole],
+        )
+
+    def move_row(self, old_index: int, index: int, key: Hashable, values: Row) -> None:
+        self.beginMoveRows(_NO_PARENT, old_index, old_index, _NO_PARENT, index)
+        self._rows.insert(index, self._rows.pop(old_index))
+        self.endMoveRows()
+
+    def _on_order_event(self, order_id: int, event: str) -> None:
+        if order_id == self._order_id and event in (EVENT_ITEMS_CHANGED, EVENT_STATUS_CHANGED):
+            self.refresh()
+
+
+def _order_label(order: Order) -> str:
+    return f"Заказ №{order.order_id} | {order.status.value}"
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.models.order import OrderStatus
+
+from .protocol import MAX_LINE_BYTES, decode, encode, error_from
+
+HIGH_WATER_BYTES = 256 * 1024
+
+
+class OrderClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self.events: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        self._out: List[bytes] = []
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_responses())
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 8765, path: str | None = None) -> OrderClient:
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE_BYTES)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE_BYTES)
+        return cls(reader, writer)
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._reader_task
+
+    def send(self, op: str, **args: Any) -> asyncio.Future:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        if self._reader_task.done():
+            future.set_exception(ConnectionError("Соединение с сервером заказов закрыто."))
+            return future
+        self._pending[request_id] = future
+        if not self._out:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._out.append(encode({"id": request_id, "op": op, "args": args}))
+        return future
+
+    async def call(self, op: str, **args: Any) -> Any:
+        future = self.send(op, **args)
+        if self._writer.transport.get_write_buffer_size() > HIGH_WATER_BYTES:
+            self._flush()
+            await self._writer.drain()
+        return await future
+
+    def _flush(self) -> None:
+        if self._out and not self._writer.is_closing():
+            self._writer.write(b"".join(self._out))
+        self._out.clear()
+
+    async def create_order(self) -> Dict[str, Any]:
+        return await self.call("create_order")
+
+    async def get_order(self, order_id: int) -> Dict[str, Any]:
+        return await self.call("get_order", order_id=order_id)
+
+    async def list_active_orders(self) -> List[Dict[str, Any]]:
+        return await self.call("list_active_orders")
+
+    async def list_orders_by_status(self, status: OrderStatus) -> List[Dict[str, Any]]:
+        return await self.call("list_orders_by_status", status=status.value)
+
+    async def get_menu(self) -> Dict[str, List[str]]:
+        return await self.call("get_menu")
+
+    async def add_menu_item(
+        self,
+        order_id: int,
+        product_name: str,
+        add_on_names: Iterable[str] | None = None,
+        quantity: int = 1,
+    ) -> list:
+        return await self.call(
+            "add_menu_item",
+            order_id=order_id,
+            product_name=product_name,
+            add_on_names=None if add_on_names is None else list(add_on_names),
+            quantity=quantity,
+        )
+
+    async def increment_item(self, order_id: int, line_id: int, count: int = 1) -> list:
+        return await self.call("increment_item", order_id=order_id, line_id=line_id, count=count)
+
+    async def decrement_item(self, order_id: int, line_id: int, count: int = 1) -> Optional[list]:
+        return await self.call("decrement_item", order_id=order_id, line_id=line_id, count=count)
+
+    async def remove_item(self, order_id: int, index: int) -> None:
+        await self.call("remove_item", order_id=order_id, index=index)
+
+    async def remove_line(self, order_id: int, line_id: int) -> None:
+        await self.call("remove_line", order_id=order_id, line_id=line_id)
+
+    async def set_discount(self, order_id: int, percent: float, label: str) -> None:
+        await self.call("set_discount", order_id=order_id, percent=percent, label=label)
+
+    async def change_order_status(self, order_id: int, status: OrderStatus) -> None:
+        await self.call("change_order_status", order_id=order_id, status=status.value)
+
+    async def calculate_total(self, order_id: int) -> int:
+        return await self.call("calculate_total", order_id=order_id)
+
+    async def subscribe(self, events: Iterable[str] | None = None, order_ids: Iterable[int] | None = None) -> None:
+        await self.call(
+            "subscribe",
+            events=None if events is None else list(events),
+            order_ids=None if order_ids is None else list(order_ids),
+        )
+
+    async def unsubscribe(self) -> None:
+        await self.call("unsubscribe")
+
+    async def _read_responses(self) -> None:
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                message = decode(line)
+                if "event" in message:
+                    self.events.put_nowait(message)
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if message.get("ok"):
+                    future.set_result(message.get("result"))
+                else:
+                    future.set_exception(error_from(message.get("error", ""), message.get("message", "")))
+        except (ConnectionError, ValueError) as exc:
+            error = exc
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error or ConnectionError("Соединение с сервером заказов закрыто."))
+            self._pending.clear()
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import os
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from core.metrics import Instrumentation, TextfileExporter
+from core.models.order import Order, OrderStatus
+from core.patterns.observer.observers import OrderObserver
+from core.services.order_service import OrderService
+from core.utils import CoffeeOrderError
+
+from .protocol import (
+    INTERNAL_ERROR,
+    MAX_LINE_BYTES,
+    PROTOCOL_ERROR,
+    ProtocolError,
+    decode,
+    encode,
+    item_to_list,
+    order_to_dict,
+)
+
+HIGH_WATER_BYTES = 256 * 1024
+MAX_BUFFERED_BYTES = 8 * 1024 * 1024
+
+
+def _integer(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"ожидалось целое число, получено {value!r}")
+    return value
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"ожидалось число, получено {value!r}")
+    return float(value)
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"ожидалась строка, получено {value!r}")
+    return value
+
+
+def _optional_list(convert: Callable[[Any], Any]) -> Callable[[Any], Optional[list]]:
+    def validate(value: Any) -> Optional[list]:
+        if value is None:
+            return None
+        if not isinstance(value, list):
+            raise TypeError(f"ожидался список, получено {value!r}")
+        return [convert(element) for element in value]
+
+    return validate
+
+
+_VARIADIC = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+_ARGUMENTS: Dict[str, Callable[[Any], Any]] = {
+    "order_id": _integer,
+    "line_id": _integer,
+    "index": _integer,
+    "count": _integer,
+    "quantity": _integer,
+    "percent": _number,
+    "label": _text,
+    "product_name": _text,
+    "add_on_names": _optional_list(_text),
+    "status": OrderStatus,
+    "events": _optional_list(_text),
+    "order_ids": _optional_list(_integer),
+}
+
+
+class _Connection:
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.events: Optional[FrozenSet[str]] = None
+        self.order_ids: Optional[Set[int]] = None
+        self.subscribed = False
+        self._out: List[bytes] = []
+        self._flush_scheduled = False
+
+    def send(self, data: bytes) -> None:
+        self._out.append(data)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self) -> None:
+        self._flush_scheduled = False
+        if not self._out or self.writer.is_closing():
+            self._out.clear()
+            return
+        self.writer.write(b"".join(self._out))
+        self._out.clear()
+        if self.writer.transport.get_write_buffer_size() > MAX_BUFFERED_BYTES:
+            self.writer.close()
+
+    def wants(self, event: str, order_id: int) -> bool:
+        if not self.subscribed:
+            return False
+        if self.events is not None and event not in self.events:
+            return False
+        return self.order_ids is None or order_id in self.order_ids
+
+
+class _EventRelay(OrderObserver):
+    def __init__(self, server: OrderServer, loop: asyncio.AbstractEventLoop) -> None:
+        self._server = server
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+
+    def update(self, order: Order, event: str) -> None:
+        if not self._server.subscribers:
+            return
+        payload = {"event": event, "order_id": order.order_id, "status": order.status.value, "total_cents": order.total}
+        data = encode(payload)
+        if threading.get_ident() == self._loop_thread:
+            self._server._broadcast(event, order.order_id, data)
+        else:
+            self._loop.call_soon_threadsafe(self._server._broadcast, event, order.order_id, data)
+
+
+class OrderServer:
+    def __init__(self, service: OrderService) -> None:
+        self._service = service
+        self._connections: Set[_Connection] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._relay: Optional[_EventRelay] = None
+        self.requests = 0
+        self.subscribers = 0
+        self._parameters: Dict[str, Tuple[FrozenSet[str], FrozenSet[str], bool]] = {}
+        self._handlers: Dict[str, Callable[..., Any]] = {
+            "create_order": lambda: order_to_dict(service.create_order()),
+            "get_order": lambda order_id: order_to_dict(service.get_order(order_id)),
+            "list_active_orders": lambda: [order_to_dict(order) for order in service.list_active_orders()],
+            "list_orders_by_status": lambda status: [
+                order_to_dict(order) for order in service.list_orders_by_status(status)
+            ],
+            "get_menu": self._menu,
+            "add_menu_item": lambda order_id, product_name, add_on_names=None, quantity=1: item_to_list(
+                *service.add_menu_line(order_id, product_name, add_on_names, quantity)
+            ),
+            "increment_item": lambda order_id, line_id, count=1: item_to_list(
+                line_id, service.increment_item(order_id, line_id, count)
+            ),
+            "decrement_item": self._decrement_item,
+            "remove_item": service.remove_item,
+            "remove_line": service.remove_line,
+            "set_discount": service.set_discount,
+            "change_order_status": lambda order_id, status: service.change_order_status(order_id, status),
+            "calculate_total": service.calculate_total,
+            "list_order_items": service.list_order_items,
+        }
+
+    @property
+    def sockets(self) -> List[Any]:
+        return [] if self._server is None else [sock.getsockname() for sock in self._server.sockets]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, path: str | None = None) -> None:
+        loop = asyncio.get_running_loop()
+        self._relay = _EventRelay(self, loop)
+        self._service.subscribe(self._relay)
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve, path, limit=MAX_LINE_BYTES)
+        else:
+            self._server = await asyncio.start_server(self._serve, host, port, limit=MAX_LINE_BYTES)
+
+    async def serve_forever(self) -> None:
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._relay is not None:
+            self._service.unsubscribe(self._relay)
+            self._relay = None
+        if self._server is not None:
+            self._server.close()
+            for connection in list(self._connections):
+                connection.writer.close()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _Connection(writer)
+        self._connections.add(connection)
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    connection.send(encode(_error(None, PROTOCOL_ERROR, "Слишком длинное сообщение.")))
+                    break
+                if not line:
+                    break
+                connection.send(encode(self._handle(connection, line)))
+                if writer.transport.get_write_buffer_size() > HIGH_WATER_BYTES:
+                    connection.flush()
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._unsubscribe(connection)
+            self._connections.discard(connection)
+            connection.flush()
+            writer.close()
+
+    def _handle(self, connection: _Connection, line: bytes) -> Dict[str, Any]:
+        request_id = None
+        self.requests += 1
+        try:
+            request = decode(line)
+            request_id = request.get("id")
+            op = request.get("op")
+            args = request.get("args") or {}
+            if not isinstance(args, dict):
+                raise ProtocolError("Поле args должно быть объектом.")
+            if op == "subscribe":
+                handler: Optional[Callable[..., Any]] = lambda **options: self._subscribe(connection, **options)
+            elif op == "unsubscribe":
+                handler = lambda: self._unsubscribe(connection)
+            else:
+                handler = self._handlers.get(op)
+            if handler is None:
+                raise ProtocolError(f"Неизвестная операция: {op!r}.")
+            return _result(request_id, handler(**self._arguments(op, handler, args)))
+        except ProtocolError as exc:
+            return _error(request_id, PROTOCOL_ERROR, str(exc))
+        except CoffeeOrderError as exc:
+            return _error(request_id, type(exc).__name__, str(exc))
+        except Exception as exc:
+            return _error(request_id, INTERNAL_ERROR, repr(exc))
+
+    def _arguments(self, op: str, handler: Callable[..., Any], args: Dict[str, Any]) -> Dict[str, Any]:
+        parameters = self._parameters.get(op)
+        if parameters is None:
+            parameters = self._parameters[op] = _parameters(handler)
+        required, accepted, open_ended = parameters
+        missing = required.difference(args)
+        if missing:
+            raise ProtocolError(f"Некорректные аргументы для {op}: не хватает {', '.join(sorted(missing))}.")
+        unexpected = () if open_ended else args.keys() - accepted
+        if unexpected:
+            raise ProtocolError(f"Некорректные аргументы для {op}: лишние {', '.join(sorted(unexpected))}.")
+        try:
+            return {name: _ARGUMENTS.get(name, _unchecked)(value) for name, value in args.items()}
+        except (TypeError, ValueError) as exc:
+            raise ProtocolError(f"Некорректные аргументы для {op}: {exc}.") from exc
+
+    def _subscribe(
+        self, connection: _Connection, events: List[str] | None = None, order_ids: List[int] | None = None
+    ) -> bool:
+        connection.events = None if events is None else frozenset(events)
+        connection.order_ids = None if order_ids is None else set(order_ids)
+        if not connection.subscribed:
+            connection.subscribed = True
+            self.subscribers += 1
+        return True
+
+    def _unsubscribe(self, connection: _Connection) -> None:
+        if connection.subscribed:
+            connection.subscribed = False
+            self.subscribers -= 1
+
+    def _broadcast(self, event: str, order_id: int, data: bytes) -> None:
+        for connection in self._connections:
+            if connection.wants(event, order_id):
+                connection.send(data)
+
+    def _menu(self) -> Dict[str, List[str]]:
+        return {
+            "beverages": [product.get_name() for product in self._service.list_beverages()],
+            "desserts": [product.get_name() for product in self._service.list_desserts()],
+            "add_ons": [add_on.get_name() for add_on in self._service.list_add_ons()],
+        }
+
+    def _decrement_item(self, order_id: int, line_id: int, count: int = 1) -> Optional[list]:
+        line = self._service.decrement_item(order_id, line_id, count)
+        return None if line is None else item_to_list(line_id, line)
+
+
+def _unchecked(value: Any) -> Any:
+    return value
+
+
+def _parameters(handler: Callable[..., Any]) -> Tuple[FrozenSet[str], FrozenSet[str], bool]:
+    parameters = inspect.signature(handler).parameters.values()
+    named = [parameter for parameter in parameters if parameter.kind not in _VARIADIC]
+    return (
+        frozenset(parameter.name for parameter in named if parameter.default is inspect.Parameter.empty),
+        frozenset(parameter.name for parameter in named),
+        any(parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters),
+    )
+
+
+def _result(request_id: Any, result: Any) -> Dict[str, Any]:
+    return {"id": request_id, "ok": True, "result": result}
+
+
+def _error(request_id: Any, error: str, message: str) -> Dict[str, Any]:
+    return {"id": request_id, "ok": False, "error": error, "message": message}
+
+
+async def _run(args: argparse.Namespace) -> None:
+    exporter: Optional[TextfileExporter] = None
+    instrumentation: Optional[Instrumentation] = None
+    if args.metrics_file:
+        instrumentation = Instrumentation()
+        exporter = TextfileExporter(instrumentation, args.metrics_file, args.metrics_interval)
+        exporter.start()
+    server = OrderServer(OrderService(observers=[], instrumentation=instrumentation))
+    await server.start(args.host, args.port, args.unix)
+    print(f"Сервер заказов слушает {args.unix or f'{args.host}:{args.port}'}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+        if exporter is not None:
+            exporter.stop()
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Сервер заказов: построчный JSON поверх TCP или Unix-сокета")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="путь к Unix-сокету вместо TCP")
+    parser.add_argument("--metrics-file", help="файл .prom для textfile collector node exporter")
+    parser.add_argument("--metrics-interval", type=float, default=15.0, help="период записи метрик, секунды")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
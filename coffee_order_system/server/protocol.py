@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional, Type
+
+from core.models.order import Order, OrderItem
+from core.utils import (
+    CoffeeOrderError,
+    InvalidAddOnError,
+    OrderNotFoundError,
+    OrderStateError,
+    ProductNotFoundError,
+    StorageError,
+)
+
+MAX_LINE_BYTES = 64 * 1024
+
+PROTOCOL_ERROR = "ProtocolError"
+INTERNAL_ERROR = "InternalError"
+
+ERROR_TYPES: Dict[str, Type[CoffeeOrderError]] = {
+    error.__name__: error
+    for error in (
+        CoffeeOrderError,
+        InvalidAddOnError,
+        OrderNotFoundError,
+        OrderStateError,
+        ProductNotFoundError,
+        StorageError,
+    )
+}
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_decoder = json.JSONDecoder()
+
+
+class ProtocolError(CoffeeOrderError):
+    pass
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    return (_encoder.encode(message) + "\n").encode("utf-8")
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    try:
+        message = _decoder.decode(line.decode("utf-8"))
+    except ValueError as exc:
+        raise ProtocolError(f"Некорректный JSON: {exc}.") from exc
+    if not isinstance(message, dict):
+        raise ProtocolError("Сообщение должно быть JSON-объектом.")
+    return message
+
+
+def item_to_list(line_id: Optional[int], item: OrderItem) -> list:
+    return [line_id, item.product.get_name(), list(item.configuration.add_on_names), item.quantity]
+
+
+def order_to_dict(order: Order) -> Dict[str, Any]:
+    return {
+        "order_id": order.order_id,
+        "status": order.status.value,
+        "lines": [item_to_list(line_id, item) for line_id, item in order.lines],
+        "subtotal_cents": order.subtotal,
+        "total_cents": order.total,
+        "discount_percent": order.discount_percent,
+        "discount_label": order.discount_label,
+        "created_at": order.created_at,
+        "paid_at": order.paid_at,
+    }
+
+
+def error_from(name: str, message: str) -> CoffeeOrderError:
+    if name == PROTOCOL_ERROR:
+        return ProtocolError(message)
+    return ERROR_TYPES.get(name, CoffeeOrderError)(message)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from typing import Sequence
+from core.models.order import Order, OrderStatus
+from core.patterns.observer import COALESCE, DROP_OLDEST, AsyncDispatcher, Logger, OrderEvent, OrderObserver
+from core.services.order_service import OrderService
+from core.storage import InMemoryOrderRepository
+
+
+class BatchRecorder(OrderObserver):
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.batches: list[list[tuple[int, str, OrderStatus]]] = []
+        self.threads: set[str] = set()
+        self._gate = gate
+        self.entered = threading.Event()
+
+    def update(self, order: Order, event: str) -> None:
+        raise AssertionError("ожидалась пакетная доставка")
+
+    def update_batch(self, events: Sequence[OrderEvent]) -> None:
+        self.entered.set()
+        if self._gate is not None:
+            self._gate.wait()
+        self.threads.add(threading.current_thread().name)
+        self.batches.append([(entry.order.order_id, entry.event, entry.status) for entry in events])
+
+    @property
+    def delivered(self) -> list[tuple[int, str, OrderStatus]]:
+        return [event for batch in self.batches for event in batch]
+
+
+class AsyncDispatcherTests(unittest.TestCase):
+    def _service(self, dispatcher: AsyncDispatcher, observer: OrderObserver) -> OrderService:
+        service = OrderService(observers=[], dispatcher=dispatcher)
+        service.subscribe(observer)
+        return service
+
+    def test_events_are_delivered_in_order_off_caller_thread(self) -> None:
+        dispatcher = AsyncDispatcher()
+        recorder = BatchRecorder()
+        service = self._service(dispatcher, recorder)
+        order_id = service.create_order().order_id
+        for status in (OrderStatus.PREPARING, OrderStatus.READY, OrderStatus.PAID):
+            service.change_order_status(order_id, status)
+        dispatcher.shutdown()
+        statuses = [status for _, event, status in recorder.delivered if event == "статус_изменен"]
+        self.assertEqual(statuses, [OrderStatus.PREPARING, OrderStatus.READY, OrderStatus.PAID])
+        self.assertEqual(recorder.threads, {"order-event-dispatcher"})
+        self.assertEqual(service.list_active_orders(), [])
+
+    def test_drop_oldest_keeps_newest_events(self) -> None:
+        gate = threading.Event()
+        dispatcher = AsyncDispatcher(maxsize=2, backpressure=DROP_OLDEST, batch_size=1)
+        recorder = BatchRecorder(gate)
+        service = self._service(dispatcher, recorder)
+        first = service.create_order()
+        self.assertTrue(recorder.entered.wait(5))
+        for _ in range(4):
+            service.create_order()
+        gate.set()
+        dispatcher.shutdown()
+        self.assertEqual(dispatcher.dropped, 2)
+        self.assertEqual([order_id for order_id, _, _ in recorder.delivered], [first.order_id, 4, 5])
+
+    def test_coalesce_merges_pending_status_changes(self) -> None:
+        gate = threading.Event()
+        dispatcher = AsyncDispatcher(maxsize=1, backpressure=COALESCE, batch_size=1)
+        recorder = BatchRecorder(gate)
+        service = OrderService(observers=[], dispatcher=dispatcher)
+        order_id = service.create_order().order_id
+        service.subscribe(recorder, ["статус_изменен"])
+        service.change_order_status(order_id, OrderStatus.PREPARING)
+        self.assertTrue(recorder.entered.wait(5))
+        service.change_order_status(order_id, OrderStatus.READY)
+        service.change_order_status(order_id, OrderStatus.PAID)
+        gate.set()
+        dispatcher.shutdown()
+        self.assertEqual(dispatcher.coalesced, 1)
+        self.assertEqual(
+            [status for _, _, status in recorder.delivered],
+            [OrderStatus.PREPARING, OrderStatus.PAID],
+        )
+
+    def test_events_after_shutdown_are_counted_not_raised(self) -> None:
+        dispatcher = AsyncDispatcher()
+        recorder = BatchRecorder()
+        repository = InMemoryOrderRepository()
+        service = OrderService(observers=[], dispatcher=dispatcher, repository=repository)
+        service.subscribe(recorder)
+        order_id = service.create_order().order_id
+        dispatcher.shutdown()
+        service.change_order_status(order_id, OrderStatus.PREPARING)
+        self.assertEqual(dispatcher.dropped_after_shutdown, 1)
+        self.assertEqual(repository.load_orders()[0].status, OrderStatus.PREPARING.value)
+        self.assertEqual(len(recorder.delivered), 1)
+
+    def test_builtin_observers_format_snapshot_status(self) -> None:
+        messages: list[str] = []
+        dispatcher = AsyncDispatcher()
+        service = self._service(dispatcher, Logger(messages.append))
+        order_id = service.create_order().order_id
+        service.change_order_status(order_id, OrderStatus.READY)
+        service.change_order_status(order_id, OrderStatus.PAID)
+        self.assertTrue(dispatcher.flush(timeout=5))
+        dispatcher.shutdown()
+        self.assertEqual(
+            messages,
+            [
+                f"[ЛОГ] Заказ №{order_id} создан.",
+                f"[ЛОГ] Статус заказа №{order_id} изменен на готов.",
+                f"[ЛОГ] Статус заказа №{order_id} изменен на оплачен.",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
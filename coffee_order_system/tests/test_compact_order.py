@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import itertools
+import unittest
+
+from core.models.order import LINE_INDEX_THRESHOLD, STATUSES, Order, OrderItem, OrderStatus
+from core.models.product import ADD_ON_COUNT_LIMIT, AddOn
+from core.services.menu_factory import MenuFactory
+from core.services.order_service import OrderService
+from core.utils import InvalidAddOnError, ProductNotFoundError
+
+
+class CompactOrderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.menu = MenuFactory()
+        self.service = OrderService(observers=[], verify_totals=True)
+        self.order = self.service.create_order()
+
+    def test_orders_and_items_have_no_instance_dict(self) -> None:
+        self.service.add_menu_item(self.order.order_id, "Латте")
+        self.assertFalse(hasattr(self.order, "__dict__"))
+        self.assertFalse(hasattr(self.order.items[0], "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.order.note = "без сахара"
+
+    def test_status_is_stored_as_small_int(self) -> None:
+        self.assertIs(self.order.status, OrderStatus.CREATED)
+        self.service.change_order_status(self.order.order_id, OrderStatus.READY)
+        self.assertIs(self.order.status, OrderStatus.READY)
+        self.assertIs(STATUSES[self.order.status_code], OrderStatus.READY)
+        restored = Order.restore(7, OrderStatus.PAID, [], 0, "обычный", 0.0, 1.0)
+        self.assertIs(restored.status, OrderStatus.PAID)
+
+    def test_lines_merge_before_and_after_index_threshold(self) -> None:
+        order_id = self.order.order_id
+        add_ons = [add_on.get_name() for add_on in self.menu.list_add_ons()]
+        combos = [list(combo) for combo in itertools.combinations(add_ons, 2)][: LINE_INDEX_THRESHOLD + 4]
+        for extras in combos + combos:
+            self.service.add_menu_item(order_id, "Латте", list(reversed(extras)))
+        self.assertEqual(len(self.order.lines), len(combos))
+        self.assertTrue(all(item.quantity == 2 for item in self.order.items))
+        first_line = self.order.lines[0][0]
+        self.service.remove_line(order_id, first_line)
+        self.service.add_menu_item(order_id, "Латте", combos[0])
+        self.assertEqual(self.order.get_line(self.order.lines[-1][0]).quantity, 1)
+        self.service.calculate_total(order_id)
+
+    def test_add_on_masks_follow_the_menu_catalog(self) -> None:
+        mask = self.menu.add_on_mask(["Шот эспрессо", "Ванильный сироп"])
+        self.assertEqual(mask, self.menu.get_add_on("Шот эспрессо").mask | self.menu.get_add_on("Ванильный сироп").mask)
+        self.assertEqual(
+            [add_on.get_name() for add_on in self.menu.add_ons_from_mask(mask)],
+            ["Ванильный сироп", "Шот эспрессо"],
+        )
+        item = self.service.add_menu_item(self.order.order_id, "Латте", ["Ванильный сироп", "Шот эспрессо"])
+        self.assertEqual(item.configuration.add_on_mask, mask)
+        self.assertEqual(OrderItem.of(self.menu.get_product("Латте")).configuration.add_on_mask, 0)
+        with self.assertRaises(ProductNotFoundError):
+            self.menu.add_ons_from_mask(1 << 60)
+
+    def test_repeated_add_ons_keep_their_count(self) -> None:
+        item = self.service.add_menu_item(self.order.order_id, "Латте", ["Шот эспрессо", "Шот эспрессо"])
+        self.assertEqual(item.get_unit_price(), 600)
+        self.assertEqual(item.get_name(), "Латте (+ Шот эспрессо, Шот эспрессо)")
+        single = self.service.add_menu_item(self.order.order_id, "Латте", ["Шот эспрессо"])
+        self.assertNotEqual(single.configuration, item.configuration)
+        mask = item.configuration.add_on_mask
+        self.assertEqual(mask, 2 * self.menu.get_add_on("Шот эспрессо").mask)
+        self.assertEqual(self.menu.add_ons_from_mask(mask), item.add_ons)
+        with self.assertRaises(InvalidAddOnError):
+            self.service.add_menu_item(self.order.order_id, "Латте", ["Шот эспрессо"] * (ADD_ON_COUNT_LIMIT + 1))
+
+    def test_add_on_slot_is_required(self) -> None:
+        with self.assertRaises(TypeError):
+            AddOn("Мед", "добавка", 40)
+        with self.assertRaises(ValueError):
+            AddOn("Мед", "добавка", 40, slot=64)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import unittest
+from core.models.order import EVENT_CREATED, EVENT_DISCOUNT_CHANGED, EVENT_ITEMS_CHANGED, EVENT_STATUS_CHANGED
+from core.models.order import Order, OrderStatus
+from core.patterns.observer.observers import KitchenDisplay, OrderObserver
+from core.services.order_service import OrderService
+
+
+class RecordingObserver(OrderObserver):
+    def __init__(self) -> None:
+        self.received: list[tuple[int, str]] = []
+
+    def update(self, order: Order, event: str) -> None:
+        self.received.append((order.order_id, event))
+
+
+class EventBusTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = OrderService(observers=[])
+        self.order_id = self.service.create_order().order_id
+
+    def test_set_observers_reaches_existing_orders(self) -> None:
+        recorder = RecordingObserver()
+        self.service.set_observers([recorder])
+        self.service.add_menu_item(self.order_id, "Латте")
+        self.service.set_discount(self.order_id, 10, "постоянный")
+        self.service.change_order_status(self.order_id, OrderStatus.PREPARING)
+        self.assertEqual(
+            recorder.received,
+            [
+                (self.order_id, EVENT_ITEMS_CHANGED),
+                (self.order_id, EVENT_DISCOUNT_CHANGED),
+                (self.order_id, EVENT_STATUS_CHANGED),
+            ],
+        )
+
+    def test_filtered_observers_skip_unrelated_events(self) -> None:
+        messages: list[str] = []
+        self.service.set_observers([KitchenDisplay(messages.append)])
+        self.service.add_menu_item(self.order_id, "Латте")
+        self.service.create_order()
+        self.service.change_order_status(self.order_id, OrderStatus.READY)
+        self.assertEqual(messages, ["[КУХНЯ] Новый заказ №2 создан.", "[КУХНЯ] Заказ №1: статус готов."])
+
+    def test_subscribe_with_explicit_events(self) -> None:
+        created_only = RecordingObserver()
+        self.service.subscribe(created_only, [EVENT_CREATED])
+        self.service.change_order_status(self.order_id, OrderStatus.READY)
+        self.service.create_order()
+        self.assertEqual(created_only.received, [(2, EVENT_CREATED)])
+
+
+if __name__ == "__main__":
+    unittest.main()
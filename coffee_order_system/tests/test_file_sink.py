@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import gzip
+import os
+import tempfile
+import unittest
+from core.models.order import OrderStatus
+from core.patterns.observer import Logger, RotatingFileSink
+from core.services.order_service import OrderService
+
+DAY = 24 * 60 * 60
+
+
+class RotatingFileSinkTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "orders.log")
+        self.now = 1_700_000_000.0
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _read(self, path: str) -> str:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as handle:
+            return handle.read()
+
+    def _segments(self) -> list[str]:
+        return sorted(name for name in os.listdir(self._tmp.name) if name != "orders.log")
+
+    def test_buffers_until_flush(self) -> None:
+        sink = RotatingFileSink(self.path, flush_interval=60)
+        service = OrderService(observers=[Logger(sink)])
+        order_id = service.create_order().order_id
+        service.change_order_status(order_id, OrderStatus.PAID)
+        self.assertEqual(self._read(self.path), "")
+        sink.flush()
+        self.assertEqual(
+            self._read(self.path),
+            "[ЛОГ] Заказ №1 создан.\n[ЛОГ] Статус заказа №1 изменен на оплачен.\n",
+        )
+        sink.close()
+
+    def test_rotates_by_size_and_compresses(self) -> None:
+        sink = RotatingFileSink(self.path, max_bytes=100, buffer_bytes=1, compress=True, clock=lambda: self.now)
+        for index in range(10):
+            sink(f"строка {index:02d} " + "x" * 20)
+        sink.close()
+        segments = self._segments()
+        self.assertTrue(segments)
+        self.assertTrue(all(name.endswith(".gz") for name in segments))
+        text = "".join(self._read(os.path.join(self._tmp.name, name)) for name in segments)
+        text += self._read(self.path)
+        self.assertEqual(text.count("\n"), 10)
+        self.assertLess(os.path.getsize(self.path), 100)
+
+    def test_rotates_on_day_change(self) -> None:
+        sink = RotatingFileSink(self.path, clock=lambda: self.now, flush_interval=60)
+        sink("вчера")
+        sink.flush()
+        self.now += DAY
+        sink("сегодня")
+        sink.close()
+        self.assertEqual(len(self._segments()), 1)
+        self.assertEqual(self._read(os.path.join(self._tmp.name, self._segments()[0])), "вчера\n")
+        self.assertEqual(self._read(self.path), "сегодня\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from typing import Tuple
+
+from core.metrics import Instrumentation, LatencyHistogram, render, write_textfile
+from core.metrics.histogram import bucket_bounds, bucket_index
+from core.models.order import Order, OrderStatus
+from core.patterns.observer.async_dispatcher import AsyncDispatcher
+from core.patterns.observer.event_bus import EventBus
+from core.patterns.observer.observers import KitchenDisplay, OrderObserver
+from core.services.order_service import INSTRUMENTED_METHODS, OrderService
+
+
+class SilentObserver(OrderObserver):
+    def update(self, order: Order, event: str) -> None:
+        pass
+
+
+class RecordingObserver(OrderObserver):
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+
+    def update(self, order: Order, event: str) -> None:
+        self._log.append("inline")
+
+
+class RecordingDispatcher(AsyncDispatcher):
+    def __init__(self, log: list[str]) -> None:
+        super().__init__()
+        self._log = log
+
+    def submit(self, observers: Tuple[OrderObserver, ...], order: Order, event: str) -> None:
+        self._log.append("deferred")
+
+
+class LatencyHistogramTests(unittest.TestCase):
+    def test_buckets_are_contiguous_and_bounded(self) -> None:
+        for value in (0, 1, 127, 128, 255, 256, 1000, 123456, 10**9 + 7):
+            lowest, highest = bucket_bounds(bucket_index(value))
+            self.assertLessEqual(lowest, value)
+            self.assertGreaterEqual(highest, value)
+            self.assertLessEqual(highest - lowest, max(1, value // 128))
+        self.assertEqual(bucket_index(bucket_bounds(300)[1] + 1), 301)
+
+    def test_percentiles_stay_within_relative_error(self) -> None:
+        histogram = LatencyHistogram()
+        for value in range(1, 100001):
+            histogram.record(value * 10)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot.count, 100000)
+        self.assertEqual((snapshot.min_ns, snapshot.max_ns), (10, 1000000))
+        for fraction, expected in ((0.5, 500000), (0.99, 990000), (0.999, 999000)):
+            self.assertAlmostEqual(snapshot.percentile(fraction), expected, delta=expected / 100)
+        self.assertEqual(snapshot.percentile(1.0), 1000000)
+
+    def test_merge_combines_counts(self) -> None:
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(100)
+        second.record(50)
+        second.record(5000)
+        first.merge(second)
+        self.assertEqual((first.count, first.min_ns, first.max_ns, first.total_ns), (3, 50, 5000, 5150))
+
+
+class ServiceInstrumentationTests(unittest.TestCase):
+    def test_disabled_service_keeps_plain_methods(self) -> None:
+        service = OrderService(observers=[])
+        self.assertFalse(set(INSTRUMENTED_METHODS) & set(vars(service)))
+        service.set_instrumentation(Instrumentation())
+        service.set_instrumentation(None)
+        self.assertFalse(set(INSTRUMENTED_METHODS) & set(vars(service)))
+        self.assertIsNone(service.event_bus.instrumentation)
+
+    def test_counts_calls_and_observer_dispatch(self) -> None:
+        instrumentation = Instrumentation()
+        service = OrderService(
+            observers=[KitchenDisplay(lambda message: None), SilentObserver()],
+            instrumentation=instrumentation,
+        )
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, "Латте")
+        service.add_menu_item(order_id, "Чизкейк")
+        service.change_order_status(order_id, OrderStatus.PREPARING)
+
+        snapshot = instrumentation.snapshot()
+        self.assertEqual(snapshot.methods["OrderService.add_menu_item"].count, 2)
+        self.assertEqual(snapshot.methods["OrderService.change_order_status"].count, 1)
+        self.assertEqual(snapshot.methods["Order.notify"].count, 4)
+        self.assertEqual(snapshot.observers["SilentObserver"].count, 4)
+        self.assertEqual(snapshot.observers["KitchenDisplay"].count, 2)
+        self.assertEqual(snapshot.observers["StatusIndex"].count, 1)
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot().methods, {})
+        service.calculate_total(order_id)
+        self.assertEqual(list(instrumentation.snapshot().methods), ["OrderService.calculate_total"])
+
+    def test_errors_are_still_timed(self) -> None:
+        instrumentation = Instrumentation()
+        service = OrderService(observers=[], instrumentation=instrumentation)
+        with self.assertRaises(Exception):
+            service.get_order(42)
+        self.assertEqual(instrumentation.snapshot().methods["OrderService.get_order"].count, 1)
+
+    def test_deferred_observers_are_timed_by_dispatcher(self) -> None:
+        dispatcher = AsyncDispatcher()
+        instrumentation = Instrumentation()
+        service = OrderService(observers=[SilentObserver()], dispatcher=dispatcher, instrumentation=instrumentation)
+        try:
+            service.create_order()
+            dispatcher.flush()
+        finally:
+            dispatcher.shutdown()
+        self.assertGreaterEqual(instrumentation.snapshot().observers["SilentObserver"].count, 1)
+
+    def test_timed_publish_runs_inline_observers_before_queueing(self) -> None:
+        log: list[str] = []
+        dispatcher = RecordingDispatcher(log)
+        try:
+            bus = EventBus(dispatcher)
+            bus.subscribe(SilentObserver())
+            bus.subscribe(RecordingObserver(log), synchronous=True)
+            bus.set_instrumentation(Instrumentation())
+            bus.publish(Order(1), "создан")
+        finally:
+            dispatcher.shutdown()
+        self.assertEqual(log, ["inline", "deferred"])
+
+
+class PrometheusExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.instrumentation = Instrumentation()
+        self.instrumentation.record_call("OrderService.create_order", 3000)
+        self.instrumentation.record_call("OrderService.create_order", 40000)
+        self.instrumentation.record_dispatch(SilentObserver(), 2000)
+
+    def test_render_histogram_families(self) -> None:
+        text = render(self.instrumentation.snapshot())
+        self.assertIn("# TYPE coffee_order_call_duration_seconds histogram", text)
+        self.assertIn('coffee_order_call_duration_seconds_bucket{method="OrderService.create_order",le="5e-06"} 1', text)
+        self.assertIn('coffee_order_call_duration_seconds_bucket{method="OrderService.create_order",le="+Inf"} 2', text)
+        self.assertIn('coffee_order_call_duration_seconds_count{method="OrderService.create_order"} 2', text)
+        self.assertIn('coffee_order_observer_dispatch_duration_seconds_count{observer="SilentObserver"} 1', text)
+        self.assertIn('coffee_order_call_quantile_seconds{method="OrderService.create_order",quantile="0.5"}', text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_write_textfile_replaces_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "orders.prom")
+            write_textfile(self.instrumentation, path)
+            write_textfile(self.instrumentation, path)
+            self.assertEqual(os.listdir(directory), ["orders.prom"])
+            with open(path, encoding="utf-8") as file:
+                self.assertIn("coffee_order_call_duration_seconds_sum", file.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pickle
+import unittest
+
+from core.models.order import CONFIGURATION_CACHE_SIZE, ItemConfiguration, OrderItem
+from core.services.menu_factory import MenuFactory
+from core.services.order_service import OrderService
+
+
+class ItemConfigurationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        menu = MenuFactory()
+        self.latte = menu.get_product("Латте")
+        self.vanilla = menu.get_add_on("Ванильный сироп")
+        self.shot = menu.get_add_on("Шот эспрессо")
+
+    def test_configurations_are_interned_regardless_of_add_on_order(self) -> None:
+        first = ItemConfiguration.of(self.latte, [self.shot, self.vanilla])
+        second = ItemConfiguration.of(self.latte, (self.vanilla, self.shot))
+        self.assertIs(first, second)
+        self.assertEqual(first.add_ons, (self.vanilla, self.shot))
+        self.assertEqual(first.name, "Латте (+ Ванильный сироп, Шот эспрессо)")
+        self.assertEqual(first.unit_price, 550)
+        self.assertEqual(ItemConfiguration.cache_info().maxsize, CONFIGURATION_CACHE_SIZE)
+
+    def test_items_are_hashable_and_share_configuration(self) -> None:
+        single = OrderItem.of(self.latte, [self.vanilla])
+        triple = single.with_quantity(3)
+        self.assertIs(single.configuration, triple.configuration)
+        self.assertEqual(len({single, OrderItem.of(self.latte, [self.vanilla]), triple}), 2)
+        self.assertEqual(triple.get_price(), 1350)
+        self.assertEqual(triple.get_name(), "Латте (+ Ванильный сироп)")
+        self.assertEqual(triple.get_display_name(), "Латте (+ Ванильный сироп) ×3")
+        self.assertEqual(single.get_display_name(), "Латте (+ Ванильный сироп)")
+
+    def test_evicted_configurations_still_compare_equal(self) -> None:
+        kept = ItemConfiguration.of(self.latte, [self.vanilla])
+        ItemConfiguration.clear_cache()
+        fresh = ItemConfiguration.of(self.latte, [self.vanilla])
+        self.assertIsNot(kept, fresh)
+        self.assertEqual(kept, fresh)
+        self.assertEqual(hash(kept), hash(fresh))
+
+    def test_unpickling_reinterns(self) -> None:
+        item = OrderItem.of(self.latte, [self.shot], 2)
+        restored = pickle.loads(pickle.dumps(item))
+        self.assertEqual(restored, item)
+        self.assertIs(restored.configuration, item.configuration)
+
+    def test_orders_share_configurations_across_lines(self) -> None:
+        service = OrderService(observers=[])
+        first = service.create_order().order_id
+        second = service.create_order().order_id
+        service.add_menu_item(first, "Латте", ["Шот эспрессо", "Ванильный сироп"])
+        service.add_menu_item(second, "Латте", ["Ванильный сироп", "Шот эспрессо"])
+        self.assertIs(
+            service.get_order_items(first)[0].configuration,
+            service.get_order_items(second)[0].configuration,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from core.utils import KeyedSerializer
+
+
+class KeyedSerializerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = ThreadPoolExecutor(max_workers=4)
+        self.serializer = KeyedSerializer(self.pool.submit)
+
+    def tearDown(self) -> None:
+        self.pool.shutdown(wait=True)
+
+    def test_tasks_for_one_key_run_in_order_without_overlap(self) -> None:
+        seen: list[int] = []
+        running = []
+        done = threading.Event()
+
+        def task(value: int) -> None:
+            running.append(value)
+            self.assertEqual(len(running), 1)
+            seen.append(value)
+            running.pop()
+
+        for value in range(200):
+            self.serializer.submit(1, lambda value=value: task(value))
+        self.serializer.submit(1, done.set)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(seen, list(range(200)))
+
+    def test_different_keys_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=2)
+        results = []
+        self.serializer.submit(1, lambda: results.append(barrier.wait()))
+        self.serializer.submit(2, lambda: results.append(barrier.wait()))
+        self.pool.shutdown(wait=True)
+        self.assertEqual(sorted(results), [0, 1])
+
+    def test_failing_task_does_not_stall_queue(self) -> None:
+        done = threading.Event()
+
+        def fail() -> None:
+            raise RuntimeError("сбой")
+
+        self.serializer.submit(1, fail)
+        self.serializer.submit(1, done.set)
+        self.assertTrue(done.wait(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
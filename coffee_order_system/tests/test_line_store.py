@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import unittest
+
+from core.analytics import (
+    ADD_ON_UNITS,
+    BY_ADD_ONS,
+    BY_HOUR,
+    BY_STATUS,
+    GROSS_REVENUE,
+    LINES,
+    PAID_AT,
+    QUANTITY,
+    OrderLineStore,
+)
+from core.analytics.line_store import np
+from core.models.order import OrderStatus
+from core.services.menu_factory import MenuFactory
+from core.services.order_service import OrderService
+
+
+class OrderLineStoreTests(unittest.TestCase):
+    use_numpy = False
+
+    def setUp(self) -> None:
+        self.store = OrderLineStore(use_numpy=self.use_numpy)
+        self.service = OrderService(observers=[])
+        self.service.subscribe(self.store)
+        self.first = self.service.create_order().order_id
+        self.service.add_menu_item(self.first, "Латте", ["Ванильный сироп", "Шот эспрессо"], quantity=2)
+        self.service.add_menu_item(self.first, "Чизкейк")
+        self.second = self.service.create_order().order_id
+        self.service.add_menu_item(self.second, "Латте")
+        self.service.add_menu_item(self.second, "Эспрессо", quantity=3)
+        self.service.change_order_status(self.first, OrderStatus.PAID)
+
+    def test_gross_revenue_per_product(self) -> None:
+        self.assertEqual(self.store.group_by(), {"Латте": 1500, "Чизкейк": 450, "Эспрессо": 750})
+        self.assertEqual(self.store.group_by(statuses=[OrderStatus.PAID]), {"Латте": 1100, "Чизкейк": 450})
+        self.assertEqual(self.store.total(statuses=[OrderStatus.PAID]), 1550)
+
+    def test_gross_revenue_ignores_order_discounts(self) -> None:
+        self.service.set_discount(self.second, 10, "студент")
+        self.service.change_order_status(self.second, OrderStatus.PAID)
+        orders = self.service.list_orders_by_status(OrderStatus.PAID)
+        gross = self.store.total(GROSS_REVENUE, [OrderStatus.PAID])
+        self.assertEqual(gross, sum(order.subtotal for order in orders))
+        self.assertEqual(gross - sum(order.total for order in orders), 115)
+
+    def test_lines_follow_item_changes(self) -> None:
+        self.service.decrement_item(self.second, 2, 2)
+        self.service.remove_line(self.second, 1)
+        self.assertEqual(self.store.group_by(measure=QUANTITY), {"Латте": 2, "Чизкейк": 1, "Эспрессо": 1})
+        self.assertEqual(self.store.group_by(BY_STATUS, LINES), {OrderStatus.CREATED: 1, OrderStatus.PAID: 2})
+        self.assertEqual(len(self.store), 4)
+
+    def test_add_on_queries(self) -> None:
+        self.assertAlmostEqual(self.store.mean_add_ons("Латте"), 4 / 3)
+        self.assertEqual(self.store.group_by(measure=ADD_ON_UNITS)["Латте"], 4)
+        menu = MenuFactory()
+        mask = menu.add_on_mask(["Ванильный сироп", "Шот эспрессо"])
+        self.assertEqual(self.store.group_by(BY_ADD_ONS, QUANTITY), {0: 5, mask: 2})
+
+    def test_repeated_add_ons_count_every_unit(self) -> None:
+        self.service.add_menu_item(self.second, "Латте", ["Шот эспрессо", "Шот эспрессо"])
+        menu = MenuFactory()
+        double_shot = menu.add_on_mask(["Шот эспрессо", "Шот эспрессо"])
+        self.assertEqual(self.store.group_by(BY_ADD_ONS, QUANTITY)[double_shot], 1)
+        self.assertEqual(self.store.group_by(measure=ADD_ON_UNITS)["Латте"], 6)
+
+    def test_time_filters(self) -> None:
+        paid_at = self.service.get_order(self.first).paid_at
+        hour = int(paid_at // 3600)
+        self.assertEqual(self.store.group_by(BY_HOUR, LINES, timestamp=PAID_AT), {-1: 2, hour: 2})
+        self.assertEqual(self.store.total(LINES, since=paid_at, timestamp=PAID_AT), 2)
+        self.assertEqual(self.store.total(LINES, until=0), 0)
+
+    def test_backfill_and_clear(self) -> None:
+        store = OrderLineStore(use_numpy=self.use_numpy)
+        store.track_all(self.service.list_orders_by_status(OrderStatus.PAID))
+        self.assertEqual(store.total(), 1550)
+        store.clear()
+        self.assertEqual(store.group_by(), {})
+        with self.assertRaises(ValueError):
+            store.group_by("weekday")
+
+
+@unittest.skipIf(np is None, "NumPy не установлен")
+class NumpyOrderLineStoreTests(OrderLineStoreTests):
+    use_numpy = True
+
+
+if __name__ == "__main__":
+    unittest.main()
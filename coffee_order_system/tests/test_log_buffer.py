@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import unittest
+
+from core.utils import LogBuffer
+
+
+class LogBufferTests(unittest.TestCase):
+    def test_drain_batches_pending_messages(self) -> None:
+        buffer = LogBuffer(capacity=10)
+        buffer.append("первое")
+        buffer("второе")
+        self.assertEqual(buffer.drain(), (["первое", "второе"], 0))
+        self.assertEqual(buffer.drain(), ([], 0))
+        self.assertEqual(len(buffer), 2)
+
+    def test_trim_keeps_shown_lines_at_capacity(self) -> None:
+        buffer = LogBuffer(capacity=3)
+        buffer.append("a")
+        buffer.append("b")
+        buffer.drain()
+        buffer.append("c")
+        buffer.append("d")
+        self.assertEqual(buffer.drain(), (["c", "d"], 1))
+        self.assertEqual(len(buffer), 3)
+
+    def test_pending_is_bounded_between_frames(self) -> None:
+        buffer = LogBuffer(capacity=100)
+        for index in range(10_000):
+            buffer.append(index)
+        lines, trimmed = buffer.drain()
+        self.assertEqual(lines, [str(index) for index in range(9_900, 10_000)])
+        self.assertEqual(trimmed, 0)
+        self.assertEqual(buffer.dropped, 9_900)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import unittest
+
+from core.models.money import apply_discount, discount_cents, format_cents, percent_to_basis_points
+from core.services.order_service import OrderService
+
+
+class MoneyTests(unittest.TestCase):
+    def test_format_cents(self) -> None:
+        self.assertEqual(format_cents(470), "4.70")
+        self.assertEqual(format_cents(5), "0.05")
+        self.assertEqual(format_cents(-1250), "-12.50")
+
+    def test_discount_rounds_half_up_to_whole_cents(self) -> None:
+        self.assertEqual(discount_cents(5, percent_to_basis_points(10)), 1)
+        self.assertEqual(discount_cents(4, percent_to_basis_points(10)), 0)
+        self.assertEqual(discount_cents(999, percent_to_basis_points(12.5)), 125)
+        self.assertEqual(apply_discount(1000, percent_to_basis_points(33.33)), 667)
+        self.assertEqual(apply_discount(1000, percent_to_basis_points(100)), 0)
+
+    def test_order_total_uses_integer_discount(self) -> None:
+        service = OrderService(observers=[], verify_totals=True)
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, "Эспрессо", ["Кокосовое молоко"], quantity=3)
+        service.set_discount(order_id, 15, "акция")
+        total = service.calculate_total(order_id)
+        self.assertIsInstance(total, int)
+        self.assertEqual(total, 816)
+
+
+if __name__ == "__main__":
+    unittest.main()
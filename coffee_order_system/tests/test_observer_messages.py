@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+from core.models.order import EVENT_CREATED, EVENT_ITEMS_CHANGED, EVENT_STATUS_CHANGED, OrderStatus
+from core.patterns.observer import DEBUG, WARNING, CustomerNotifier, Logger, OrderMessage
+from core.services.order_service import OrderService
+
+
+class CollectingSink:
+    accepts_messages = True
+
+    def __init__(self) -> None:
+        self.messages: list[OrderMessage] = []
+
+    def __call__(self, message: OrderMessage) -> None:
+        self.messages.append(message)
+
+
+class ObserverMessageTests(unittest.TestCase):
+    def test_structured_sink_receives_unrendered_messages(self) -> None:
+        sink = CollectingSink()
+        service = OrderService(observers=[CustomerNotifier(sink)])
+        order_id = service.create_order().order_id
+        service.change_order_status(order_id, OrderStatus.READY)
+        self.assertTrue(all(isinstance(message, OrderMessage) for message in sink.messages))
+        self.assertEqual([message.event for message in sink.messages], [EVENT_CREATED, EVENT_STATUS_CHANGED])
+        self.assertEqual(sink.messages[1].status, OrderStatus.READY)
+        self.assertEqual(str(sink.messages[1]), f"[КЛИЕНТ] Ваш заказ №{order_id}: готов.")
+
+    def test_level_filter_skips_debug_events(self) -> None:
+        messages: list[str] = []
+        events = [EVENT_CREATED, EVENT_ITEMS_CHANGED]
+        quiet = Logger(messages.append, events=events)
+        verbose = Logger(messages.append, events=events, level=DEBUG)
+        service = OrderService(observers=[quiet, verbose])
+        order_id = service.create_order().order_id
+        service.add_menu_item(order_id, "Латте")
+        self.assertEqual(
+            messages,
+            [
+                f"[ЛОГ] Заказ №{order_id} создан.",
+                f"[ЛОГ] Заказ №{order_id} создан.",
+                f"[ЛОГ] Заказ №{order_id}: позиции изменены.",
+            ],
+        )
+        self.assertFalse(Logger(level=WARNING).enabled_for(EVENT_STATUS_CHANGED))
+
+
+if __name__ == "__main__":
+    unittest.main()
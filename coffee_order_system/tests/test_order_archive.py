@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import unittest
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+from core.utils import OrderStateError
+
+
+class OrderArchiveTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = OrderService(observers=[], archive_after=60)
+        self.order = self.service.create_order()
+        self.service.add_menu_item(self.order.order_id, "Капучино", ["Кокосовое молоко"], quantity=2)
+        self.service.add_menu_item(self.order.order_id, "Чизкейк")
+        self.service.set_discount(self.order.order_id, 10, "постоянный")
+        self.service.change_order_status(self.order.order_id, OrderStatus.PAID)
+
+    def test_paid_order_waits_for_delay(self) -> None:
+        self.assertEqual(self.service.archive_paid_orders(now=self.order.paid_at + 30), 0)
+        self.assertEqual(self.service.archive_paid_orders(now=self.order.paid_at + 61), 1)
+        self.assertEqual(self.service.archived_count, 1)
+        self.assertEqual(self.service.archived_revenue, 1161)
+        self.assertEqual(self.service.list_orders_by_status(OrderStatus.PAID), [])
+
+    def test_get_order_restores_archived_order(self) -> None:
+        self.service.archive_paid_orders(now=self.order.paid_at + 61)
+        restored = self.service.get_order(self.order.order_id)
+        self.assertIsNot(restored, self.order)
+        self.assertEqual(restored.status, OrderStatus.PAID)
+        self.assertEqual(restored.discount_label, "постоянный")
+        self.assertEqual(
+            self.service.list_order_items(self.order.order_id),
+            ["Капучино (+ Кокосовое молоко) ×2", "Чизкейк"],
+        )
+        self.assertEqual(self.service.calculate_total(self.order.order_id), self.order.total)
+
+    def test_archived_order_is_read_only(self) -> None:
+        self.service.archive_paid_orders(now=self.order.paid_at + 61)
+        with self.assertRaises(OrderStateError):
+            self.service.add_menu_item(self.order.order_id, "Латте")
+
+
+if __name__ == "__main__":
+    unittest.main()
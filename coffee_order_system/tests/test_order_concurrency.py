@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import sys
+import threading
+import unittest
+
+from core.models.order import Order, OrderStatus
+from core.patterns.observer.observers import OrderObserver
+from core.services.order_service import OrderService
+
+THREADS = 8
+ORDERS_PER_THREAD = 50
+SHARED_ADDS_PER_THREAD = 200
+
+
+class ReentrantObserver(OrderObserver):
+    def __init__(self) -> None:
+        self.service: OrderService | None = None
+        self.totals: list[int] = []
+
+    def update(self, order: Order, event: str) -> None:
+        assert self.service is not None
+        self.totals.append(self.service.calculate_total(order.order_id))
+        if order.status == OrderStatus.PREPARING:
+            self.service.change_order_status(order.order_id, OrderStatus.READY)
+
+
+class OrderServiceConcurrencyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+    def test_parallel_terminals_keep_invariants(self) -> None:
+        service = OrderService(observers=[], verify_totals=True, archive_after=0)
+        shared = service.create_order()
+        errors: list[BaseException] = []
+        created: list[list[int]] = [[] for _ in range(THREADS)]
+        start = threading.Barrier(THREADS)
+
+        def terminal(index: int) -> None:
+            try:
+                start.wait()
+                for step in range(ORDERS_PER_THREAD):
+                    order = service.create_order()
+                    created[index].append(order.order_id)
+                    service.add_menu_item(order.order_id, "Латте", ["Ванильный сироп"])
+                    service.add_menu_item(order.order_id, "Чизкейк")
+                    service.set_discount(order.order_id, 10.0, "постоянный")
+                    service.calculate_total(order.order_id)
+                    if step % 2:
+                        service.change_order_status(order.order_id, OrderStatus.PAID)
+                    service.list_active_orders()
+                for _ in range(SHARED_ADDS_PER_THREAD):
+                    service.add_menu_item(shared.order_id, "Эспрессо")
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=terminal, args=(index,)) for index in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        order_ids = sorted(order_id for ids in created for order_id in ids)
+        self.assertEqual(order_ids, list(range(2, 2 + THREADS * ORDERS_PER_THREAD)))
+        lines = service.get_order_lines(shared.order_id)
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0][1].quantity, THREADS * SHARED_ADDS_PER_THREAD)
+        service.calculate_total(shared.order_id)
+        active = service.list_active_orders()
+        self.assertEqual(len(active), 1 + THREADS * ORDERS_PER_THREAD // 2)
+        service.archive_paid_orders()
+        self.assertEqual(service.archived_count, THREADS * ORDERS_PER_THREAD // 2)
+        self.assertEqual(service.list_orders_by_status(OrderStatus.PAID), [])
+
+
+    def test_observer_may_call_back_into_the_same_order(self) -> None:
+        observer = ReentrantObserver()
+        service = OrderService(observers=[observer], verify_totals=True)
+        observer.service = service
+        finished = threading.Event()
+
+        def scenario() -> None:
+            order = service.create_order()
+            service.add_menu_item(order.order_id, "Эспрессо")
+            service.change_order_status(order.order_id, OrderStatus.PREPARING)
+            finished.set()
+
+        thread = threading.Thread(target=scenario, daemon=True)
+        thread.start()
+        self.assertTrue(finished.wait(5), "Наблюдатель заблокировал заказ.")
+        self.assertEqual(observer.totals, [0, 250, 250, 250])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+from core.storage import JournalOrderRepository
+from core.storage.journal import ARCHIVE_FILE, JOURNAL_FILE, SNAPSHOT_FILE
+from core.utils import StorageError
+
+
+class OrderJournalTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        self.journal_path = os.path.join(self.directory, JOURNAL_FILE)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _fill(
+        self, repository: JournalOrderRepository, orders: int, archive_after: float | None = None
+    ) -> OrderService:
+        service = OrderService(observers=[], repository=repository, archive_after=archive_after)
+        for index in range(orders):
+            order_id = service.create_order().order_id
+            service.add_menu_item(order_id, "Капучино", ["Ванильный сироп"], quantity=1 + index % 2)
+            service.set_discount(order_id, 10, "постоянный")
+            service.change_order_status(order_id, OrderStatus.PAID)
+        return service
+
+    def test_snapshot_plus_tail_replay(self) -> None:
+        repository = JournalOrderRepository(self.directory, snapshot_every=50)
+        self._fill(repository, 30)
+        repository.close()
+        self.assertTrue(os.path.exists(os.path.join(self.directory, SNAPSHOT_FILE)))
+
+        reopened = JournalOrderRepository(self.directory, snapshot_every=50)
+        self.assertLess(reopened.replayed_records, 50)
+        service = OrderService(observers=[], repository=reopened)
+        self.assertEqual(len(service.list_orders_by_status(OrderStatus.PAID)), 30)
+        self.assertEqual(service.list_order_items(30), ["Капучино (+ Ванильный сироп) ×2"])
+        self.assertEqual(service.get_order(30).discount_label, "постоянный")
+        reopened.close()
+
+    def test_truncated_and_corrupted_tail_is_discarded(self) -> None:
+        repository = JournalOrderRepository(self.directory)
+        service = self._fill(repository, 3)
+        service.create_order()
+        repository.close()
+        with open(self.journal_path, "rb") as handle:
+            data = handle.read()
+        last_line_start = data.rstrip(b"\n").rfind(b"\n") + 1
+        with open(self.journal_path, "wb") as handle:
+            handle.write(data[: last_line_start + 5])
+
+        reopened = JournalOrderRepository(self.directory)
+        self.assertEqual(reopened.discarded_bytes, 5)
+        service = OrderService(observers=[], repository=reopened)
+        self.assertEqual(len(service.list_orders_by_status(OrderStatus.PAID)), 3)
+        self.assertEqual(service.list_active_orders(), [])
+        service.create_order()
+        reopened.close()
+
+        with open(self.journal_path, "ab") as handle:
+            handle.write(b"deadbeef [\"c\",99,0.0]\n")
+        again = JournalOrderRepository(self.directory)
+        self.assertGreater(again.discarded_bytes, 0)
+        active = OrderService(observers=[], repository=again).list_active_orders()
+        self.assertEqual([order.order_id for order in active], [4])
+        again.close()
+
+    def test_snapshot_is_written_in_background(self) -> None:
+        repository = JournalOrderRepository(self.directory, fsync_interval=0.01, snapshot_every=20)
+        self._fill(repository, 10)
+        deadline = time.monotonic() + 5
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        while not os.path.exists(snapshot_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(os.path.exists(snapshot_path))
+        repository.close()
+        self.assertEqual(sorted(os.listdir(self.directory)), [JOURNAL_FILE, SNAPSHOT_FILE])
+
+    def test_orders_archived_by_the_service_leave_memory(self) -> None:
+        repository = JournalOrderRepository(self.directory, snapshot_every=10 ** 9)
+        service = self._fill(repository, 5, archive_after=0)
+        open_order = service.create_order().order_id
+        revenue = service.archived_revenue
+        repository.snapshot()
+        self.assertEqual([stored.order_id for stored in repository.load_orders()], [open_order])
+        self.assertEqual(repository.archived_orders, 5)
+        repository.close()
+
+        reopened = JournalOrderRepository(self.directory)
+        archived = reopened.load_archived()
+        self.assertEqual([stored.order_id for stored in archived], [1, 2, 3, 4, 5])
+        self.assertEqual(archived[1].lines, ((1, "Капучино", ("Ванильный сироп",), 2),))
+        service = OrderService(observers=[], repository=reopened)
+        self.assertEqual(service.archived_count, 5)
+        self.assertEqual(service.archived_revenue, revenue)
+        self.assertEqual(service.get_order(2).status, OrderStatus.PAID)
+        self.assertEqual(service.list_order_items(2), ["Капучино (+ Ванильный сироп) ×2"])
+        self.assertEqual(service.create_order().order_id, open_order + 1)
+        reopened.close()
+        self.assertTrue(os.path.exists(os.path.join(self.directory, ARCHIVE_FILE)))
+
+    def test_archived_orders_survive_restart_before_snapshot(self) -> None:
+        repository = JournalOrderRepository(self.directory)
+        service = self._fill(repository, 3, archive_after=0)
+        service.create_order()
+        revenue = service.archived_revenue
+        repository.close()
+
+        reopened = JournalOrderRepository(self.directory)
+        service = OrderService(observers=[], repository=reopened)
+        self.assertEqual(service.archived_count, 3)
+        self.assertEqual(service.archived_revenue, revenue)
+        self.assertEqual(service.get_order(1).discount_label, "постоянный")
+        self.assertEqual([order.order_id for order in service.list_active_orders()], [4])
+        reopened.close()
+
+    def test_journal_keeps_orders_until_the_service_archives_them(self) -> None:
+        repository = JournalOrderRepository(self.directory)
+        service = self._fill(repository, 3)
+        repository.snapshot()
+        self.assertEqual(len(repository.load_orders()), 3)
+        self.assertEqual(repository.load_archived(), [])
+        repository.archive([1])
+        with self.assertRaises(StorageError):
+            repository.save_order(service.get_order(1))
+        with self.assertRaises(StorageError):
+            repository.save_line(1, 1, None)
+        with self.assertRaises(StorageError):
+            repository.archive([2, 404])
+        self.assertEqual([stored.order_id for stored in repository.load_orders()], [2, 3])
+        repository.close()
+
+    def test_sealed_journal_is_replayed_after_failed_snapshot(self) -> None:
+        repository = JournalOrderRepository(self.directory)
+        service = self._fill(repository, 3)
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        os.makedirs(os.path.join(snapshot_path, "занято"))
+        with self.assertRaises(OSError):
+            repository.snapshot()
+        service.add_menu_item(1, "Эспрессо")
+        repository.close()
+        self.assertIn("journal.1.log", os.listdir(self.directory))
+        shutil.rmtree(snapshot_path)
+
+        reopened = JournalOrderRepository(self.directory)
+        service = OrderService(observers=[], repository=reopened)
+        self.assertEqual(len(service.list_orders_by_status(OrderStatus.PAID)), 3)
+        self.assertEqual(service.list_order_items(1), ["Капучино (+ Ванильный сироп)", "Эспрессо"])
+        reopened.snapshot()
+        reopened.close()
+        self.assertNotIn("journal.1.log", os.listdir(self.directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import unittest
+from core.services.order_service import OrderService
+from core.utils import OrderStateError
+
+
+class OrderLinesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = OrderService(observers=[], verify_totals=True)
+        self.order_id = self.service.create_order().order_id
+
+    def test_identical_items_merge_into_one_line(self) -> None:
+        for _ in range(200):
+            self.service.add_menu_item(self.order_id, "Латте", ["Ванильный сироп", "Шот эспрессо"])
+        self.service.add_menu_item(self.order_id, "Латте", ["Шот эспрессо", "Ванильный сироп"], quantity=5)
+        self.service.add_menu_item(self.order_id, "Латте")
+        lines = self.service.get_order_lines(self.order_id)
+        self.assertEqual([item.quantity for _, item in lines], [205, 1])
+        self.assertEqual(
+            self.service.list_order_items(self.order_id),
+            ["Латте (+ Ванильный сироп, Шот эспрессо) ×205", "Латте"],
+        )
+        self.assertEqual(self.service.calculate_total(self.order_id), 205 * 550 + 400)
+
+    def test_increment_and_decrement_by_line_id(self) -> None:
+        self.service.add_menu_item(self.order_id, "Круассан")
+        line_id = self.service.get_order_lines(self.order_id)[0][0]
+        self.assertEqual(self.service.increment_item(self.order_id, line_id, 3).quantity, 4)
+        self.assertEqual(self.service.decrement_item(self.order_id, line_id).quantity, 3)
+        self.assertIsNone(self.service.decrement_item(self.order_id, line_id, 3))
+        self.assertEqual(self.service.get_order_lines(self.order_id), [])
+        with self.assertRaises(OrderStateError):
+            self.service.increment_item(self.order_id, line_id)
+
+    def test_remove_item_takes_one_unit_from_line(self) -> None:
+        self.service.add_menu_item(self.order_id, "Эспрессо", quantity=2)
+        self.service.remove_item(self.order_id, 0)
+        self.assertEqual(self.service.get_order_items(self.order_id)[0].quantity, 1)
+        self.service.remove_item(self.order_id, 0)
+        self.assertEqual(self.service.get_order_items(self.order_id), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,7 +14,7 @@ class OrderLogicTests(unittest.TestCase):
     def test_total_with_add_ons(self) -> None:
         self.service.add_menu_item(self.order.order_id, "Капучино", ["Кокосовое молоко", "Ванильный сироп"])
         total = self.service.calculate_total(self.order.order_id)
-        self.assertAlmostEqual(total, 4.7, places=2)
+        self.assertEqual(total, 470)
 
     def test_invalid_add_on_for_dessert(self) -> None:
         with self.assertRaises(InvalidAddOnError):
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import unittest
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+from core.storage import InMemoryOrderRepository, OrderRepository, SqliteOrderRepository
+
+
+class RepositoryRoundTripMixin:
+    def make_repository(self) -> OrderRepository:
+        raise NotImplementedError
+
+    def reopen_repository(self, repository: OrderRepository) -> OrderRepository:
+        return repository
+
+    def test_service_state_survives_restart(self) -> None:
+        repository = self.make_repository()
+        service = OrderService(observers=[], repository=repository)
+        first = service.create_order().order_id
+        service.add_menu_item(first, "Латте", ["Шот эспрессо"], quantity=3)
+        service.add_menu_item(first, "Круассан")
+        service.remove_item(first, 1)
+        service.set_discount(first, 10, "постоянный")
+        service.change_order_status(first, OrderStatus.READY)
+        second = service.create_order().order_id
+        service.add_menu_item(second, "Эспрессо")
+        line_id = service.get_order_lines(second)[0][0]
+        service.increment_item(second, line_id, 2)
+
+        restored = OrderService(observers=[], repository=self.reopen_repository(repository))
+        self.assertEqual([order.order_id for order in restored.list_active_orders()], [first, second])
+        self.assertEqual(restored.get_order(first).status, OrderStatus.READY)
+        self.assertEqual(restored.list_order_items(first), ["Латте (+ Шот эспрессо) ×3"])
+        self.assertEqual(restored.calculate_total(first), 1350)
+        self.assertEqual(restored.get_order_lines(second)[0][0], line_id)
+        self.assertEqual(restored.get_order_items(second)[0].quantity, 3)
+        self.assertEqual(restored.create_order().order_id, second + 1)
+
+    def test_restored_paid_orders_archive_in_payment_order(self) -> None:
+        repository = self.make_repository()
+        service = OrderService(observers=[], repository=repository)
+        first = service.create_order()
+        second = service.create_order()
+        now = time.time()
+        for order, paid_at in ((second, now + 100), (first, now + 200)):
+            service.change_order_status(order.order_id, OrderStatus.PAID)
+            order.paid_at = paid_at
+            repository.save_order(order)
+
+        restored = OrderService(observers=[], repository=self.reopen_repository(repository), archive_after=3600)
+        self.assertEqual(restored.archive_paid_orders(now=now + 150 + 3600), 1)
+        self.assertEqual(restored.archived_count, 1)
+        self.assertEqual(restored.list_orders_by_status(OrderStatus.PAID), [restored.get_order(first.order_id)])
+
+
+class InMemoryRepositoryTests(RepositoryRoundTripMixin, unittest.TestCase):
+    def make_repository(self) -> OrderRepository:
+        return InMemoryOrderRepository()
+
+
+class SqliteRepositoryTests(RepositoryRoundTripMixin, unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "orders.db")
+        self.repositories: list[SqliteOrderRepository] = []
+
+    def tearDown(self) -> None:
+        for repository in self.repositories:
+            repository.close()
+        self._tmp.cleanup()
+
+    def make_repository(self) -> OrderRepository:
+        repository = SqliteOrderRepository(self.path, commit_interval=0.001)
+        self.repositories.append(repository)
+        return repository
+
+    def reopen_repository(self, repository: OrderRepository) -> OrderRepository:
+        repository.close()
+        return self.make_repository()
+
+
+if __name__ == "__main__":
+    unittest.main()
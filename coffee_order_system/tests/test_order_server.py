@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from core.models.order import EVENT_STATUS_CHANGED, OrderStatus
+from core.services.order_service import OrderService
+from core.utils import CoffeeOrderError, OrderNotFoundError
+from server.client import OrderClient
+from server.order_server import OrderServer
+from server.protocol import ProtocolError
+
+
+class FaultyOrderService(OrderService):
+    def calculate_total(self, order_id: int) -> int:
+        raise TypeError("сбой в сервисе")
+
+
+class OrderServerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.service = OrderService(observers=[])
+        self.server = OrderServer(self.service)
+        await self.server.start("127.0.0.1", 0)
+        host, port = self.server.sockets[0][:2]
+        self.client = await OrderClient.connect(host, port)
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.server.close()
+
+    async def test_round_trip_matches_service_state(self) -> None:
+        order = await self.client.create_order()
+        await self.client.add_menu_item(order["order_id"], "Латте", ["Ванильный сироп"])
+        await self.client.set_discount(order["order_id"], 10.0, "постоянный")
+        total = await self.client.calculate_total(order["order_id"])
+        self.assertEqual(total, self.service.calculate_total(order["order_id"]))
+        remote = await self.client.get_order(order["order_id"])
+        self.assertEqual(remote["lines"], [[1, "Латте", ["Ванильный сироп"], 1]])
+
+    async def test_pipelined_requests_resolve_in_order(self) -> None:
+        order = await self.client.create_order()
+        results = await asyncio.gather(
+            *(self.client.add_menu_item(order["order_id"], "Эспрессо") for _ in range(500))
+        )
+        self.assertEqual([line[3] for line in results], list(range(1, 501)))
+
+    async def test_lines_are_edited_by_returned_line_id(self) -> None:
+        order = await self.client.create_order()
+        order_id = order["order_id"]
+        latte = await self.client.add_menu_item(order_id, "Латте")
+        espresso = await self.client.add_menu_item(order_id, "Эспрессо")
+        self.assertEqual(latte[0], self.service.get_order_lines(order_id)[0][0])
+        self.assertEqual(await self.client.increment_item(order_id, latte[0], 2), [latte[0], "Латте", [], 3])
+        self.assertEqual(await self.client.decrement_item(order_id, latte[0]), [latte[0], "Латте", [], 2])
+        await self.client.remove_line(order_id, espresso[0])
+        self.assertEqual([line[0] for line in (await self.client.get_order(order_id))["lines"]], [latte[0]])
+        await self.client.change_order_status(order_id, OrderStatus.PREPARING)
+        preparing = await self.client.list_orders_by_status(OrderStatus.PREPARING)
+        self.assertEqual([remote["order_id"] for remote in preparing], [order_id])
+
+    async def test_errors_map_to_local_exceptions(self) -> None:
+        with self.assertRaises(OrderNotFoundError):
+            await self.client.get_order(404)
+        with self.assertRaises(ProtocolError):
+            await self.client.call("drop_tables")
+        with self.assertRaises(ProtocolError):
+            await self.client.call("get_order", order_id=1, extra=True)
+
+    async def test_arguments_are_validated_before_dispatch(self) -> None:
+        order = await self.client.create_order()
+        with self.assertRaises(ProtocolError):
+            await self.client.call("get_order", order_id=str(order["order_id"]))
+        with self.assertRaises(ProtocolError):
+            await self.client.call("change_order_status", order_id=order["order_id"], status="съеден")
+        with self.assertRaises(ProtocolError):
+            await self.client.call("add_menu_item", order_id=order["order_id"], product_name="Латте", add_on_names="Сироп")
+        self.assertEqual((await self.client.get_order(order["order_id"]))["lines"], [])
+
+    async def test_service_failures_are_not_reported_as_bad_requests(self) -> None:
+        server = OrderServer(FaultyOrderService(observers=[]))
+        await server.start("127.0.0.1", 0)
+        client = await OrderClient.connect(*server.sockets[0][:2])
+        try:
+            order = await client.create_order()
+            with self.assertRaises(CoffeeOrderError) as raised:
+                await client.calculate_total(order["order_id"])
+            self.assertNotIsInstance(raised.exception, ProtocolError)
+            self.assertIn("сбой в сервисе", str(raised.exception))
+        finally:
+            await client.close()
+            await server.close()
+
+    async def test_subscribers_receive_filtered_events(self) -> None:
+        order = await self.client.create_order()
+        await self.client.subscribe(events=[EVENT_STATUS_CHANGED])
+        await self.client.add_menu_item(order["order_id"], "Латте")
+        await self.client.change_order_status(order["order_id"], OrderStatus.PREPARING)
+        event = await asyncio.wait_for(self.client.events.get(), 1)
+        self.assertEqual(event["event"], EVENT_STATUS_CHANGED)
+        self.assertEqual(event["status"], OrderStatus.PREPARING.value)
+        self.assertTrue(self.client.events.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+import unittest
+from core.services.order_service import OrderService
+
+
+class OrderTotalsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = OrderService(observers=[], verify_totals=True)
+        self.order = self.service.create_order()
+
+    def test_total_follows_items_and_discount(self) -> None:
+        order_id = self.order.order_id
+        self.service.add_menu_item(order_id, "Латте", ["Шот эспрессо"])
+        self.service.add_menu_item(order_id, "Чизкейк")
+        self.assertEqual(self.service.calculate_total(order_id), 950)
+        self.service.set_discount(order_id, 10, "постоянный")
+        self.assertEqual(self.service.calculate_total(order_id), 855)
+        self.service.remove_item(order_id, 0)
+        self.assertEqual(self.service.calculate_total(order_id), 405)
+        self.service.remove_item(order_id, 0)
+        self.assertEqual(self.service.calculate_total(order_id), 0)
+
+    def test_random_mutations_match_full_recompute(self) -> None:
+        order_id = self.order.order_id
+        rng = random.Random(7)
+        products = ["Эспрессо", "Капучино", "Латте", "Круассан"]
+        add_ons = [add_on.get_name() for add_on in self.service.list_add_ons()]
+        for _ in range(500):
+            items = self.order.items
+            if items and rng.random() < 0.4:
+                self.service.remove_item(order_id, rng.randrange(len(items)))
+            else:
+                product = rng.choice(products)
+                extras = [] if product == "Круассан" else rng.sample(add_ons, rng.randint(0, 2))
+                self.service.add_menu_item(order_id, product, extras)
+            if rng.random() < 0.05:
+                self.service.set_discount(order_id, rng.choice([0, 10, 20, 15]), "другая")
+            self.service.calculate_total(order_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import importlib.util
+import unittest
+
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+
+HAS_QT = importlib.util.find_spec("PyQt6") is not None
+
+if HAS_QT:
+    from PyQt6 import QtCore
+
+    from gui_pyqt6.commands import ServiceCommands
+    from gui_pyqt6.models import QUANTITY_COLUMN, SUMMARY_COLUMN, ActiveOrdersModel, OrderLinesModel, ServiceEvents
+
+
+@unittest.skipUnless(HAS_QT, "PyQt6 не установлен")
+class QtModelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    def setUp(self) -> None:
+        self.service = OrderService(observers=[])
+        self.events = ServiceEvents(self.service)
+        self.active = ActiveOrdersModel(self.service, self.events)
+        self.lines = OrderLinesModel(self.service, self.events)
+        self.signals: list[tuple[str, int, int]] = []
+        for model in (self.active, self.lines):
+            model.rowsInserted.connect(lambda _parent, first, last: self.signals.append(("insert", first, last)))
+            model.rowsRemoved.connect(lambda _parent, first, last: self.signals.append(("remove", first, last)))
+            model.dataChanged.connect(lambda top, _bottom, _roles: self.signals.append(("change", top.row(), top.column())))
+            model.modelReset.connect(lambda: self.signals.append(("reset", -1, -1)))
+
+    def tearDown(self) -> None:
+        self.events.close()
+
+    def test_active_orders_follow_service_events(self) -> None:
+        first = self.service.create_order()
+        second = self.service.create_order()
+        self.assertEqual(self.signals, [("insert", 0, 0), ("insert", 1, 1)])
+        self.signals.clear()
+        self.service.change_order_status(first.order_id, OrderStatus.PREPARING)
+        self.service.change_order_status(first.order_id, OrderStatus.PAID)
+        self.assertEqual(self.signals, [("change", 0, 0), ("remove", 0, 0)])
+        self.assertEqual(self.active.order_id_at(0), second.order_id)
+        self.assertEqual(self.active.rowCount(), 1)
+
+    def test_line_changes_emit_fine_grained_signals(self) -> None:
+        order = self.service.create_order()
+        self.lines.set_order(order.order_id)
+        self.service.add_menu_item(order.order_id, "Латте")
+        self.service.add_menu_item(order.order_id, "Чизкейк")
+        self.signals.clear()
+        self.service.add_menu_item(order.order_id, "Латте")
+        self.assertEqual(self.signals, [("change", 0, QUANTITY_COLUMN)])
+        self.assertEqual(self.lines.index(0, QUANTITY_COLUMN).data(), "2")
+        self.assertIn("×2", self.lines.index(0, SUMMARY_COLUMN).data())
+        self.signals.clear()
+        self.service.remove_line(order.order_id, self.service.get_order_lines(order.order_id)[1][0])
+        self.assertEqual(self.signals, [("remove", 1, 1)])
+
+    def test_rows_map_to_line_ids(self) -> None:
+        order = self.service.create_order()
+        self.lines.set_order(order.order_id)
+        self.service.add_menu_item(order.order_id, "Латте")
+        self.service.add_menu_item(order.order_id, "Чизкейк")
+        line_ids = [line_id for line_id, _ in self.service.get_order_lines(order.order_id)]
+        self.assertEqual([self.lines.line_id_at(row) for row in range(3)], [*line_ids, None])
+
+    def test_commands_report_unexpected_errors(self) -> None:
+        commands = ServiceCommands(self.service)
+        errors: list[Exception] = []
+        order = self.service.create_order()
+        commands.submit(order.order_id, self.service.remove_item, order.order_id, 5, on_error=errors.append)
+        commands.wait()
+        QtCore.QCoreApplication.processEvents()
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], IndexError)
+
+
+if __name__ == "__main__":
+    unittest.main()
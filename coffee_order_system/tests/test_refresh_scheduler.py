@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import unittest
+from typing import Callable
+from gui.refresh_scheduler import ACTIVE_ORDERS, DETAILS, ORDER, TOTAL, RefreshScheduler
+
+
+class FakeIdleWidget:
+    def __init__(self) -> None:
+        self.callbacks: dict[str, Callable[[], None]] = {}
+        self._ids = 0
+
+    def after_idle(self, func: Callable[[], None]) -> str:
+        self._ids += 1
+        key = f"after#{self._ids}"
+        self.callbacks[key] = func
+        return key
+
+    def after_cancel(self, id: str) -> None:
+        self.callbacks.pop(id, None)
+
+    def run_idle(self) -> None:
+        callbacks, self.callbacks = self.callbacks, {}
+        for callback in callbacks.values():
+            callback()
+
+
+class RefreshSchedulerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.widget = FakeIdleWidget()
+        self.rendered: list[str] = []
+        self.scheduler = RefreshScheduler(
+            self.widget,
+            {region: (lambda region=region: self.rendered.append(region)) for region in (ACTIVE_ORDERS, ORDER, DETAILS, TOTAL)},
+        )
+
+    def test_invalidations_coalesce_into_one_render_per_region(self) -> None:
+        self.scheduler.invalidate(ORDER, DETAILS, TOTAL)
+        self.scheduler.invalidate(ORDER, TOTAL)
+        self.scheduler.invalidate(ACTIVE_ORDERS, ORDER, DETAILS)
+        self.assertEqual(len(self.widget.callbacks), 1)
+        self.widget.run_idle()
+        self.assertEqual(self.rendered, [ACTIVE_ORDERS, ORDER, DETAILS, TOTAL])
+        self.widget.run_idle()
+        self.assertEqual(len(self.rendered), 4)
+
+    def test_region_invalidated_while_rendering_is_rendered_in_same_pass(self) -> None:
+        def render_active_orders() -> None:
+            self.rendered.append(ACTIVE_ORDERS)
+            self.scheduler.invalidate(ORDER)
+
+        self.scheduler._renderers[ACTIVE_ORDERS] = render_active_orders
+        self.scheduler.invalidate(ACTIVE_ORDERS)
+        self.widget.run_idle()
+        self.assertEqual(self.rendered, [ACTIVE_ORDERS, ORDER])
+        self.assertEqual(self.widget.callbacks, {})
+
+    def test_flush_renders_immediately(self) -> None:
+        self.scheduler.invalidate(TOTAL)
+        self.scheduler.flush()
+        self.assertEqual(self.rendered, [TOTAL])
+        self.assertEqual(self.widget.callbacks, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
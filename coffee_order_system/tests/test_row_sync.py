@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import random
+import unittest
+from typing import Hashable, List, Tuple
+
+from core.utils import KeyedRows, RowChanges
+from core.utils.row_sync import Row
+
+
+class ListView:
+    def __init__(self) -> None:
+        self.rows: List[Tuple[Hashable, Row]] = []
+        self.operations = 0
+
+    def insert_row(self, index: int, key: Hashable, values: Row) -> None:
+        self.rows.insert(index, (key, values))
+        self.operations += 1
+
+    def delete_row(self, index: int, key: Hashable) -> None:
+        assert self.rows[index][0] == key
+        del self.rows[index]
+        self.operations += 1
+
+    def update_row(self, index: int, key: Hashable, values: Row, previous: Row) -> None:
+        assert self.rows[index] == (key, previous)
+        self.rows[index] = (key, values)
+        self.operations += 1
+
+    def move_row(self, old_index: int, index: int, key: Hashable, values: Row) -> None:
+        assert self.rows[old_index] == (key, values)
+        del self.rows[old_index]
+        self.rows.insert(index, (key, values))
+        self.operations += 1
+
+
+class KeyedRowsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rows = KeyedRows()
+        self.view = ListView()
+
+    def test_unchanged_rows_do_not_touch_view(self) -> None:
+        target = [(line_id, (f"Латте {line_id}", 1)) for line_id in range(500)]
+        self.rows.sync(target, self.view)
+        self.view.operations = 0
+        changes = self.rows.sync(target, self.view)
+        self.assertEqual(changes, RowChanges(0, 0, 0, 0))
+        self.assertEqual(self.view.operations, 0)
+
+    def test_only_changed_rows_are_applied(self) -> None:
+        self.rows.sync([(1, ("Латте", 1)), (2, ("Мокко", 1)), (3, ("Чизкейк", 1))], self.view)
+        changes = self.rows.sync([(1, ("Латте", 2)), (3, ("Чизкейк", 1)), (4, ("Капучино", 1))], self.view)
+        self.assertEqual(changes, RowChanges(inserted=1, removed=1, updated=1, moved=0))
+        self.assertEqual(self.view.rows, [(1, ("Латте", 2)), (3, ("Чизкейк", 1)), (4, ("Капучино", 1))])
+
+    def test_random_edits_converge_to_target(self) -> None:
+        rng = random.Random(7)
+        for _ in range(200):
+            keys = rng.sample(range(30), rng.randint(0, 20))
+            target = [(key, (rng.randint(1, 3),)) for key in keys]
+            self.rows.sync(target, self.view)
+            self.assertEqual(self.view.rows, target)
+            self.assertEqual(self.rows.keys(), tuple(keys))
+
+    def test_duplicate_keys_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.rows.sync([(1, ("Латте",)), (1, ("Мокко",))], self.view)
+
+
+if __name__ == "__main__":
+    unittest.main()
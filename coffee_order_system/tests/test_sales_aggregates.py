@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from typing import Sequence
+
+from core.analytics import SalesAggregates
+from core.models.order import Order, OrderStatus
+from core.patterns.observer.async_dispatcher import AsyncDispatcher
+from core.patterns.observer.observers import OrderEvent, OrderObserver
+from core.services.order_service import OrderService
+
+
+class BlockingObserver(OrderObserver):
+    def __init__(self) -> None:
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def update(self, order: Order, event: str) -> None:
+        pass
+
+    def update_batch(self, events: Sequence[OrderEvent]) -> None:
+        self.entered.set()
+        self.release.wait(5)
+
+
+class SalesAggregatesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sales = SalesAggregates()
+        self.service = OrderService(observers=[])
+        self.service.subscribe(self.sales)
+
+    def order(self, discount: float = 0.0, label: str = "обычный") -> int:
+        order_id = self.service.create_order().order_id
+        self.service.add_menu_item(order_id, "Латте", ["Ванильный сироп", "Шот эспрессо"], quantity=2)
+        self.service.add_menu_item(order_id, "Чизкейк")
+        if discount:
+            self.service.set_discount(order_id, discount, label)
+        return order_id
+
+    def test_counts_only_paid_orders(self) -> None:
+        first = self.order()
+        second = self.order(10, "студент")
+        self.order()
+        self.service.change_order_status(first, OrderStatus.PREPARING)
+        self.assertEqual(self.sales.orders, 0)
+        self.service.change_order_status(first, OrderStatus.PAID)
+        self.service.change_order_status(second, OrderStatus.PAID)
+
+        self.assertEqual(self.sales.orders, 2)
+        self.assertEqual(self.sales.gross_cents, 3100)
+        self.assertEqual(self.sales.revenue_cents, 2945)
+        self.assertEqual(self.sales.discount_total("студент"), 155)
+        self.assertEqual(self.sales.discount_total("обычный"), 0)
+        self.assertEqual(self.sales.product_count("Латте"), 4)
+        self.assertEqual(self.sales.product_count("Чизкейк"), 2)
+        self.assertEqual(self.sales.add_on_count("Шот эспрессо"), 4)
+        paid_at = self.service.get_order(first).paid_at
+        self.assertEqual(self.sales.orders_in_hour(int(paid_at // 3600)), 2)
+
+    def test_leaving_paid_reverts_the_order(self) -> None:
+        order_id = self.order(10, "студент")
+        self.service.change_order_status(order_id, OrderStatus.PAID)
+        self.service.add_menu_item(order_id, "Эспрессо")
+        self.service.change_order_status(order_id, OrderStatus.PREPARING)
+        report = self.sales.report()
+        self.assertEqual((report.orders, report.revenue_cents, report.discount_cents), (0, 0, 0))
+        self.assertEqual((report.products, report.add_ons, report.discounts, report.orders_per_hour), ({}, {}, {}, {}))
+
+    def test_reset_closes_the_shift(self) -> None:
+        order_id = self.order()
+        self.service.change_order_status(order_id, OrderStatus.PAID)
+        closed = self.sales.reset(now=1000.0)
+        self.assertEqual((closed.orders, closed.revenue_cents), (1, 1550))
+        self.assertEqual(closed.products, {"Латте": 2, "Чизкейк": 1})
+        self.assertEqual(self.sales.shift_started_at, 1000.0)
+        self.assertEqual(self.sales.orders, 0)
+        self.service.change_order_status(order_id, OrderStatus.READY)
+        self.assertEqual(self.sales.revenue_cents, 0)
+        self.service.change_order_status(order_id, OrderStatus.PAID)
+        self.assertEqual(self.sales.revenue_cents, 1550)
+
+    def test_deferred_delivery_uses_event_status(self) -> None:
+        dispatcher = AsyncDispatcher()
+        sales = SalesAggregates()
+        service = OrderService(observers=[], dispatcher=dispatcher)
+        service.subscribe(sales)
+        try:
+            order_id = service.create_order().order_id
+            service.add_menu_item(order_id, "Эспрессо", quantity=2)
+            service.change_order_status(order_id, OrderStatus.PAID)
+            service.change_order_status(order_id, OrderStatus.PREPARING)
+            service.change_order_status(order_id, OrderStatus.PAID)
+            dispatcher.flush()
+        finally:
+            dispatcher.shutdown()
+        self.assertEqual((sales.orders, sales.revenue_cents), (1, 500))
+
+    def test_counts_the_order_as_published_while_the_dispatcher_lags(self) -> None:
+        dispatcher = AsyncDispatcher()
+        blocker = BlockingObserver()
+        sales = SalesAggregates()
+        service = OrderService(observers=[blocker], dispatcher=dispatcher)
+        service.subscribe(sales)
+        try:
+            order_id = service.create_order().order_id
+            self.assertTrue(blocker.entered.wait(5))
+            service.add_menu_item(order_id, "Эспрессо", quantity=2)
+            service.change_order_status(order_id, OrderStatus.PAID)
+            closed = sales.reset()
+            service.change_order_status(order_id, OrderStatus.PREPARING)
+            service.add_menu_item(order_id, "Эспрессо")
+            blocker.release.set()
+            dispatcher.flush()
+        finally:
+            blocker.release.set()
+            dispatcher.shutdown()
+        self.assertEqual((closed.orders, closed.revenue_cents), (1, 500))
+        self.assertEqual((sales.orders, sales.revenue_cents), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
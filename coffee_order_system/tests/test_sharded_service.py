@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import unittest
+
+from core.models.order import OrderStatus
+from core.services.sharded_order_service import ShardedOrderService, _portable, shard_of
+from core.utils import CoffeeOrderError, OrderNotFoundError, OrderStateError
+
+
+class ShardedOrderServiceTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.service = ShardedOrderService(shards=3, block_size=4)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.service.close()
+
+    def test_ids_are_allocated_in_disjoint_blocks(self) -> None:
+        orders = [self.service.create_order() for _ in range(30)]
+        ids = [order.order_id for order in orders]
+        self.assertEqual(len(set(ids)), len(ids))
+        for order_id in ids:
+            self.assertEqual(self.service.get_order(order_id).order_id, order_id)
+        self.assertEqual({shard_of(order_id, 3, 4) for order_id in ids}, {0, 1, 2})
+
+    def test_calls_route_to_owning_shard(self) -> None:
+        order = self.service.create_order()
+        self.service.add_menu_item(order.order_id, "Латте", ["Ванильный сироп"])
+        self.service.add_menu_item(order.order_id, "Латте", ["Ванильный сироп"])
+        self.service.set_discount(order.order_id, 10.0, "постоянный")
+        self.assertEqual(self.service.calculate_total(order.order_id), 810)
+        self.assertEqual(self.service.list_order_items(order.order_id), ["Латте (+ Ванильный сироп) ×2"])
+        with self.assertRaises(OrderStateError):
+            self.service.set_discount(order.order_id, 150.0, "ошибка")
+        with self.assertRaises(OrderNotFoundError):
+            self.service.get_order(10_000)
+
+    def test_active_orders_are_gathered_from_all_shards(self) -> None:
+        created = [self.service.create_order().order_id for _ in range(6)]
+        self.service.change_order_status(created[0], OrderStatus.PAID)
+        active = [order.order_id for order in self.service.list_active_orders()]
+        self.assertEqual(active, sorted(active))
+        self.assertNotIn(created[0], active)
+        self.assertTrue(set(created[1:]) <= set(active))
+        paid = [order.order_id for order in self.service.list_orders_by_status(OrderStatus.PAID)]
+        self.assertIn(created[0], paid)
+
+    def test_call_many_returns_results_in_call_order(self) -> None:
+        ids = [self.service.create_order().order_id for _ in range(5)]
+        calls = [(order_id, "calculate_total", ()) for order_id in ids]
+        results = self.service.call_many(calls + [(999_999, "get_order", ())])
+        self.assertEqual(results[:5], [0] * 5)
+        self.assertIsInstance(results[5], OrderNotFoundError)
+
+    def test_shard_keeps_serving_after_a_bad_call(self) -> None:
+        order = self.service.create_order()
+        with self.assertRaises(IndexError):
+            self.service.remove_item(order.order_id, 5)
+        self.service.add_menu_item(order.order_id, "Эспрессо")
+        self.assertEqual(self.service.calculate_total(order.order_id), 250)
+
+    def test_unpicklable_errors_are_replaced(self) -> None:
+        class LocalError(Exception):
+            pass
+
+        error = _portable(LocalError("сбой"))
+        self.assertIsInstance(error, CoffeeOrderError)
+        self.assertIn("LocalError: сбой", str(error))
+        self.assertIsInstance(_portable(IndexError("x")), IndexError)
+
+
+if __name__ == "__main__":
+    unittest.main()
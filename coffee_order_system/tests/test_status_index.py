@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import unittest
+from core.models.order import OrderStatus
+from core.services.order_service import OrderService
+
+
+class StatusIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = OrderService(observers=[])
+        self.orders = [self.service.create_order() for _ in range(4)]
+
+    def test_paid_orders_leave_active_list(self) -> None:
+        self.service.change_order_status(self.orders[1].order_id, OrderStatus.PAID)
+        active_ids = [order.order_id for order in self.service.list_active_orders()]
+        self.assertEqual(active_ids, [1, 3, 4])
+
+    def test_list_orders_by_status(self) -> None:
+        self.service.change_order_status(self.orders[3].order_id, OrderStatus.READY)
+        self.service.change_order_status(self.orders[0].order_id, OrderStatus.READY)
+        ready_ids = [order.order_id for order in self.service.list_orders_by_status(OrderStatus.READY)]
+        self.assertEqual(ready_ids, [1, 4])
+        created_ids = [order.order_id for order in self.service.list_orders_by_status(OrderStatus.CREATED)]
+        self.assertEqual(created_ids, [2, 3])
+
+    def test_direct_set_status_updates_index(self) -> None:
+        self.orders[2].set_status(OrderStatus.PAID)
+        self.assertEqual(len(self.service.list_orders_by_status(OrderStatus.PAID)), 1)
+        self.assertNotIn(self.orders[2], self.service.list_active_orders())
+
+
+if __name__ == "__main__":
+    unittest.main()